@@ -129,6 +129,7 @@ def run_setup():
         entry_points={
             "console_scripts": [
                 "sql_generator=sql_generator.ui.main_app:run_app",
+                "sql_generator_cli=sql_generator.cli:main",
             ],
         },
         python_requires='>=3.8',
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""
+支持以 python -m sql_generator 运行命令行工具
+"""
+
+import sys
+
+from sql_generator.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,435 @@
+# -*- coding: utf-8 -*-
+"""
+命令行入口 - 不启动Streamlit，直接调用SQLGenerator批量生成SQL并流式写出
+
+用法示例:
+    python -m sql_generator generate --sheet insert --mode batched input.xlsx -o out.sql
+    python -m sql_generator generate --sheet all input.xlsx > all.sql
+    python -m sql_generator generate --sheet all --state run.json --delta-only \\
+        input.xlsx -o delta.sql
+    python -m sql_generator generate --sheet insert --mode parameterized \\
+        input.xlsx -o params_dir
+    python -m sql_generator sandbox input.xlsx
+    python -m sql_generator explain input.xlsx --sql queries.sql
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from sql_generator.config.constants import BULK_CONFIG, EXCEL_SHEETS
+from sql_generator.core.bulk_engine import UPSERT_DIALECTS
+from sql_generator.core.dedupe import DEDUPE_MODES
+from sql_generator.core.incremental import IncrementalGenerator
+from sql_generator.core.parallel import SHEET_ORDER
+from sql_generator.core.parameterized import PARAM_FORMATS, PARAM_STYLES
+from sql_generator.core.sql_generator import SQLGenerator
+from sql_generator.utils.diagnostics import Diagnostics
+from sql_generator.utils.file_utils import FileHandler
+
+# 生成模式：row 每行一条语句；batched 按表合并为多行/基于集合的语句；
+# parameterized 每个(表, 列集合)一条带占位符的INSERT语句加参数文件
+MODES = ["row", "batched", "parameterized"]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    构建命令行参数解析器
+
+    Returns:
+        参数解析器
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m sql_generator", description="批量SQL生成命令行工具"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="由Excel/CSV/Parquet/Arrow文件生成SQL语句")
+    generate.add_argument("input", help="输入文件路径")
+    generate.add_argument(
+        "--sheet",
+        required=True,
+        choices=list(EXCEL_SHEETS) + ["upsert", "all"],
+        help="生成的语句类型（工作表），upsert由merge（或--upsert-sheet指定的）工作表生成"
+        "原生UPSERT语句，all表示工作簿中的全部工作表",
+    )
+    generate.add_argument(
+        "--mode",
+        choices=MODES,
+        default="row",
+        help="row: 每行一条语句；batched: 多行INSERT、基于集合的MERGE/UPDATE/DELETE；"
+        "parameterized: 参数化INSERT语句和参数文件（仅insert，-o 为输出目录）",
+    )
+    generate.add_argument("-o", "--output", default="-", help="输出文件路径，默认为标准输出")
+    generate.add_argument(
+        "--paramstyle",
+        choices=PARAM_STYLES,
+        default="qmark",
+        help="parameterized模式的占位符风格：qmark 为 ?，format 为 %%s，dollar 为 $1",
+    )
+    generate.add_argument(
+        "--param-format",
+        choices=list(PARAM_FORMATS),
+        default="csv",
+        help="parameterized模式的参数文件格式",
+    )
+    generate.add_argument(
+        "--batch-size",
+        type=int,
+        default=BULK_CONFIG["batch_size"],
+        help="batched模式下每条语句最多包含的行数",
+    )
+    generate.add_argument(
+        "--max-statement-bytes",
+        type=int,
+        default=BULK_CONFIG["max_statement_bytes"],
+        help="多行INSERT每条语句的最大字节数",
+    )
+    generate.add_argument(
+        "--chunk-size",
+        type=int,
+        default=BULK_CONFIG["chunk_size"],
+        help="INSERT流式读取时每块的行数",
+    )
+    generate.add_argument(
+        "--workers", type=int, default=BULK_CONFIG["workers"], help="SELECT按行分块并行生成的进程数"
+    )
+    generate.add_argument(
+        "--dialect",
+        choices=UPSERT_DIALECTS,
+        default="postgresql",
+        help="upsert的目标数据库方言",
+    )
+    generate.add_argument("--keys", help="upsert的主键列（逗号分隔），默认使用工作表中的uniqueid列")
+    generate.add_argument(
+        "--upsert-sheet",
+        choices=["merge", "insert"],
+        default="merge",
+        help="upsert的数据来源工作表，insert工作表需要同时指定 --keys",
+    )
+    generate.add_argument(
+        "--state", help="增量生成的状态文件（JSON）：只重新生成与上次运行相比变更或新增的行" "（逐行生成，只能与row模式同时使用）"
+    )
+    generate.add_argument(
+        "--dedupe",
+        choices=DEDUPE_MODES,
+        help="删除同一表中完全重复的行：first/last 保留第一行/最后一行，fail 存在重复行时报错；"
+        "适用于insert、update、merge、delete和upsert（insert使用last时整表读取）",
+    )
+    generate.add_argument("--delta-only", action="store_true", help="增量生成时只输出变更和新增行的语句")
+
+    sandbox = commands.add_parser("sandbox", help="在临时SQLite数据库中试运行工作簿生成的语句，报告执行吞吐量")
+    sandbox.add_argument("input", help="包含create工作表的Excel工作簿路径")
+    sandbox.add_argument(
+        "--rows-per-statement",
+        type=int,
+        default=BULK_CONFIG["batch_size"],
+        help="多行INSERT和UPSERT每条语句的行数",
+    )
+    sandbox.add_argument(
+        "--batch-size",
+        type=int,
+        default=BULK_CONFIG["batch_size"],
+        help="UPDATE/DELETE每条语句的行数，以及executemany每批的参数行数",
+    )
+    sandbox.add_argument(
+        "--max-statement-bytes",
+        type=int,
+        default=BULK_CONFIG["max_statement_bytes"],
+        help="多行语句的最大字节数",
+    )
+
+    explain = commands.add_parser("explain", help="在内存SQLite数据库中分析SELECT语句的执行计划")
+    explain.add_argument("input", help="包含create工作表（可选index工作表）的Excel工作簿路径")
+    explain.add_argument("--sql", help="包含要分析的SELECT语句的SQL文件，默认分析select工作表生成的语句")
+    explain.add_argument("--indexes", help="包含额外CREATE INDEX语句的SQL文件")
+    return parser
+
+
+def sheet_statements(
+    generator: SQLGenerator, sheet: str, input_path: str, args: argparse.Namespace
+) -> Tuple[Iterable[str], Diagnostics]:
+    """
+    按语句类型和生成模式调用对应的SQLGenerator方法
+
+    INSERT流式生成（逐块读取、逐条产出；去重保留最后一行时需要整表读取），其余类型一次生成全部语句。
+
+    Args:
+        generator: SQL生成器
+        sheet: 语句类型
+        input_path: 输入文件路径
+        args: 命令行参数
+
+    Returns:
+        (语句迭代器, 诊断信息)；INSERT的诊断信息在迭代完成后才完整
+    """
+    batched = args.mode == "batched"
+    if sheet == "insert" and args.dedupe != "last":
+        diagnostics = Diagnostics()
+        statements = generator.iter_insert(
+            input_path,
+            chunk_size=args.chunk_size,
+            rows_per_statement=args.batch_size if batched else 1,
+            max_statement_bytes=args.max_statement_bytes,
+            diagnostics=diagnostics,
+            dedupe=args.dedupe,
+        )
+        return statements, diagnostics
+
+    options: Dict[str, Any] = {}
+    if sheet in ("insert", "update", "merge", "delete", "upsert"):
+        options["dedupe"] = args.dedupe
+    if sheet == "insert":
+        options.update(
+            rows_per_statement=args.batch_size if batched else 1,
+            max_statement_bytes=args.max_statement_bytes,
+            workers=args.workers,
+        )
+    elif sheet == "select":
+        options["workers"] = args.workers
+    elif sheet == "merge":
+        options.update(
+            set_based=batched, batch_size=args.batch_size if batched else None
+        )
+    elif sheet in ("update", "delete"):
+        options["batch_size"] = args.batch_size if batched else 1
+    elif sheet == "upsert":
+        options.update(
+            dialect=args.dialect,
+            sheet=args.upsert_sheet,
+            keys=[key.strip() for key in args.keys.split(",")] if args.keys else None,
+            rows_per_statement=args.batch_size if batched else 1,
+            max_statement_bytes=args.max_statement_bytes,
+        )
+    statements = getattr(generator, f"bulk_{sheet}")(input_path, **options)
+    return statements, statements.diagnostics
+
+
+def resolve_sheets(sheet: str, input_path: str) -> List[str]:
+    """将 --sheet all 展开为工作簿中存在的工作表类型（按SHEET_ORDER排列）"""
+    if sheet != "all":
+        return [sheet]
+    if FileHandler.detect_format(input_path) != "excel":
+        raise ValueError("CSV/Parquet/Arrow文件只包含一张表，需要用 --sheet 指定语句类型")
+    available = set(FileHandler.get_sheet_names(input_path))
+    return [name for name in SHEET_ORDER if EXCEL_SHEETS[name] in available]
+
+
+def report(sheet: str, count: int, diagnostics: Diagnostics, seconds: float):
+    """将诊断信息、行数、语句数和耗时输出到标准错误"""
+    for entry in diagnostics:
+        print(f"[{entry['level']}] {sheet}: {entry['message']}", file=sys.stderr)
+    print(
+        f"{sheet}: 读取 {diagnostics.rows} 行，生成 {count} 条语句，"
+        f"{len(diagnostics.errors)} 个错误，耗时 {seconds:.3f}s",
+        file=sys.stderr,
+    )
+
+
+def run_incremental(args: argparse.Namespace, output: BinaryIO) -> int:
+    """
+    执行增量生成：从状态文件恢复上次的行哈希和语句，生成后写回状态文件
+
+    Args:
+        args: 命令行参数
+        output: 输出的二进制流
+
+    Returns:
+        退出码，有错误时为1
+    """
+    if os.path.exists(args.state):
+        generator = IncrementalGenerator.load(args.state, use_cache=False)
+    else:
+        generator = IncrementalGenerator(use_cache=False)
+    exit_code = 0
+    for sheet in resolve_sheets(args.sheet, args.input):
+        start = time.perf_counter()
+        result = generator.generate(args.input, sheet)
+        statements = result["delta"] if args.delta_only else result["statements"]
+        count = FileHandler.write_sql_stream(statements, output)
+        output.flush()
+        report(sheet, count, statements.diagnostics, time.perf_counter() - start)
+        print(
+            f"{sheet}: 重新生成 {result['changed_rows']} 行，复用 {result['reused_rows']} 行，"
+            f"删除 {result['removed_rows']} 行",
+            file=sys.stderr,
+        )
+        if statements.diagnostics.errors:
+            exit_code = 1
+    generator.save(args.state)
+    return exit_code
+
+
+def run_parameterized(args: argparse.Namespace) -> int:
+    """
+    执行参数化导出：语句脚本、清单和参数文件写入 -o 指定的目录
+
+    Args:
+        args: 命令行参数
+
+    Returns:
+        退出码，有错误时为1
+    """
+    os.makedirs(args.output, exist_ok=True)
+    start = time.perf_counter()
+    result = SQLGenerator(use_cache=False).export_parameterized(
+        args.input,
+        args.output,
+        args.paramstyle,
+        args.param_format,
+        args.chunk_size,
+        dedupe=args.dedupe,
+    )
+    diagnostics = result["diagnostics"]
+    report(
+        "insert",
+        len(result["parameter_files"]),
+        diagnostics,
+        time.perf_counter() - start,
+    )
+    print(
+        f"insert: {result['row_count']} 行参数写入 {len(result['parameter_files'])} 个参数文件，"
+        f"清单 {result['manifest']}",
+        file=sys.stderr,
+    )
+    return 1 if diagnostics.errors else 0
+
+
+def run_generate(args: argparse.Namespace, output: BinaryIO) -> int:
+    """
+    执行 generate 命令
+
+    Args:
+        args: 命令行参数
+        output: 输出的二进制流
+
+    Returns:
+        退出码，有错误时为1
+    """
+    generator = SQLGenerator(use_cache=False)
+    exit_code = 0
+    for sheet in resolve_sheets(args.sheet, args.input):
+        start = time.perf_counter()
+        statements, diagnostics = sheet_statements(generator, sheet, args.input, args)
+        count = FileHandler.write_sql_stream(statements, output)
+        output.flush()
+        report(sheet, count, diagnostics, time.perf_counter() - start)
+        if diagnostics.errors:
+            exit_code = 1
+    return exit_code
+
+
+def run_sandbox(args: argparse.Namespace) -> int:
+    """
+    执行 sandbox 命令：试运行结果以表格输出到标准输出，诊断信息输出到标准错误
+
+    Args:
+        args: 命令行参数
+
+    Returns:
+        退出码，有错误时为1
+    """
+    result = SQLGenerator(use_cache=False).sandbox_benchmark(
+        args.input, args.rows_per_statement, args.batch_size, args.max_statement_bytes
+    )
+    diagnostics = result["diagnostics"]
+    for entry in diagnostics:
+        print(f"[{entry['level']}] {entry['message']}", file=sys.stderr)
+    print(f"创建 {result['tables']} 个表")
+    print(
+        f"{'方式':<20}{'语句数':>10}{'行数':>10}{'失败':>6}{'耗时(秒)':>12}{'语句/秒':>12}{'行/秒':>12}"
+    )
+    for run in result["runs"]:
+        print(
+            f"{run['mode']:<20}{run['statements']:>10}{run['rows']:>10}{run['failed']:>6}"
+            f"{run['seconds']:>12.4f}{run['statements_per_second']:>12.0f}{run['rows_per_second']:>12.0f}"
+        )
+    return 1 if diagnostics.errors else 0
+
+
+def run_explain(args: argparse.Namespace) -> int:
+    """
+    执行 explain 命令：每条语句的执行计划和问题输出到标准输出，诊断信息输出到标准错误
+
+    Args:
+        args: 命令行参数
+
+    Returns:
+        退出码，有错误或存在被标记的语句时为1
+    """
+    texts = []
+    for path in (args.sql, args.indexes):
+        if path:
+            with open(path, encoding="utf-8") as file:
+                texts.append(file.read())
+        else:
+            texts.append(None)
+    result = SQLGenerator(use_cache=False).explain_select_plans(args.input, *texts)
+    diagnostics = result["diagnostics"]
+    for entry in diagnostics:
+        print(f"[{entry['level']}] {entry['message']}", file=sys.stderr)
+    flagged = 0
+    for plan in result["plans"]:
+        if plan["error"]:
+            continue
+        flagged += bool(plan["issues"])
+        print(plan["statement"])
+        for detail in plan["plan"]:
+            print(f"    {detail}")
+        for issue in plan["issues"]:
+            print(f"  ! {issue['message']}: {issue['detail']}")
+    print(f"共分析 {len(result['plans'])} 条语句，{flagged} 条存在问题")
+    return 1 if diagnostics.errors or flagged else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    命令行主函数
+
+    Args:
+        argv: 命令行参数，默认为 sys.argv[1:]
+
+    Returns:
+        退出码
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "sandbox":
+        try:
+            return run_sandbox(args)
+        except (OSError, ValueError) as e:
+            print(f"错误: {e}", file=sys.stderr)
+            return 2
+    if args.command == "explain":
+        try:
+            return run_explain(args)
+        except (OSError, ValueError) as e:
+            print(f"错误: {e}", file=sys.stderr)
+            return 2
+    if args.state and args.mode != "row":
+        parser.error(f"--state 增量生成逐行生成语句，不能与 --mode {args.mode} 同时使用")
+    if args.state and args.sheet == "upsert":
+        parser.error("--state 增量生成不支持 upsert")
+    if args.state and args.dedupe:
+        parser.error("--state 增量生成不支持 --dedupe")
+    if args.delta_only and not args.state:
+        parser.error("--delta-only 需要同时指定 --state")
+    if args.mode == "parameterized" and (args.sheet != "insert" or args.output == "-"):
+        parser.error("--mode parameterized 只支持 --sheet insert，且需要用 -o 指定输出目录")
+    run = run_incremental if args.state else run_generate
+    start = time.perf_counter()
+    try:
+        if args.mode == "parameterized":
+            exit_code = run_parameterized(args)
+        elif args.output == "-":
+            exit_code = run(args, sys.stdout.buffer)
+        else:
+            with open(args.output, "wb") as output:
+                exit_code = run(args, output)
+    except (OSError, ValueError) as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 2
+    print(f"总耗时 {time.perf_counter() - start:.3f}s", file=sys.stderr)
+    return exit_code
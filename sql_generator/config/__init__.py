@@ -1,21 +1,24 @@
-# -*- coding: utf-8 -*-
-"""
-Streamlit SQL生成工具配置模块
-"""
-
-from sql_generator.config.constants import *
-
-__all__ = [
-    'EXCEL_SHEETS', 
-    'MIME_TYPES', 
-    'SUPPORTED_FILE_TYPES', 
-    'APP_CONFIG',
-    'SECURITY_CONFIG',
-    'MAIN_PAGES',
-    'SQL_SUB_PAGES',
-    'ADVANCED_SUB_PAGES',
-    'TEMPLATE_SUB_PAGES',
-    'HISTORY_SUB_PAGES',
-    'ANALYSIS_SUB_PAGES',
-    'EXAMPLE_SUB_PAGES'
-]
+# -*- coding: utf-8 -*-
+"""
+Streamlit SQL生成工具配置模块
+"""
+
+from sql_generator.config.constants import *
+
+__all__ = [
+    'EXCEL_SHEETS', 
+    'MIME_TYPES', 
+    'SUPPORTED_FILE_TYPES', 
+    'TABLE_FILE_TYPES',
+    'SHEET_COLUMNS',
+    'BULK_CONFIG',
+    'APP_CONFIG',
+    'SECURITY_CONFIG',
+    'MAIN_PAGES',
+    'SQL_SUB_PAGES',
+    'ADVANCED_SUB_PAGES',
+    'TEMPLATE_SUB_PAGES',
+    'HISTORY_SUB_PAGES',
+    'ANALYSIS_SUB_PAGES',
+    'EXAMPLE_SUB_PAGES'
+]
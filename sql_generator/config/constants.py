@@ -1,59 +1,99 @@
-# -*- coding: utf-8 -*-
-"""
-配置常量模块
-"""
-
-# 页面配置
-MAIN_PAGES = ["SQL生成", "高级功能", "模板中心", "历史记录", "数据分析", "streamlit_example"]
-
-SQL_SUB_PAGES = ["主页", "CREATE", "SELECT", "INSERT", "UPDATE", "MERGE", "DELETE", "TRUNCATE"]
-
-ADVANCED_SUB_PAGES = ["视图管理", "索引优化", "存储过程", "触发器", "函数管理", "约束管理"]
-
-TEMPLATE_SUB_PAGES = ["基础查询", "数据操作", "表结构", "性能优化", "数据分析", "自定义模板"]
-
-HISTORY_SUB_PAGES = ["最近记录", "收藏夹", "搜索历史", "使用统计", "导出数据"]
-
-ANALYSIS_SUB_PAGES = ["数据概况", "SQL格式化", "语法检查"]
-
-EXAMPLE_SUB_PAGES = ["主页", "button", "write", "slider", "line_chart", "selectbox"]
-
-# Excel配置
-EXCEL_SHEETS = {
-    'select': 'select',
-    'create': 'create',
-    'insert': 'insert',
-    'merge': 'merge',
-    'delete': 'delete',
-    'truncate': 'truncate'
-}
-
-# MIME类型
-MIME_TYPES = {
-    'sql': 'text/plain',
-    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-    'csv': 'text/csv',
-    'json': 'application/json',
-    'txt': 'text/plain'
-}
-
-# 支持的文件类型
-SUPPORTED_FILE_TYPES = ['xlsx', 'csv', 'sql']
-
-# 应用配置
-APP_CONFIG = {
-    'page_title': 'SQL生成工具',
-    'page_icon': '🔧',
-    'layout': 'wide',
-    'initial_sidebar_state': 'expanded'
-}
-
-# 安全配置
-SECURITY_CONFIG = {
-    'max_file_size_mb': 5,
-    'allowed_file_types': ['xlsx', 'csv', 'sql'],
-    'sql_blacklist': [
-        'DROP', 'TRUNCATE', 'DELETE', 'UPDATE', 'ALTER', 'INSERT', 
-        'GRANT', 'REVOKE', 'COMMIT', 'ROLLBACK', 'EXECUTE'
-    ]
-}
+# -*- coding: utf-8 -*-
+"""
+配置常量模块
+"""
+
+# 页面配置
+MAIN_PAGES = ["SQL生成", "高级功能", "模板中心", "历史记录", "数据分析", "streamlit_example"]
+
+SQL_SUB_PAGES = ["主页", "CREATE", "SELECT", "INSERT", "UPDATE", "MERGE", "DELETE", "TRUNCATE"]
+
+ADVANCED_SUB_PAGES = ["视图管理", "索引优化", "存储过程", "触发器", "函数管理", "约束管理"]
+
+TEMPLATE_SUB_PAGES = ["基础查询", "数据操作", "表结构", "性能优化", "数据分析", "自定义模板"]
+
+HISTORY_SUB_PAGES = ["最近记录", "收藏夹", "搜索历史", "使用统计", "导出数据"]
+
+ANALYSIS_SUB_PAGES = ["数据概况", "SQL格式化", "语法检查", "执行计划"]
+
+EXAMPLE_SUB_PAGES = ["主页", "button", "write", "slider", "line_chart", "selectbox"]
+
+# Excel配置
+EXCEL_SHEETS = {
+    'select': 'select',
+    'create': 'create',
+    'insert': 'insert',
+    'update': 'update',
+    'merge': 'merge',
+    'delete': 'delete',
+    'truncate': 'truncate'
+}
+
+# MIME类型
+MIME_TYPES = {
+    'sql': 'text/plain',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'csv': 'text/csv',
+    'json': 'application/json',
+    'zip': 'application/zip',
+    'txt': 'text/plain'
+}
+
+# 支持的文件类型
+SUPPORTED_FILE_TYPES = ['xlsx', 'csv', 'sql', 'parquet', 'arrow', 'feather']
+
+# 批量生成可读取的数据文件类型（CSV/Parquet/Arrow文件只包含一张表，即所调用生成器对应工作表的数据）
+TABLE_FILE_TYPES = ['xlsx', 'csv', 'parquet', 'arrow', 'feather']
+
+# 重复行的处理方式（页面选项 -> SQLGenerator的dedupe参数）
+DEDUPE_OPTIONS = {
+    '不去重': None,
+    '删除重复行（保留第一行）': 'first',
+    '删除重复行（保留最后一行）': 'last',
+    '存在重复行时报错': 'fail'
+}
+
+# 各生成器读取的列（按工作表格式依次匹配，全部存在时只读取这些列，否则读取全部列并按位置解析）
+SHEET_COLUMNS = {
+    'select': [['table', 'column']],
+    'insert': [['table', 'column', 'values']],
+    'update': [['table', 'column', 'uniqueid', 'values']],
+    'merge': [['target_table', 'target_column', 'uniqueid', 'source_table', 'source_column'],
+              ['target_table', 'target_column', 'uniqueid', 'values']],
+    'delete': [['table', 'column', 'del_column', 'values'],
+               ['table', 'column', 'del_column', 'tmp_table']],
+    'truncate': [['target_table', 'target_column', 'source_table', 'source_column']]
+}
+
+# 批量生成配置
+BULK_CONFIG = {
+    'chunk_size': 10000,  # 流式生成时每次读取的行数
+    'rows_per_statement': 1,  # 多行INSERT每条语句的行数
+    'max_statement_bytes': 1024 * 1024,  # 每条语句的最大字节数（需小于max_allowed_packet等服务端限制）
+    'workbook_cache_size': 8,  # 按内容哈希缓存的已解析工作簿数量
+    'batch_size': 1000,  # 基于集合的UPDATE/DELETE每条语句的行数
+    'workers': 1,  # 单个工作表按行分块并行生成的进程数
+    'job_workers': 2,  # 同时运行的后台生成任务数
+    'spill_threshold_bytes': 64 * 1024 * 1024,  # 生成的脚本超过该大小后溢出到临时文件
+    'preview_bytes': 256 * 1024,  # 页面上预览的脚本字节数
+    'format_cache_bytes': 16 * 1024 * 1024,  # 增量生成时缓存的格式化语句的最大字节数
+    'sandbox_pool_size': 2  # SQLite试运行的连接池大小
+}
+
+# 应用配置
+APP_CONFIG = {
+    'page_title': 'SQL生成工具',
+    'page_icon': '🔧',
+    'layout': 'wide',
+    'initial_sidebar_state': 'expanded'
+}
+
+# 安全配置
+SECURITY_CONFIG = {
+    'max_file_size_mb': 5,
+    'allowed_file_types': ['xlsx', 'csv', 'sql'],
+    'sql_blacklist': [
+        'DROP', 'TRUNCATE', 'DELETE', 'UPDATE', 'ALTER', 'INSERT', 
+        'GRANT', 'REVOKE', 'COMMIT', 'ROLLBACK', 'EXECUTE'
+    ]
+}
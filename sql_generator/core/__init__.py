@@ -1,4 +1,4 @@
-# -*- coding: utf-8 -*-
-"""
-SQL生成器核心功能模块初始化
-"""
+# -*- coding: utf-8 -*-
+"""
+SQL生成器核心功能模块初始化
+"""
@@ -0,0 +1,1172 @@
+# -*- coding: utf-8 -*-
+"""
+批量SQL构建引擎 - 以列为单位（向量化）生成SQL语句，替代逐行的iterrows循环
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from sql_generator.core.literals import SQLLiteralRenderer
+
+# 逗号分隔列表中的分隔符（允许两侧有空白）
+_LIST_SEPARATOR = r"\s*,\s*"
+
+# 支持原生UPSERT语句的方言
+UPSERT_DIALECTS = ["postgresql", "sqlite", "mysql"]
+
+# 数据行格式工作表的 表名、列名列表、主键列表、值列表 列名
+_KEYED_COLUMNS = {
+    "update": ["table", "column", "uniqueid", "values"],
+    "merge": ["target_table", "target_column", "uniqueid", "values"],
+    "delete": ["table", "column", "del_column", "values"],
+}
+
+# 值类型映射：(表名, 规范化后的列名列表) -> 各列的SQL类型
+ValueTypes = Dict[Tuple[str, str], List[str]]
+
+# create工作表长表格式（每行一个字段）的列名：角色 -> 可接受的列名（不区分大小写）
+_LONG_CREATE_COLUMNS = {
+    "schema": ["domain", "schema"],
+    "table": ["table", "table_name", "tablename"],
+    "column": ["column", "column_name", "columnname"],
+    "type": ["data_type", "datatype", "type"],
+}
+
+
+class BulkSQLEngine:
+    """向量化SQL语句构建引擎"""
+
+    @staticmethod
+    def normalize_list(series: pd.Series) -> pd.Series:
+        """
+        将逗号分隔的列表列规范化为 "a, b, c" 形式
+
+        Args:
+            series: 字符串列
+
+        Returns:
+            规范化后的字符串列
+        """
+        return (
+            series.astype(str)
+            .str.strip()
+            .str.replace(_LIST_SEPARATOR, ", ", regex=True)
+        )
+
+    @staticmethod
+    def typed_literals(
+        values: pd.Series,
+        dialect: str = "ansi",
+        tables: Optional[pd.Series] = None,
+        columns: Optional[str] = None,
+        types: Optional[ValueTypes] = None,
+    ) -> pd.DataFrame:
+        """
+        将列名列表相同的各行逗号分隔值列表按列拆分，并渲染为带类型的字面量
+
+        每列只推断一次类型（给出tables时每个表分别推断），如 "1, a" 和 "2, b" ->
+        第1列 1、2，第2列 'a'、'b'。给出types时，各表的类型取types中(表名, columns)对应的类型
+        与本批值推断出的类型合并后的类型，分块生成时各块的字面量写法因此一致。
+
+        Args:
+            values: 值列表列（各行值数量相同）
+            dialect: 目标数据库方言
+            tables: 与values索引相同的表名列，可选
+            columns: 规范化后的列名列表，给出types时使用
+            types: 整张工作表的值类型（见 value_types），可选
+
+        Returns:
+            以位置为列名的字面量DataFrame，索引与输入相同
+        """
+        # 按普通逗号拆分，各值两侧的空白由渲染时统一去除
+        frame = values.astype(str).str.split(",", expand=True, regex=False)
+        known = None
+        if types and tables is not None:
+            table_types = {
+                table: types[(table, columns)]
+                for table in tables.unique()
+                if len(types.get((table, columns), ())) == frame.shape[1]
+            }
+            if table_types:
+                known = pd.DataFrame(
+                    {
+                        position: tables.map(
+                            {
+                                table: column_types[position]
+                                for table, column_types in table_types.items()
+                            }
+                        )
+                        for position in frame.columns
+                    },
+                    index=frame.index,
+                )
+        return SQLLiteralRenderer.render_frame(frame, dialect, tables, known)
+
+    @staticmethod
+    def _typed_value_lists(
+        values: pd.Series,
+        tables: pd.Series,
+        columns: pd.Series,
+        dialect: str,
+        types: Optional[ValueTypes] = None,
+    ) -> pd.Series:
+        """
+        渲染每行的值列表，如 "1, 'a'"；同一(表名, 列名列表)下每列的类型一致
+
+        列名列表相同的行一起拆分，类型按表分别推断，避免逐表重复拆分和匹配。
+
+        Args:
+            values: 值列表列
+            tables: 表名列
+            columns: 规范化后的列名列表列
+            dialect: 目标数据库方言
+            types: 整张工作表的值类型，可选
+
+        Returns:
+            与输入索引相同的字面量列表列
+        """
+        if values.empty:
+            return pd.Series([], index=values.index, dtype=object)
+        rendered = [
+            BulkSQLEngine._join_literals(
+                BulkSQLEngine.typed_literals(
+                    group, dialect, tables[group.index], column_list, types
+                )
+            )
+            for column_list, group in values.groupby(columns, sort=False)
+        ]
+        return pd.concat(rendered).reindex(values.index)
+
+    @staticmethod
+    def value_types(df: pd.DataFrame, sheet: str = "insert") -> ValueTypes:
+        """
+        推断工作表中每个(表名, 列名列表)下各列的SQL类型
+
+        分块生成语句时先对整张工作表（或流式读取时逐块推断再用 widen_types 合并）推断一次，
+        再把结果传给各块的 insert_parts、update_statements 等方法，字面量写法不受分块方式影响。
+
+        Args:
+            df: 工作表数据
+            sheet: 工作表类型，insert、update、merge 或 delete（表对表、暂存表格式没有值，返回空字典）
+
+        Returns:
+            (表名, 规范化后的列名列表) -> 各列类型
+            （'null'、'integer'、'decimal'、'date'、'timestamp' 或 'text'）
+        """
+        return BulkSQLEngine._infer_value_types(BulkSQLEngine.value_rows(df, sheet))
+
+    @staticmethod
+    def value_rows(df: pd.DataFrame, sheet: str = "insert") -> pd.DataFrame:
+        """
+        解析工作表中列名和值数量一致的数据行
+
+        Args:
+            df: 工作表数据
+            sheet: 工作表类型，insert、update、merge 或 delete
+
+        Returns:
+            以原始行索引为索引、包含 table、columns（已规范化）、values 列的DataFrame，
+            update、merge、delete 工作表还包含 keys 列；表对表、暂存表格式返回空DataFrame
+        """
+        if sheet == "insert":
+            return BulkSQLEngine._insert_rows(df)[0]
+        if (
+            sheet == "merge"
+            and (
+                "source_table" in df.columns
+                or ("values" not in df.columns and df.shape[1] >= 5)
+            )
+        ) or (
+            sheet == "delete"
+            and "values" not in df.columns
+            and "tmp_table" in df.columns
+        ):
+            return pd.DataFrame(
+                {"table": [], "columns": [], "values": []}, dtype=object
+            )
+        return BulkSQLEngine._keyed_rows(df, _KEYED_COLUMNS[sheet])[0]
+
+    @staticmethod
+    def _infer_value_types(rows: pd.DataFrame) -> ValueTypes:
+        """按(表名, 列名列表)推断 value_rows 返回的数据行中各列的类型"""
+        types = {}
+        for columns, group in rows["values"].groupby(rows["columns"], sort=False):
+            frame = group.astype(str).str.split(",", expand=True, regex=False)
+            tables = rows["table"][group.index]
+            column_types = [
+                SQLLiteralRenderer.group_types(frame[position], tables)
+                for position in frame.columns
+            ]
+            for table in column_types[0].index:
+                types[(table, columns)] = [by_table[table] for by_table in column_types]
+        return types
+
+    @staticmethod
+    def widen_types(types: ValueTypes, other: ValueTypes) -> ValueTypes:
+        """
+        合并两部分数据的值类型，结果与对两部分数据一起调用 value_types 相同
+
+        Args:
+            types: 第一部分数据的值类型
+            other: 第二部分数据的值类型
+
+        Returns:
+            合并后的值类型（新字典）
+        """
+        merged = dict(types)
+        for key, column_types in other.items():
+            if key in merged:
+                column_types = [
+                    SQLLiteralRenderer.widen(first, second)
+                    for first, second in zip(merged[key], column_types)
+                ]
+            merged[key] = list(column_types)
+        return merged
+
+    @staticmethod
+    def select_statements(df: pd.DataFrame) -> pd.Series:
+        """
+        按列生成SELECT语句（第1列为表名，第2列为字段列表）
+
+        Args:
+            df: select工作表数据
+
+        Returns:
+            以原始行索引为索引的SELECT语句列
+        """
+        if df.shape[1] < 2:
+            return pd.Series([], dtype=object)
+
+        tables = df.iloc[:, 0]
+        fields = df.iloc[:, 1]
+        mask = tables.notna() & fields.notna()
+
+        return (
+            "SELECT "
+            + fields[mask].astype(str).str.strip()
+            + " FROM "
+            + tables[mask].astype(str).str.strip()
+            + ";"
+        )
+
+    @staticmethod
+    def create_statements(df: pd.DataFrame) -> pd.Series:
+        """
+        生成CREATE TABLE语句
+
+        支持两种格式：宽表格式每行一个表（表名列，其余各列为 列名 -> 列定义）；
+        长表格式每行一个字段（domain, table, column, data_type，domain可省略），
+        同一表的字段按出现顺序合并为一条语句。
+
+        Args:
+            df: create工作表数据
+
+        Returns:
+            以原始行索引为索引的CREATE语句列（长表格式以每个表的第一行为索引）
+        """
+        if df.empty:
+            return pd.Series([], dtype=object)
+        long_columns = BulkSQLEngine.long_create_columns(df)
+        if long_columns is not None:
+            return BulkSQLEngine._create_from_fields(df, long_columns)
+        # 检查必要的列是否存在
+        if "表名" in df.columns:
+            table_col = "表名"
+        else:
+            # 第一列为表名（table、table_name等）
+            table_col = df.columns[0]
+
+        statements = {}
+        for index, row in df.iterrows():
+            table_name = row[table_col]
+            if not pd.notna(table_name) or not table_name:
+                continue
+
+            # 跳过表名列，处理其他列
+            columns = [
+                f"    {col_name} {row[col_name]}"
+                for col_name in df.columns
+                if col_name != table_col and pd.notna(row[col_name]) and row[col_name]
+            ]
+            if columns:
+                statements[index] = (
+                    f"CREATE TABLE {table_name} (\n" + ",\n".join(columns) + "\n);"
+                )
+        return pd.Series(statements, dtype=object)
+
+    @staticmethod
+    def long_create_columns(df: pd.DataFrame) -> Optional[Dict[str, str]]:
+        """识别create工作表的长表格式，返回 角色 -> 列名；不是长表格式时返回None"""
+        by_name = {str(column).strip().lower(): column for column in df.columns}
+        found = {}
+        for role, names in _LONG_CREATE_COLUMNS.items():
+            matches = [by_name[name] for name in names if name in by_name]
+            if matches:
+                found[role] = matches[0]
+        if not {"table", "column", "type"} <= found.keys():
+            return None
+        return found
+
+    @staticmethod
+    def _create_from_fields(df: pd.DataFrame, columns: Dict[str, str]) -> pd.Series:
+        """由长表格式（每行一个字段）按表合并生成CREATE TABLE语句"""
+        tables = df[columns["table"]].astype(str).str.strip()
+        if "schema" in columns:
+            schemas = df[columns["schema"]].astype(str).str.strip()
+            qualified = df[columns["schema"]].notna() & (schemas != "")
+            tables = tables.where(~qualified, schemas + "." + tables)
+        names = df[columns["column"]].astype(str).str.strip()
+        types = df[columns["type"]].astype(str).str.strip()
+        valid = (
+            df[columns["table"]].notna()
+            & df[columns["column"]].notna()
+            & (tables != "")
+            & (names != "")
+        ).to_numpy()
+        fields = (
+            "    "
+            + names
+            + (" " + types).where(df[columns["type"]].notna() & (types != ""), "")
+        )[valid]
+
+        statements = {}
+        for table, group in fields.groupby(tables[valid], sort=False):
+            statements[group.index[0]] = (
+                f"CREATE TABLE {table} (\n" + ",\n".join(group.tolist()) + "\n);"
+            )
+        return pd.Series(statements, dtype=object)
+
+    @staticmethod
+    def insert_parts(
+        df: pd.DataFrame, dialect: str = "ansi", types: Optional[ValueTypes] = None
+    ) -> Tuple[pd.DataFrame, List[int]]:
+        """
+        按列拆解INSERT语句的组成部分（第1列为表名，第2列为列名列表，第3列为值列表）
+
+        一次性校验所有行的列名和值数量是否一致，不一致的行不会生成语句。
+        值按(表名, 列名列表)分组渲染为带类型的字面量。
+
+        Args:
+            df: insert工作表数据
+            dialect: 目标数据库方言
+            types: 整张工作表的值类型（分块生成时使用，见 value_types），可选
+
+        Returns:
+            (包含 table、columns、values 三列的DataFrame, 列名和值数量不匹配的行索引列表)
+        """
+        rows, mismatched = BulkSQLEngine._insert_rows(df)
+        parts = pd.DataFrame(
+            {
+                "table": rows["table"],
+                "columns": rows["columns"],
+                "values": BulkSQLEngine._typed_value_lists(
+                    rows["values"], rows["table"], rows["columns"], dialect, types
+                ),
+            }
+        )
+        return parts, mismatched
+
+    @staticmethod
+    def _insert_rows(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[int]]:
+        """
+        解析insert工作表的数据行，一次性比较每行的列名和值数量
+
+        Args:
+            df: insert工作表数据
+
+        Returns:
+            (包含 table、columns（已规范化）、values 列的DataFrame, 列名和值数量不匹配的行索引列表)
+        """
+        empty = pd.DataFrame({"table": [], "columns": [], "values": []}, dtype=object)
+        if df.shape[1] < 3:
+            return empty, []
+
+        data = df.iloc[:, :3]
+        data = data[data.notna().all(axis=1)]
+        if data.empty:
+            return empty, []
+
+        tables = data.iloc[:, 0].astype(str).str.strip()
+        columns = data.iloc[:, 1].astype(str)
+        values = data.iloc[:, 2].astype(str)
+
+        # 一次性比较每行的分隔符数量
+        matched = columns.str.count(",") == values.str.count(",")
+        mismatched = BulkSQLEngine._mismatched_rows(columns[~matched], values[~matched])
+        rows = pd.DataFrame(
+            {
+                "table": tables[matched],
+                "columns": BulkSQLEngine.normalize_list(columns[matched]),
+                "values": values[matched],
+            }
+        )
+        return rows, mismatched
+
+    @staticmethod
+    def upsert_parts(
+        df: pd.DataFrame,
+        dialect: str = "postgresql",
+        keys: Optional[List[str]] = None,
+        types: Optional[ValueTypes] = None,
+    ) -> Tuple[pd.DataFrame, List[int]]:
+        """
+        拆解多行UPSERT语句的组成部分，交给InsertBatcher按行数和字节数合并
+
+        数据为merge工作表的数据行格式（target_table, target_column, uniqueid, values），
+        或insert工作表格式（table, column, values，此时必须给出keys）。
+        suffix列为冲突处理子句：PostgreSQL/SQLite为 ON CONFLICT (主键) DO UPDATE SET c = EXCLUDED.c，
+        MySQL为 ON DUPLICATE KEY UPDATE c = VALUES(c)（冲突由表上的主键或唯一索引判断，
+        主键列只用于确定不更新的列）。同一批中主键重复的行在PostgreSQL中会报错，需先去重。
+
+        Args:
+            df: 工作表数据
+            dialect: 目标数据库方言，postgresql、sqlite或mysql
+            keys: 主键列，给出时覆盖工作表中的uniqueid列
+            types: 整张工作表的值类型，可选
+
+        Returns:
+            (包含 table、columns、values、suffix 四列的DataFrame, 配置不一致的行索引列表)
+        """
+        if dialect not in UPSERT_DIALECTS:
+            raise ValueError(f"不支持的UPSERT方言: {dialect}")
+        if "values" not in df.columns:
+            raise ValueError("UPSERT需要包含values列的数据行格式，表对表格式请生成MERGE语句")
+        if "target_table" not in df.columns and "table" in df.columns:
+            df = df.rename(columns={"table": "target_table", "column": "target_column"})
+        if keys:
+            df = df.assign(uniqueid=", ".join(keys))
+        elif "uniqueid" not in df.columns:
+            raise ValueError("UPSERT需要主键列：请在工作表中填写uniqueid列或指定主键")
+
+        rows, mismatched = BulkSQLEngine._keyed_rows(df, _KEYED_COLUMNS["merge"])
+        parts = pd.DataFrame(
+            {
+                "table": rows["table"],
+                "columns": rows["columns"],
+                "values": BulkSQLEngine._typed_value_lists(
+                    rows["values"], rows["table"], rows["columns"], dialect, types
+                ),
+                "suffix": BulkSQLEngine._map_clauses(
+                    [rows["columns"], rows["keys"]],
+                    lambda columns, key: BulkSQLEngine._upsert_clause(
+                        columns, key, dialect
+                    ),
+                ),
+            },
+            index=rows.index,
+        )
+        return parts, mismatched
+
+    @staticmethod
+    def _upsert_clause(columns: str, keys: str, dialect: str) -> str:
+        """
+        生成INSERT语句末尾的冲突处理子句
+
+        Args:
+            columns: 规范化后的列名列表
+            keys: 规范化后的主键列列表
+            dialect: 目标数据库方言
+
+        Returns:
+            以空格开头的 ON CONFLICT / ON DUPLICATE KEY 子句
+        """
+        key_list = keys.split(", ")
+        updates = [column for column in columns.split(", ") if column not in key_list]
+        if dialect == "mysql":
+            # 没有可更新的列时以主键赋值为自身，相当于忽略冲突行
+            assignments = [f"{column} = VALUES({column})" for column in updates] or [
+                f"{key_list[0]} = {key_list[0]}"
+            ]
+            return " ON DUPLICATE KEY UPDATE " + ", ".join(assignments)
+        if not updates:
+            return f" ON CONFLICT ({keys}) DO NOTHING"
+        assignments = ", ".join(f"{column} = EXCLUDED.{column}" for column in updates)
+        return f" ON CONFLICT ({keys}) DO UPDATE SET {assignments}"
+
+    @staticmethod
+    def insert_statements(
+        df: pd.DataFrame, dialect: str = "ansi", types: Optional[ValueTypes] = None
+    ) -> Tuple[pd.Series, List[int]]:
+        """
+        按列生成单行INSERT语句
+
+        Args:
+            df: insert工作表数据
+            dialect: 目标数据库方言
+            types: 整张工作表的值类型（分块生成时使用，见 value_types），可选
+
+        Returns:
+            (以原始行索引为索引的INSERT语句列, 列名和值数量不匹配的行索引列表)
+        """
+        parts, mismatched = BulkSQLEngine.insert_parts(df, dialect, types)
+        statements = (
+            "INSERT INTO "
+            + parts["table"]
+            + " ("
+            + parts["columns"]
+            + ") VALUES ("
+            + parts["values"]
+            + ");"
+        )
+        return statements, mismatched
+
+    @staticmethod
+    def merge_statements(
+        df: pd.DataFrame,
+        set_based: bool = False,
+        batch_size: Optional[int] = None,
+        dialect: str = "ansi",
+        types: Optional[ValueTypes] = None,
+    ) -> Tuple[pd.Series, List[int]]:
+        """
+        按列生成MERGE语句
+
+        支持两种工作表格式：
+        - 表对表格式（target_table, target_column, uniqueid, source_table, source_column）：
+          每行生成一条 MERGE INTO 目标表 USING 源表 的语句；
+        - 数据行格式（target_table, target_column, uniqueid, values）：每行是一条源数据，
+          默认每行生成一条 USING (VALUES ...) 语句；set_based为True时，同一目标表、列和主键的
+          所有行合并为一条 USING (VALUES (...), (...)) 语句，batch_size限制每条语句的行数。
+
+        Args:
+            df: merge工作表数据
+            set_based: 数据行格式下是否按目标表合并为一条语句
+            batch_size: 合并时每条语句最多包含的行数，None表示不限制
+            dialect: 目标数据库方言（决定数据行格式下日期字面量的写法）
+            types: 数据行格式下整张工作表的值类型，可选
+
+        Returns:
+            (MERGE语句列, 列名、值或主键配置不一致的行索引列表)
+        """
+        if "source_table" in df.columns or (
+            "values" not in df.columns and df.shape[1] >= 5
+        ):
+            return BulkSQLEngine._merge_from_tables(df)
+        return BulkSQLEngine._merge_from_values(
+            df, set_based, batch_size, dialect, types
+        )
+
+    @staticmethod
+    def _merge_from_tables(df: pd.DataFrame) -> Tuple[pd.Series, List[int]]:
+        """由表对表格式生成MERGE语句"""
+        data = BulkSQLEngine._pick_columns(
+            df,
+            [
+                "target_table",
+                "target_column",
+                "uniqueid",
+                "source_table",
+                "source_column",
+            ],
+        )
+        data = data[data.notna().all(axis=1)].astype(str)
+        if data.empty:
+            return pd.Series([], dtype=object), []
+
+        target_columns = BulkSQLEngine.normalize_list(data["target_column"])
+        source_columns = BulkSQLEngine.normalize_list(data["source_column"])
+        keys = BulkSQLEngine.normalize_list(data["uniqueid"])
+        matched = target_columns.str.count(",") == source_columns.str.count(",")
+
+        clauses = BulkSQLEngine._map_clauses(
+            [target_columns[matched], source_columns[matched], keys[matched]],
+            lambda target, source, key: BulkSQLEngine._merge_clauses(
+                target, key, source
+            ),
+        )
+        statements = (
+            "MERGE INTO "
+            + data["target_table"][matched].str.strip()
+            + " AS t\n"
+            + "USING "
+            + data["source_table"][matched].str.strip()
+            + " AS s\n"
+            + clauses
+        )
+        return statements, list(data.index[~matched])
+
+    @staticmethod
+    def _merge_from_values(
+        df: pd.DataFrame,
+        set_based: bool,
+        batch_size: Optional[int],
+        dialect: str,
+        types: Optional[ValueTypes] = None,
+    ) -> Tuple[pd.Series, List[int]]:
+        """由数据行格式生成MERGE语句"""
+        rows, mismatched = BulkSQLEngine._keyed_rows(df, _KEYED_COLUMNS["merge"])
+        if rows.empty:
+            return pd.Series([], dtype=object), mismatched
+
+        tables, columns, keys = rows["table"], rows["columns"], rows["keys"]
+        values = (
+            "("
+            + BulkSQLEngine._typed_value_lists(
+                rows["values"], tables, columns, dialect, types
+            )
+            + ")"
+        )
+
+        if set_based:
+            group_keys = [tables, columns, keys]
+            if batch_size:
+                group_keys.append(
+                    values.groupby(group_keys, sort=False).cumcount() // int(batch_size)
+                )
+            grouped = values.groupby(group_keys, sort=False)
+            values = grouped.agg(",\n       ".join)
+            first_rows = grouped.head(1).index
+            tables, columns, keys = (
+                tables[first_rows],
+                columns[first_rows],
+                keys[first_rows],
+            )
+            values.index = first_rows
+
+        clauses = BulkSQLEngine._map_clauses(
+            [columns, keys], lambda cols, key: BulkSQLEngine._merge_clauses(cols, key)
+        )
+        statements = (
+            "MERGE INTO "
+            + tables
+            + " AS t\n"
+            + "USING (VALUES "
+            + values
+            + ") AS s ("
+            + columns
+            + ")\n"
+            + clauses
+        )
+        return statements, mismatched
+
+    @staticmethod
+    def update_statements(
+        df: pd.DataFrame,
+        batch_size: Optional[int] = None,
+        style: str = "case",
+        dialect: str = "ansi",
+        types: Optional[ValueTypes] = None,
+    ) -> Tuple[pd.Series, List[int]]:
+        """
+        按表生成基于集合的UPDATE语句（工作表列为 table, column, uniqueid, values）
+
+        同一表、列和主键的行合并为一条语句，batch_size限制每条语句的行数，
+        语句以该批第一行的原始行索引为索引：
+        - style为 'case' 时生成
+          UPDATE ... SET col = CASE key WHEN ... END WHERE key IN (...)；
+        - style为 'from_values' 时生成
+          UPDATE ... FROM (VALUES ...) AS s WHERE t.key = s.key。
+
+        Args:
+            df: update工作表数据
+            batch_size: 每条语句最多包含的行数，None表示每个表一条
+            style: 语句形式，'case' 或 'from_values'
+            dialect: 目标数据库方言
+            types: 整张工作表的值类型，可选
+
+        Returns:
+            (UPDATE语句列, 列名、值或主键配置不一致的行索引列表)
+        """
+        if style not in ("case", "from_values"):
+            raise ValueError(f"不支持的UPDATE语句形式: {style}")
+
+        rows, mismatched = BulkSQLEngine._keyed_rows(df, _KEYED_COLUMNS["update"])
+        # 只有主键列时没有可更新的列
+        key_only = rows["columns"].str.count(",") == rows["keys"].str.count(",")
+        mismatched = sorted(mismatched + list(rows.index[key_only]))
+        rows = rows[~key_only]
+
+        builder = (
+            BulkSQLEngine._update_case
+            if style == "case"
+            else BulkSQLEngine._update_from_values
+        )
+        statements, index = [], []
+        for table, columns, keys, literals in BulkSQLEngine._keyed_batches(
+            rows, batch_size, dialect, types
+        ):
+            statements.append(builder(table, columns, keys, literals))
+            index.append(literals.index[0])
+        return pd.Series(statements, index=index, dtype=object), mismatched
+
+    @staticmethod
+    def _update_case(
+        table: str, columns: List[str], keys: List[str], literals: pd.DataFrame
+    ) -> str:
+        """生成 UPDATE ... SET col = CASE ... END WHERE key IN (...) 语句"""
+        if len(keys) == 1:
+            key = keys[0]
+            conditions = literals[key]
+            case_head = f"CASE {key}"
+            where = f"{key} IN ({literals[key].str.cat(sep=', ')})"
+        else:
+            conditions = keys[0] + " = " + literals[keys[0]]
+            for key in keys[1:]:
+                conditions = conditions + " AND " + key + " = " + literals[key]
+            case_head = "CASE"
+            tuples = BulkSQLEngine._row_tuples(literals, keys)
+            where = f"({', '.join(keys)}) IN ({tuples.str.cat(sep=', ')})"
+
+        assignments = []
+        for column in columns:
+            if column in keys:
+                continue
+            branches = ("WHEN " + conditions + " THEN " + literals[column]).str.cat(
+                sep=" "
+            )
+            assignments.append(f"{column} = {case_head} {branches} END")
+
+        return (
+            f"UPDATE {table}\nSET " + ",\n    ".join(assignments) + f"\nWHERE {where};"
+        )
+
+    @staticmethod
+    def _update_from_values(
+        table: str, columns: List[str], keys: List[str], literals: pd.DataFrame
+    ) -> str:
+        """生成 UPDATE ... FROM (VALUES ...) 语句"""
+        rows = BulkSQLEngine._row_tuples(literals, columns).str.cat(sep=",\n       ")
+        assignments = ", ".join(
+            f"{column} = s.{column}" for column in columns if column not in keys
+        )
+        on_clause = " AND ".join(f"t.{key} = s.{key}" for key in keys)
+        return (
+            f"UPDATE {table} AS t\nSET {assignments}\n"
+            f"FROM (VALUES {rows}) AS s ({', '.join(columns)})\nWHERE {on_clause};"
+        )
+
+    @staticmethod
+    def delete_statements(
+        df: pd.DataFrame,
+        batch_size: Optional[int] = None,
+        reinsert: bool = False,
+        dialect: str = "ansi",
+        types: Optional[ValueTypes] = None,
+    ) -> Tuple[pd.Series, List[int]]:
+        """
+        按表生成DELETE语句（可选配对的重新插入语句）
+
+        支持两种工作表格式：
+        - 暂存表格式（table, column, del_column, tmp_table）：每行生成
+          DELETE ... WHERE key IN (SELECT key FROM 暂存表)，reinsert时再从暂存表INSERT ... SELECT；
+        - 数据行格式（table, column, del_column, values）：按表收集主键值，每batch_size个主键生成一条
+          DELETE ... WHERE key IN (...)，reinsert时紧随其后生成同一批行的多行INSERT；
+          语句以该批第一行的原始行索引为索引。
+
+        Args:
+            df: delete工作表数据
+            batch_size: 数据行格式下每条语句最多包含的行数，None表示每个表一条
+            reinsert: 是否生成删除后重新插入的语句
+            dialect: 目标数据库方言
+            types: 数据行格式下整张工作表的值类型，可选
+
+        Returns:
+            (DELETE/INSERT语句列, 配置不一致的行索引列表)
+        """
+        if "values" not in df.columns and "tmp_table" in df.columns:
+            return BulkSQLEngine._delete_from_staging(df, reinsert)
+
+        rows, mismatched = BulkSQLEngine._keyed_rows(df, _KEYED_COLUMNS["delete"])
+        statements, index = [], []
+        for table, columns, keys, literals in BulkSQLEngine._keyed_batches(
+            rows, batch_size, dialect, types
+        ):
+            index.extend([literals.index[0]] * (2 if reinsert else 1))
+            if len(keys) == 1:
+                key_values = literals[keys[0]].drop_duplicates()
+                statements.append(
+                    f"DELETE FROM {table} WHERE {keys[0]} IN ({key_values.str.cat(sep=', ')});"
+                )
+            else:
+                key_values = BulkSQLEngine._row_tuples(literals, keys).drop_duplicates()
+                statements.append(
+                    f"DELETE FROM {table} WHERE ({', '.join(keys)}) IN "
+                    f"({key_values.str.cat(sep=', ')});"
+                )
+            if reinsert:
+                rows_sql = BulkSQLEngine._row_tuples(literals, columns).str.cat(
+                    sep=", "
+                )
+                statements.append(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES {rows_sql};"
+                )
+        return pd.Series(statements, index=index, dtype=object), mismatched
+
+    @staticmethod
+    def _delete_from_staging(
+        df: pd.DataFrame, reinsert: bool
+    ) -> Tuple[pd.Series, List[int]]:
+        """由暂存表格式生成DELETE（及INSERT ... SELECT）语句"""
+        data = BulkSQLEngine._pick_columns(
+            df, ["table", "column", "del_column", "tmp_table"]
+        )
+        data = data[data.notna().all(axis=1)].astype(str)
+        if data.empty:
+            return pd.Series([], dtype=object), []
+
+        tables = data["table"].str.strip()
+        columns = BulkSQLEngine.normalize_list(data["column"])
+        keys = BulkSQLEngine.normalize_list(data["del_column"])
+        staging = data["tmp_table"].str.strip()
+        key_expr = keys.where(keys.str.count(",") == 0, "(" + keys + ")")
+
+        deletes = (
+            "DELETE FROM "
+            + tables
+            + " WHERE "
+            + key_expr
+            + " IN (SELECT "
+            + keys
+            + " FROM "
+            + staging
+            + ");"
+        )
+        if not reinsert:
+            return deletes, []
+
+        inserts = (
+            "INSERT INTO "
+            + tables
+            + " ("
+            + columns
+            + ") SELECT "
+            + columns
+            + " FROM "
+            + staging
+            + ";"
+        )
+        # 每行的DELETE后紧跟对应的INSERT
+        statements = pd.concat([deletes, inserts]).sort_index(kind="stable")
+        return statements, []
+
+    @staticmethod
+    def truncate_statements(df: pd.DataFrame) -> Tuple[pd.Series, List[int]]:
+        """
+        按列生成TRUNCATE语句（工作表列为 target_table, target_column, source_table, source_column）
+
+        只填写目标表时生成 TRUNCATE TABLE；同时填写源表和列时，紧随其后生成
+        INSERT INTO 目标表 (...) SELECT ... FROM 源表（清空后插入）。
+
+        Args:
+            df: truncate工作表数据
+
+        Returns:
+            (TRUNCATE/INSERT语句列, 目标列和源列数量不匹配的行索引列表)
+        """
+        data = BulkSQLEngine._pick_columns(
+            df, ["target_table", "target_column", "source_table", "source_column"]
+        )
+        data = data[data["target_table"].notna()]
+        if data.empty:
+            return pd.Series([], dtype=object), []
+
+        tables = data["target_table"].astype(str).str.strip()
+        truncates = "TRUNCATE TABLE " + tables + ";"
+
+        reload_rows = (
+            data[["target_column", "source_table", "source_column"]].notna().all(axis=1)
+        )
+        sources = data[reload_rows].astype(str)
+        target_columns = BulkSQLEngine.normalize_list(sources["target_column"])
+        source_columns = BulkSQLEngine.normalize_list(sources["source_column"])
+        matched = target_columns.str.count(",") == source_columns.str.count(",")
+
+        inserts = (
+            "INSERT INTO "
+            + tables[reload_rows][matched]
+            + " ("
+            + target_columns[matched]
+            + ") SELECT "
+            + source_columns[matched]
+            + " FROM "
+            + sources["source_table"][matched].str.strip()
+            + ";"
+        )
+        mismatched = list(sources.index[~matched])
+        # 每行的TRUNCATE后紧跟对应的INSERT，不匹配的行不生成语句
+        truncates = truncates.drop(mismatched)
+        return pd.concat([truncates, inserts]).sort_index(kind="stable"), mismatched
+
+    @staticmethod
+    def _row_tuples(literals: pd.DataFrame, columns: List[str]) -> pd.Series:
+        """按列拼接每行的值元组，如 (1, 'a')"""
+        return "(" + BulkSQLEngine._join_literals(literals[columns]) + ")"
+
+    @staticmethod
+    def _join_literals(literals: pd.DataFrame) -> pd.Series:
+        """按列顺序以 ", " 拼接每行的字面量"""
+        joined = literals.iloc[:, 0]
+        for position in range(1, literals.shape[1]):
+            joined = joined + ", " + literals.iloc[:, position]
+        return joined
+
+    @staticmethod
+    def _keyed_rows(
+        df: pd.DataFrame, names: List[str]
+    ) -> Tuple[pd.DataFrame, List[int]]:
+        """
+        解析带主键的数据行（表名、列名列表、主键列表、值列表）
+
+        一次性校验每行的列名和值数量一致、主键均包含在列名中。
+
+        Args:
+            df: 工作表数据
+            names: 表名、列名列表、主键列表、值列表对应的列名
+
+        Returns:
+            (包含 table、columns、keys、values 列的DataFrame, 不合法的行索引列表)
+        """
+        data = BulkSQLEngine._pick_columns(df, names)
+        data = data[data.notna().all(axis=1)].astype(str)
+        table_name, column_name, key_name, value_name = names
+        rows = pd.DataFrame(
+            {
+                "table": data[table_name].str.strip(),
+                "columns": BulkSQLEngine.normalize_list(data[column_name]),
+                "keys": BulkSQLEngine.normalize_list(data[key_name]),
+                "values": data[value_name].str.strip(),
+            },
+            index=data.index,
+        )
+        if rows.empty:
+            return rows, []
+
+        matched = rows["columns"].str.count(",") == rows["values"].str.count(",")
+        matched &= BulkSQLEngine._map_clauses(
+            [rows["columns"], rows["keys"]],
+            lambda cols, key: set(key.split(", ")) <= set(cols.split(", ")),
+        ).astype(bool)
+        return rows[matched], list(rows.index[~matched])
+
+    @staticmethod
+    def _keyed_batches(
+        rows: pd.DataFrame,
+        batch_size: Optional[int],
+        dialect: str = "ansi",
+        types: Optional[ValueTypes] = None,
+    ) -> Iterator[Tuple[str, List[str], List[str], pd.DataFrame]]:
+        """
+        将带主键的数据行按(表名, 列名列表, 主键列表)分组，并按batch_size切分
+
+        值的类型按(表名, 列名列表)在切分前统一推断（与 _typed_value_lists 相同），同一表的各批次字面量写法一致。
+
+        Args:
+            rows: _keyed_rows 返回的数据行
+            batch_size: 每批最多行数，None表示不切分
+            dialect: 目标数据库方言
+            types: 整张工作表的值类型，默认由rows推断
+
+        Returns:
+            (表名, 列名列表, 主键列表, 按列拆分的字面量DataFrame) 迭代器
+        """
+        if rows.empty:
+            return
+        if types is None:
+            types = BulkSQLEngine._infer_value_types(rows)
+        group_keys = [rows["table"], rows["columns"], rows["keys"]]
+        for (table, columns, keys), group in rows.groupby(group_keys, sort=False):
+            column_list = columns.split(", ")
+            literals = BulkSQLEngine.typed_literals(
+                group["values"], dialect, group["table"], columns, types
+            )
+            literals.columns = column_list
+            size = int(batch_size) if batch_size else len(literals)
+            for start in range(0, len(literals), size):
+                yield table, column_list, keys.split(", "), literals.iloc[
+                    start : start + size
+                ]
+
+    @staticmethod
+    def _merge_clauses(
+        target_columns: str, keys: str, source_columns: Optional[str] = None
+    ) -> str:
+        """
+        生成MERGE语句的ON及WHEN子句
+
+        Args:
+            target_columns: 规范化后的目标列列表
+            keys: 规范化后的主键列列表
+            source_columns: 规范化后的源列列表，None表示与目标列同名
+
+        Returns:
+            ON ... WHEN MATCHED ... WHEN NOT MATCHED ...; 子句
+        """
+        targets = target_columns.split(", ")
+        sources = source_columns.split(", ") if source_columns is not None else targets
+        key_list = keys.split(", ")
+        pairs = [
+            (target, source)
+            for target, source in zip(targets, sources)
+            if target not in key_list
+        ]
+
+        on_clause = " AND ".join(f"t.{key} = s.{key}" for key in key_list)
+        insert_columns = key_list + [target for target, _ in pairs]
+        insert_values = [f"s.{key}" for key in key_list] + [
+            f"s.{source}" for _, source in pairs
+        ]
+
+        clause = f"ON ({on_clause})\n"
+        if pairs:
+            set_clause = ", ".join(f"{target} = s.{source}" for target, source in pairs)
+            clause += f"WHEN MATCHED THEN UPDATE SET {set_clause}\n"
+        clause += (
+            f"WHEN NOT MATCHED THEN INSERT ({', '.join(insert_columns)}) "
+            f"VALUES ({', '.join(insert_values)});"
+        )
+        return clause
+
+    @staticmethod
+    def _map_clauses(series_list: List[pd.Series], builder) -> pd.Series:
+        """
+        对若干列的每种不同取值组合只调用一次builder，再按行映射回结果
+
+        Args:
+            series_list: 索引相同的若干列
+            builder: 接收各列取值、返回结果的函数
+
+        Returns:
+            与输入索引相同的结果列
+        """
+        if series_list[0].empty:
+            return pd.Series([], index=series_list[0].index, dtype=object)
+        combos = pd.MultiIndex.from_arrays(series_list)
+        codes, uniques = pd.factorize(combos)
+        results = [builder(*combo) for combo in uniques]
+        return pd.Series(
+            np.asarray(results, dtype=object)[codes], index=series_list[0].index
+        )
+
+    @staticmethod
+    def _pick_columns(df: pd.DataFrame, names: List[str]) -> pd.DataFrame:
+        """
+        按列名选取工作表列，列名不存在时按位置选取，并统一重命名为names
+
+        Args:
+            df: 工作表数据
+            names: 期望的列名
+
+        Returns:
+            只包含names列的DataFrame
+        """
+        if all(name in df.columns for name in names):
+            return df[names]
+        if df.shape[1] < len(names):
+            raise ValueError(f"工作表至少需要 {len(names)} 列: {', '.join(names)}")
+        return df.iloc[:, : len(names)].set_axis(names, axis=1)
+
+    @staticmethod
+    def _mismatched_rows(columns: pd.Series, values: pd.Series) -> List[int]:
+        """
+        逐行复核未通过向量化校验的行（仅对少量异常行执行Python循环）
+
+        Args:
+            columns: 异常行的列名列表
+            values: 异常行的值列表
+
+        Returns:
+            确认列名和值数量不匹配的行索引列表
+        """
+        mismatched = []
+        for index, column_str, value_str in zip(columns.index, columns, values):
+            if len(column_str.split(",")) != len(value_str.split(",")):
+                mismatched.append(index)
+        return mismatched
+
+
+class InsertBatcher:
+    """
+    多行INSERT合并器
+
+    将连续的、表名和列名列表相同的行合并为 INSERT ... VALUES (...), (...); 语句，
+    每条语句的行数不超过 rows_per_statement，字节数不超过 max_statement_bytes
+    （单行本身超过上限时仍单独成句）。parts带有suffix列时（如 ON CONFLICT 子句），
+    后缀相同的连续行才合并，后缀计入语句字节数。合并状态在多次 add 调用之间保留，
+    因此流式生成时跨块的连续行也能合并。
+    """
+
+    def __init__(
+        self, rows_per_statement: int = 1, max_statement_bytes: Optional[int] = None
+    ):
+        """
+        初始化合并器
+
+        Args:
+            rows_per_statement: 每条语句最多包含的行数
+            max_statement_bytes: 每条语句的最大字节数（UTF-8），None表示不限制
+        """
+        self.rows_per_statement = max(1, int(rows_per_statement))
+        self.max_statement_bytes = max_statement_bytes
+        self._prefix = None
+        self._suffix = ""
+        self._rows = []
+        self._size = 0
+
+    def add(self, parts: pd.DataFrame) -> Iterator[str]:
+        """
+        添加一批INSERT组成部分，产出已满的语句
+
+        Args:
+            parts: BulkSQLEngine.insert_parts 或 upsert_parts 返回的DataFrame
+
+        Returns:
+            已完成的INSERT语句迭代器
+        """
+        if parts.empty:
+            return
+
+        prefixes = (
+            "INSERT INTO " + parts["table"] + " (" + parts["columns"] + ") VALUES "
+        )
+        suffixes = parts["suffix"] if "suffix" in parts.columns else [""] * len(parts)
+        rows = "(" + parts["values"] + ")"
+        sizes = rows.str.encode("utf-8").str.len()
+
+        for prefix, suffix, row, size in zip(prefixes, suffixes, rows, sizes):
+            if self._rows and (
+                prefix != self._prefix or suffix != self._suffix or not self._fits(size)
+            ):
+                yield self._emit()
+            if not self._rows:
+                self._prefix = prefix
+                self._suffix = suffix
+                # 前缀、后缀和结尾的分号
+                self._size = (
+                    len(prefix.encode("utf-8")) + len(suffix.encode("utf-8")) + 1
+                )
+            else:
+                self._size += 2  # 行之间的 ", "
+            self._rows.append(row)
+            self._size += size
+
+    def flush(self) -> Iterator[str]:
+        """
+        产出尚未输出的最后一条语句
+
+        Returns:
+            剩余INSERT语句迭代器
+        """
+        if self._rows:
+            yield self._emit()
+
+    def _fits(self, size: int) -> bool:
+        """判断当前语句能否再容纳一行"""
+        if len(self._rows) >= self.rows_per_statement:
+            return False
+        if (
+            self.max_statement_bytes is not None
+            and self._size + 2 + size > self.max_statement_bytes
+        ):
+            return False
+        return True
+
+    def _emit(self) -> str:
+        """输出当前语句并重置状态"""
+        statement = self._prefix + ", ".join(self._rows) + self._suffix + ";"
+        self._prefix = None
+        self._suffix = ""
+        self._rows = []
+        self._size = 0
+        return statement
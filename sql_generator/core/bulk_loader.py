@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+批量导入模块 - 将insert工作表数据写成CSV/TSV数据文件，并生成对应数据库的导入命令
+"""
+
+import csv
+import os
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+import pandas as pd
+
+from sql_generator.core.bulk_engine import BulkSQLEngine
+from sql_generator.core.literals import SQLLiteralRenderer
+
+# 支持的导入方言
+LOAD_DIALECTS = ["postgresql", "mysql", "sqlite"]
+
+# 数据文件分隔符及对应扩展名
+LOAD_DELIMITERS = {",": "csv", "\t": "tsv"}
+
+
+class BulkLoadWriter:
+    """
+    批量导入文件写入器
+
+    值两侧的空白与生成INSERT语句时一样去除；NULL值（NULL、nan、None、空值，不区分大小写）
+    写为未加引号的空字段，COPY以 FORCE_NULL 把加引号的空字段也读为NULL；MySQL写为 \\N，
+    其余值中的反斜杠写为两个反斜杠。SQLite的 .import 不支持NULL，空字段导入为空字符串。
+    """
+
+    def __init__(
+        self, output_dir: str, dialect: str = "postgresql", delimiter: str = ","
+    ):
+        """
+        初始化写入器
+
+        Args:
+            output_dir: 输出目录
+            dialect: 目标数据库方言，postgresql、mysql或sqlite
+            delimiter: 数据文件分隔符，',' 生成CSV，'\\t' 生成TSV
+        """
+        if dialect not in LOAD_DIALECTS:
+            raise ValueError(f"不支持的导入方言: {dialect}")
+        if delimiter not in LOAD_DELIMITERS:
+            raise ValueError(f"不支持的分隔符: {delimiter!r}")
+
+        self.output_dir = output_dir
+        self.dialect = dialect
+        self.delimiter = delimiter
+        self.row_count = 0
+        # (表名, 列名列表) -> (文件名, 文件句柄, csv写入器)
+        self._targets: Dict[Tuple[str, str], Tuple[str, Any, Any]] = {}
+
+    def write_chunk(self, df: pd.DataFrame) -> List[int]:
+        """
+        写入一块insert工作表数据，按(表名, 列名列表)分别追加到各自的数据文件
+
+        Args:
+            df: insert工作表的DataFrame块
+
+        Returns:
+            列名和值数量不匹配的行索引列表
+        """
+        parts, mismatched = BulkSQLEngine.insert_parts(df)
+        if parts.empty:
+            return mismatched
+
+        # 恢复未加引号的原始值，按列拆分
+        values = df.loc[parts.index].iloc[:, 2].astype(str)
+        for (table, columns), group in values.groupby(
+            [parts["table"], parts["columns"]], sort=False
+        ):
+            frame = group.str.split(",", expand=True, regex=False)
+            fields = frame.apply(lambda column: column.str.strip())
+            if self.dialect == "mysql":
+                fields = fields.apply(
+                    lambda column: column.str.replace("\\", "\\\\", regex=False)
+                )
+            fields = fields.where(
+                ~frame.apply(SQLLiteralRenderer.null_mask), self._null_field()
+            )
+            writer = self._writer(table, columns)
+            writer.writerows(fields.to_numpy().tolist())
+            self.row_count += len(group)
+
+        return mismatched
+
+    def close(self) -> Tuple[str, List[str]]:
+        """
+        关闭所有数据文件并写出导入脚本
+
+        Returns:
+            (导入脚本路径, 数据文件路径列表)
+        """
+        commands = [self._loader_comment()]
+        data_files = []
+        for (table, columns), (file_name, handle, _) in self._targets.items():
+            handle.close()
+            data_files.append(os.path.join(self.output_dir, file_name))
+            commands.append(self.loader_command(table, columns, file_name))
+        self._targets = {}
+
+        script_name = "load.sql" if self.dialect != "sqlite" else "load.sqlite"
+        script_path = os.path.join(self.output_dir, script_name)
+        with open(script_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(commands) + "\n")
+        return script_path, data_files
+
+    def loader_command(self, table: str, columns: str, file_name: str) -> str:
+        """
+        生成单个数据文件的导入命令
+
+        Args:
+            table: 表名
+            columns: 规范化后的列名列表，如 "a, b"
+            file_name: 数据文件名
+
+        Returns:
+            导入命令
+        """
+        if self.dialect == "postgresql":
+            delimiter = "E'\\t'" if self.delimiter == "\t" else "','"
+            return (
+                f"COPY {table} ({columns}) FROM '{file_name}' "
+                f"WITH (FORMAT csv, HEADER true, DELIMITER {delimiter}, FORCE_NULL ({columns}));"
+            )
+        if self.dialect == "mysql":
+            delimiter = "'\\t'" if self.delimiter == "\t" else "','"
+            return (
+                f"LOAD DATA LOCAL INFILE '{file_name}' INTO TABLE {table} "
+                f"FIELDS TERMINATED BY {delimiter} OPTIONALLY ENCLOSED BY '\"' "
+                f"LINES TERMINATED BY '\\n' IGNORE 1 LINES ({columns});"
+            )
+        mode = ".mode csv" if self.delimiter == "," else ".mode tabs"
+        return f"{mode}\n.import --skip 1 {file_name} {table}"
+
+    def _null_field(self) -> str:
+        """数据文件中NULL值的写法"""
+        return "\\N" if self.dialect == "mysql" else ""
+
+    def _loader_comment(self) -> str:
+        """导入脚本的说明注释"""
+        if self.dialect == "postgresql":
+            return "-- 数据文件需位于数据库服务器可访问的路径；在psql客户端中可将COPY改为\\copy"
+        if self.dialect == "mysql":
+            return "-- 需在客户端和服务端启用local_infile"
+        return "-- 在sqlite3命令行中执行；.import按表的列顺序导入，数据文件列顺序需与表一致；" "空字段导入为空字符串而不是NULL"
+
+    def _writer(self, table: str, columns: str) -> Any:
+        """获取(表名, 列名列表)对应的csv写入器，首次使用时创建数据文件并写入表头"""
+        key = (table, columns)
+        if key not in self._targets:
+            base_name = re.sub(r"[^0-9A-Za-z_]+", "_", table).strip("_") or "data"
+            file_name = f"{base_name}_{len(self._targets) + 1}.{LOAD_DELIMITERS[self.delimiter]}"
+            handle = open(
+                os.path.join(self.output_dir, file_name),
+                "w",
+                encoding="utf-8",
+                newline="",
+            )
+            writer = csv.writer(handle, delimiter=self.delimiter, lineterminator="\n")
+            writer.writerow(columns.split(", "))
+            self._targets[key] = (file_name, handle, writer)
+        return self._targets[key][2]
+
+    @staticmethod
+    def write_all(
+        chunks: Iterable[pd.DataFrame],
+        output_dir: str,
+        dialect: str = "postgresql",
+        delimiter: str = ",",
+    ) -> Dict[str, Any]:
+        """
+        将所有数据块写成数据文件和导入脚本
+
+        Args:
+            chunks: insert工作表的DataFrame块
+            output_dir: 输出目录
+            dialect: 目标数据库方言
+            delimiter: 数据文件分隔符
+
+        Returns:
+            结果字典，包含 script、data_files、row_count、mismatched_rows
+        """
+        writer = BulkLoadWriter(output_dir, dialect, delimiter)
+        mismatched = []
+        try:
+            for chunk in chunks:
+                mismatched.extend(writer.write_chunk(chunk))
+        finally:
+            script, data_files = writer.close()
+
+        return {
+            "script": script,
+            "data_files": data_files,
+            "row_count": writer.row_count,
+            "mismatched_rows": mismatched,
+        }
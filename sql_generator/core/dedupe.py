@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+去重模块 - 在生成语句之前以向量化方式删除工作表中完全重复的数据行
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, Iterator, Optional
+
+import pandas as pd
+
+from sql_generator.utils.diagnostics import Diagnostics
+
+# 去重模式：保留第一行、保留最后一行、存在重复行时报错且不生成语句
+DEDUPE_MODES = ["first", "last", "fail"]
+
+
+class RowDeduplicator:
+    """
+    重复数据行删除器
+
+    以工作表中的全部列（即表名及其配置列）比较各行，表名列参与比较，因此只有同一表的
+    完全相同的行才视为重复。整表去重使用 DataFrame.duplicated；流式去重保存已出现行的
+    64位哈希值，跨数据块识别重复行，只支持保留第一行和报错两种模式。
+    """
+
+    def __init__(self, mode: str, diagnostics: Diagnostics):
+        """
+        初始化去重器
+
+        Args:
+            mode: 去重模式，first、last 或 fail
+            diagnostics: 记录删除行数或重复行错误的诊断信息
+        """
+        if mode not in DEDUPE_MODES:
+            raise ValueError(f"不支持的去重模式: {mode}，可选 {', '.join(DEDUPE_MODES)}")
+        self.mode = mode
+        self.diagnostics = diagnostics
+        # 表名 -> 删除（或fail模式下发现）的重复行数
+        self.dropped: Dict[str, int] = Counter()
+        self._seen = set()
+
+    def drop(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        删除整张工作表中的重复行
+
+        Args:
+            df: 工作表数据（第一列为表名）
+
+        Returns:
+            去重后的数据（保留原始行索引）；fail模式下存在重复行时返回None
+        """
+        duplicated = df.duplicated(keep="last" if self.mode == "last" else "first")
+        df = self._apply(df, duplicated)
+        self._report()
+        return df
+
+    def iter_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        逐块删除重复行，与之前任一数据块中相同的行也视为重复
+
+        Args:
+            chunks: 工作表的DataFrame块
+
+        Returns:
+            去重后的数据块迭代器；fail模式下遇到重复行时停止（之前数据块生成的语句已经输出）
+        """
+        if self.mode == "last":
+            raise ValueError("流式生成不支持保留最后一行（last），请改用 first 或 fail")
+        for chunk in chunks:
+            hashes = pd.util.hash_pandas_object(chunk, index=False)
+            seen = self._seen
+            duplicated = hashes.duplicated() | pd.Series(
+                [value in seen for value in hashes.tolist()],
+                index=hashes.index,
+                dtype=bool,
+            )
+            seen.update(hashes[~duplicated].tolist())
+            chunk = self._apply(chunk, duplicated)
+            if chunk is None:
+                return
+            yield chunk
+        self._report()
+
+    def _apply(self, df: pd.DataFrame, duplicated: pd.Series) -> Optional[pd.DataFrame]:
+        """按重复行标记累计各表的重复行数，删除重复行；fail模式下记录错误并返回None"""
+        if not duplicated.any():
+            return df
+        tables = df.iloc[:, 0][duplicated].astype(str).str.strip()
+        counts = tables.value_counts(sort=False)
+        self.dropped.update(counts.to_dict())
+        if self.mode == "fail":
+            for table, count in counts.items():
+                self.diagnostics.error(f"表 {table} 有 {count} 行完全重复的数据，已停止生成")
+            self.diagnostics.row_errors(df.index[duplicated], "数据与前面的行完全重复")
+            return None
+        return df[~duplicated.to_numpy()]
+
+    def _report(self):
+        """为每个删除了重复行的表添加一条提示"""
+        if self.mode == "fail":
+            return
+        for table, count in self.dropped.items():
+            self.diagnostics.info(f"表 {table} 删除了 {count} 行重复数据")
@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+"""
+增量生成模块 - 按行哈希比较重新上传的工作簿，只为变更或新增的行重新生成SQL语句
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from sql_generator.config.constants import BULK_CONFIG, EXCEL_SHEETS, SHEET_COLUMNS
+from sql_generator.core.bulk_engine import BulkSQLEngine, ValueTypes
+from sql_generator.core.parallel import SHEET_ORDER
+from sql_generator.utils.diagnostics import Diagnostics, GeneratedSQL
+from sql_generator.utils.file_utils import FileHandler
+from sql_generator.utils.output_buffer import SQLOutputBuffer
+
+# 各工作表的生成方法（参数与对应bulk_*方法的默认值相同）：(数据, 整张工作表的值类型) ->
+# (以原始行索引（合并多行的语句为该批第一行）为索引的语句列, 不合法的行索引列表)
+ROW_BUILDERS: Dict[
+    str, Callable[[pd.DataFrame, ValueTypes], Tuple[pd.Series, List[int]]]
+] = {
+    "create": lambda df, types: (BulkSQLEngine.create_statements(df), []),
+    "select": lambda df, types: (BulkSQLEngine.select_statements(df), []),
+    "insert": lambda df, types: BulkSQLEngine.insert_statements(df, types=types),
+    "update": lambda df, types: BulkSQLEngine.update_statements(
+        df, BULK_CONFIG["batch_size"], types=types
+    ),
+    "merge": lambda df, types: BulkSQLEngine.merge_statements(df, types=types),
+    "delete": lambda df, types: BulkSQLEngine.delete_statements(
+        df, BULK_CONFIG["batch_size"], types=types
+    ),
+    "truncate": lambda df, types: BulkSQLEngine.truncate_statements(df),
+}
+
+# 包含值列表的工作表，字面量类型按整张工作表推断
+VALUE_SHEETS = ["insert", "update", "merge", "delete"]
+
+# 同一(表名, 列名列表, 主键列表)的行合并为基于集合的语句的工作表（数据行格式）
+GROUPED_SHEETS = ["update", "delete"]
+
+# 状态文件的格式标识和版本，load 只接受相同格式和版本的文件
+STATE_FORMAT = "sql_generator.incremental"
+STATE_VERSION = 1
+
+
+class IncrementalGenerator:
+    """
+    增量SQL生成器
+
+    每个工作表保存上一次生成时各行的哈希值、所属的生成单元及各单元的语句；再次生成时只有包含
+    哈希值未出现过的行（变更或新增的行）的单元重新生成，其余单元直接复用，生成耗时与变更行数
+    而不是工作簿大小成正比。生成单元一般为单行；update和数据行格式的delete工作表按
+    (表名, 列名列表, 主键列表)合并为基于集合的语句，整组为一个单元，组内有行被删除时也重新生成。
+    值的类型每次按整张工作表推断并保存，某个(表名, 列名列表)的类型变化时其所有行重新生成，
+    因此全部语句与对应 bulk_* 方法按默认参数生成的结果相同。
+    """
+
+    def __init__(self, use_cache: bool = True):
+        """
+        初始化增量生成器
+
+        Args:
+            use_cache: 是否通过共享的工作簿缓存读取工作表
+        """
+        self.use_cache = use_cache
+        # 工作表类型 -> {'columns', 'hashes', 'rows': 行哈希 -> (生成单元, 值类型键),
+        #                'units': 生成单元 -> 语句元组, 'invalid': 不合法行的哈希,
+        #                'types': 整张工作表的值类型}
+        self.states: Dict[str, Dict[str, Any]] = {}
+        # 语句 -> 格式化后的语句（总大小不超过 format_cache_bytes）
+        self._formatted: Dict[str, str] = {}
+
+    @staticmethod
+    def row_hashes(df: pd.DataFrame) -> np.ndarray:
+        """
+        计算每行内容的64位哈希值（与行索引无关）
+
+        Args:
+            df: 工作表数据
+
+        Returns:
+            uint64哈希值数组
+        """
+        return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+    def generate(self, uploaded_file: Any, sheet: str) -> Dict[str, Any]:
+        """
+        增量生成单个工作表的SQL语句
+
+        Args:
+            uploaded_file: 上传的文件或文件路径
+            sheet: 工作表类型
+
+        Returns:
+            {'statements': 全部语句, 'delta': 重新生成的单元的语句（均为GeneratedSQL，共用诊断信息）,
+             'changed_rows': 重新生成的行数, 'reused_rows': 复用语句的行数, 'removed_rows', 'seconds'}
+        """
+        start = time.perf_counter()
+        diagnostics = Diagnostics()
+        df = FileHandler.read_table(
+            uploaded_file,
+            EXCEL_SHEETS[sheet],
+            SHEET_COLUMNS.get(sheet),
+            self.use_cache,
+            diagnostics,
+        )
+        if df is None:
+            return self._result(
+                GeneratedSQL([], diagnostics),
+                GeneratedSQL([], diagnostics),
+                0,
+                0,
+                0,
+                start,
+            )
+        diagnostics.rows += len(df)
+
+        hashes = self.row_hashes(df)
+        state = self.states.get(sheet)
+        if (
+            state is None
+            or state["columns"] != list(df.columns)
+            or "units" not in state
+        ):
+            # 首次生成或列结构变化时全部重新生成
+            state = {
+                "columns": list(df.columns),
+                "hashes": np.array([], dtype=np.uint64),
+                "rows": {},
+                "units": {},
+                "invalid": set(),
+                "types": {},
+            }
+        known = np.fromiter(state["rows"], dtype=np.uint64, count=len(state["rows"]))
+        changed = ~np.isin(hashes, known)
+        if sheet == "create" and BulkSQLEngine.long_create_columns(df) is not None:
+            # 长表格式的一条语句由同一表的多行字段组成，无法逐行复用，全部重新生成
+            changed[:] = True
+        removed = state["hashes"][~np.isin(state["hashes"], hashes)]
+
+        types = BulkSQLEngine.value_types(df, sheet) if sheet in VALUE_SHEETS else {}
+        retyped = {
+            key
+            for key in types.keys() | state["types"].keys()
+            if types.get(key) != state["types"].get(key)
+        }
+
+        # 只保留本次仍存在的行，被删除的行不再占用内存
+        rows = {
+            row_hash: state["rows"][row_hash] for row_hash in hashes[~changed].tolist()
+        }
+        rows.update(self._row_units(df[changed], hashes[changed], sheet))
+        units = [rows[row_hash][0] for row_hash in hashes.tolist()]
+
+        # 需要重新生成的单元：包含变更行、被删除行（合并多行的单元）或值类型发生变化的单元
+        dirty = {rows[row_hash][0] for row_hash in hashes[changed].tolist()}
+        dirty.update(
+            state["rows"][row_hash][0]
+            for row_hash in removed.tolist()
+            if isinstance(state["rows"][row_hash][0], tuple)
+        )
+        if retyped:
+            dirty.update(
+                unit for unit, type_key in rows.values() if type_key in retyped
+            )
+        regenerate = np.fromiter(
+            (unit in dirty for unit in units), dtype=bool, count=len(units)
+        )
+
+        statements, mismatched = ROW_BUILDERS[sheet](df[regenerate], types)
+        unit_of = dict(
+            zip(
+                df.index[regenerate],
+                (unit for unit, flag in zip(units, regenerate) if flag),
+            )
+        )
+        # 内容相同的行共用一个单行单元，单元只保存第一行的语句，_collect 按行各输出一次
+        first_rows = {}
+        for index, unit in unit_of.items():
+            first_rows.setdefault(unit, index)
+        unit_statements = {unit: state["units"][unit] for unit in set(units) - dirty}
+        by_unit: Dict[Any, List[str]] = {unit: [] for unit in dirty}
+        for index, statement in zip(statements.index, statements.to_numpy()):
+            unit = unit_of[index]
+            if isinstance(unit, tuple) or first_rows[unit] == index:
+                by_unit[unit].append(statement)
+        unit_statements.update(
+            (unit, tuple(unit_list)) for unit, unit_list in by_unit.items()
+        )
+
+        regenerated_hashes = hashes[regenerate].tolist()
+        mismatched = set(mismatched)
+        invalid = state["invalid"] & (rows.keys() - set(regenerated_hashes))
+        invalid.update(
+            row_hash
+            for index, row_hash in zip(df.index[regenerate], regenerated_hashes)
+            if index in mismatched
+        )
+        if invalid:
+            diagnostics.row_errors(
+                df.index[np.isin(hashes, list(invalid))], "配置不合法，未生成语句"
+            )
+        self.states[sheet] = {
+            "columns": state["columns"],
+            "hashes": hashes,
+            "rows": rows,
+            "units": {unit: unit_statements[unit] for unit in units},
+            "invalid": invalid,
+            "types": types,
+        }
+
+        full = self._collect(units, unit_statements)
+        delta = self._collect(
+            [unit for unit, flag in zip(units, regenerate) if flag], unit_statements
+        )
+        changed_rows = int(regenerate.sum())
+        return self._result(
+            GeneratedSQL(full, diagnostics),
+            GeneratedSQL(delta, diagnostics),
+            changed_rows,
+            len(df) - changed_rows,
+            len(removed),
+            start,
+        )
+
+    @staticmethod
+    def _row_units(
+        df: pd.DataFrame, hashes: np.ndarray, sheet: str
+    ) -> Dict[int, Tuple[Any, Any]]:
+        """
+        确定每行所属的生成单元和值类型键
+
+        Args:
+            df: 变更或新增的行
+            hashes: 这些行的哈希值
+            sheet: 工作表类型
+
+        Returns:
+            行哈希 -> (生成单元, 值类型键)：生成单元为行哈希，合并多行的工作表为(表名, 列名列表, 主键列表)；
+            值类型键为(表名, 列名列表)，没有值列表或不合法的行为None
+        """
+        units = {row_hash: (row_hash, None) for row_hash in hashes.tolist()}
+        if sheet not in VALUE_SHEETS or df.empty:
+            return units
+        parsed = BulkSQLEngine.value_rows(df, sheet)
+        grouped = sheet in GROUPED_SHEETS and "keys" in parsed.columns
+        row_hashes = pd.Series(hashes, index=df.index)[parsed.index].tolist()
+        keys = parsed["keys"] if grouped else parsed["table"]
+        for row_hash, table, columns, key in zip(
+            row_hashes, parsed["table"], parsed["columns"], keys
+        ):
+            units[row_hash] = (
+                (table, columns, key) if grouped else row_hash,
+                (table, columns),
+            )
+        return units
+
+    @staticmethod
+    def _collect(
+        units: List[Any], unit_statements: Dict[Any, Tuple[str, ...]]
+    ) -> List[str]:
+        """按行顺序拼接各单元的语句：单行单元每行输出一次，合并多行的单元只在第一次出现时输出"""
+        statements, emitted = [], set()
+        for unit in units:
+            if isinstance(unit, tuple):
+                if unit in emitted:
+                    continue
+                emitted.add(unit)
+            statements.extend(unit_statements[unit])
+        return statements
+
+    def generate_workbook(
+        self, workbook: Any, sheets: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        增量生成工作簿中各工作表的SQL语句
+
+        Args:
+            workbook: 上传的Excel文件或文件路径
+            sheets: 需要生成的工作表类型，默认为工作簿中存在的全部类型
+
+        Returns:
+            按SHEET_ORDER排列的字典：工作表类型 -> generate 的结果
+        """
+        if sheets is None:
+            available = set(FileHandler.get_sheet_names(workbook))
+            sheets = [
+                sheet for sheet in SHEET_ORDER if EXCEL_SHEETS[sheet] in available
+            ]
+        return OrderedDict(
+            (sheet, self.generate(workbook, sheet))
+            for sheet in SHEET_ORDER
+            if sheet in sheets
+        )
+
+    def formatted(self, statements: List[str]) -> SQLOutputBuffer:
+        """
+        格式化语句并以空行连接写入输出缓冲区，只格式化上一次调用中没有出现过的语句
+
+        格式化结果逐条写入缓冲区；缓存的格式化语句总大小不超过 BULK_CONFIG['format_cache_bytes']，
+        超出部分下次调用时重新格式化。
+
+        Args:
+            statements: SQL语句列表
+
+        Returns:
+            写入了格式化脚本的缓冲区（超过阈值时溢出到临时文件）
+        """
+        from sql_generator.core.sql_generator import SQLGenerator
+
+        generator = SQLGenerator(use_cache=self.use_cache)
+        cache, self._formatted = self._formatted, {}
+        cached_bytes = 0
+        buffer = SQLOutputBuffer()
+        for index, statement in enumerate(statements):
+            formatted = cache.get(statement) or generator.sql_formatted([statement])
+            if (
+                statement not in self._formatted
+                and cached_bytes + len(formatted) <= BULK_CONFIG["format_cache_bytes"]
+            ):
+                self._formatted[statement] = formatted
+                cached_bytes += len(formatted)
+            if index:
+                buffer.write(b"\n\n")
+            buffer.write(formatted.encode("utf-8"))
+        return buffer
+
+    def reset(self, sheet: Optional[str] = None):
+        """
+        清除保存的哈希值和语句，下次生成时全部重新生成
+
+        Args:
+            sheet: 工作表类型，默认为全部工作表
+        """
+        if sheet is None:
+            self.states.clear()
+            self._formatted.clear()
+        else:
+            self.states.pop(sheet, None)
+
+    def save(self, path: str):
+        """
+        将保存的状态以JSON写入文件，供下次运行（如命令行）继续增量生成
+
+        格式化语句的缓存不写入文件。
+
+        Args:
+            path: 状态文件路径
+        """
+        states = {
+            sheet: self._encode_state(state) for sheet, state in self.states.items()
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"format": STATE_FORMAT, "version": STATE_VERSION, "states": states},
+                f,
+                ensure_ascii=False,
+            )
+
+    @classmethod
+    def load(cls, path: str, use_cache: bool = True) -> "IncrementalGenerator":
+        """
+        从状态文件恢复增量生成器
+
+        Args:
+            path: save 写入的状态文件路径
+            use_cache: 是否通过共享的工作簿缓存读取工作表
+
+        Returns:
+            增量生成器
+
+        Raises:
+            ValueError: 文件不是当前版本的状态文件或内容不合法
+        """
+        generator = cls(use_cache)
+        with open(path, "rb") as f:
+            try:
+                data = json.loads(f.read().decode("utf-8"))
+            except ValueError:
+                raise ValueError(f"{path} 不是增量生成的状态文件") from None
+        if not isinstance(data, dict) or data.get("format") != STATE_FORMAT:
+            raise ValueError(f"{path} 不是增量生成的状态文件")
+        if data.get("version") != STATE_VERSION:
+            raise ValueError(f"{path} 的状态文件版本 {data.get('version')} 不受支持，请删除后重新生成")
+        try:
+            generator.states = {
+                sheet: cls._decode_state(state)
+                for sheet, state in data["states"].items()
+                if sheet in ROW_BUILDERS
+            }
+        except (AttributeError, KeyError, TypeError, ValueError):
+            raise ValueError(f"{path} 中的增量生成状态不合法") from None
+        return generator
+
+    @staticmethod
+    def _encode_state(state: Dict[str, Any]) -> Dict[str, Any]:
+        """将单个工作表的状态转换为可写入JSON的结构：合并多行的单元和值类型键写为列表"""
+
+        def encode(key: Any) -> Any:
+            return list(key) if isinstance(key, tuple) else key
+
+        return {
+            "columns": state["columns"],
+            "hashes": state["hashes"].tolist(),
+            "rows": [
+                [row_hash, encode(unit), encode(type_key)]
+                for row_hash, (unit, type_key) in state["rows"].items()
+            ],
+            "units": [
+                [encode(unit), list(statements)]
+                for unit, statements in state["units"].items()
+            ],
+            "invalid": sorted(state["invalid"]),
+            "types": [
+                [table, columns, types]
+                for (table, columns), types in state["types"].items()
+            ],
+        }
+
+    @staticmethod
+    def _decode_state(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        从JSON结构恢复单个工作表的状态，并校验各字段的类型和单元的引用
+
+        Raises:
+            ValueError: 字段类型不合法或行引用了不存在的单元
+        """
+
+        def row_hash(value: Any) -> int:
+            if type(value) is not int or not 0 <= value < 2**64:
+                raise ValueError(f"不合法的行哈希: {value!r}")
+            return value
+
+        def strings(values: Any, size: Optional[int] = None) -> List[str]:
+            if (
+                not isinstance(values, list)
+                or not all(isinstance(value, str) for value in values)
+                or size is not None
+                and len(values) != size
+            ):
+                raise ValueError(f"不合法的字符串列表: {values!r}")
+            return values
+
+        def unit_key(value: Any) -> Any:
+            return (
+                tuple(strings(value, 3)) if isinstance(value, list) else row_hash(value)
+            )
+
+        def type_key(value: Any) -> Optional[Tuple[str, str]]:
+            return None if value is None else tuple(strings(value, 2))
+
+        units = {
+            unit_key(unit): tuple(strings(statements))
+            for unit, statements in data["units"]
+        }
+        rows = {
+            row_hash(value): (unit_key(unit), type_key(key))
+            for value, unit, key in data["rows"]
+        }
+        hashes = [row_hash(value) for value in data["hashes"]]
+        if any(unit not in units for unit, _ in rows.values()) or any(
+            value not in rows for value in hashes
+        ):
+            raise ValueError("状态中的行哈希、行和生成单元不一致")
+        return {
+            "columns": strings(data["columns"]),
+            "hashes": np.array(hashes, dtype=np.uint64),
+            "rows": rows,
+            "units": units,
+            "invalid": {row_hash(value) for value in data["invalid"]},
+            "types": {
+                tuple(strings([table, columns])): strings(types)
+                for table, columns, types in data["types"]
+            },
+        }
+
+    @staticmethod
+    def _result(
+        statements: GeneratedSQL,
+        delta: GeneratedSQL,
+        changed_rows: int,
+        reused_rows: int,
+        removed_rows: int,
+        start: float,
+    ) -> Dict[str, Any]:
+        """组装 generate 的返回结果"""
+        return {
+            "statements": statements,
+            "delta": delta,
+            "changed_rows": changed_rows,
+            "reused_rows": reused_rows,
+            "removed_rows": removed_rows,
+            "seconds": time.perf_counter() - start,
+        }
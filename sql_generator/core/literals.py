@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+SQL字面量渲染模块 - 按列推断值的SQL类型，并以向量化方式渲染为带类型的字面量
+"""
+
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# 视为NULL的值（不区分大小写；'nan'/'none' 来自缺失值转换成的字符串）
+NULL_MARKERS = {"", "null", "nan", "none"}
+
+# 按优先级排列的 (类型, 正则, 日期解析格式)；整数不允许前导零，如邮编 "007" 仍按文本处理
+_TYPE_PATTERNS = [
+    ("integer", r"[+-]?(?:0|[1-9]\d*)", None),
+    ("decimal", r"[+-]?(?:(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|\.\d+)", None),
+    ("date", r"\d{4}-\d{2}-\d{2}", "%Y-%m-%d"),
+    ("timestamp", r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?", "ISO8601"),
+]
+
+# 推断出某类型的一组值还符合的类型（按优先级）；两组值合并后的类型为双方都符合的第一个类型
+_COMPATIBLE_TYPES = {
+    "null": ["null", "integer", "decimal", "date", "timestamp", "text"],
+    "integer": ["integer", "decimal", "text"],
+    "decimal": ["decimal", "text"],
+    "date": ["date", "text"],
+    "timestamp": ["timestamp", "text"],
+    "text": ["text"],
+}
+
+# (类型, 类型) -> 合并后的类型
+_WIDENED = {
+    (first, second): next(
+        sql_type for sql_type in compatible if sql_type in _COMPATIBLE_TYPES[second]
+    )
+    for first, compatible in _COMPATIBLE_TYPES.items()
+    for second in _COMPATIBLE_TYPES
+}
+
+
+class SQLLiteralRenderer:
+    """带类型的SQL字面量渲染器"""
+
+    NULL_MARKERS = NULL_MARKERS
+
+    @staticmethod
+    def null_mask(values: pd.Series) -> pd.Series:
+        """
+        判断每个值是否为NULL
+
+        Args:
+            values: 值列
+
+        Returns:
+            布尔列，缺失值及 NULL/nan/None/空字符串 为True
+        """
+        text = values.astype(str).str.strip().str.lower()
+        return (values.isna() | text.isin(NULL_MARKERS)).astype(bool)
+
+    @staticmethod
+    def infer_type(values: pd.Series) -> str:
+        """
+        根据一列中的全部非NULL值推断该列的SQL类型
+
+        只有所有值都符合同一类型时才采用该类型，否则按文本处理。
+
+        Args:
+            values: 值列
+
+        Returns:
+            'null'、'integer'、'decimal'、'date'、'timestamp' 或 'text'
+        """
+        nulls = SQLLiteralRenderer.null_mask(values)
+        if nulls.all():
+            return "null"
+        text = values.astype(str).str.strip()
+        return SQLLiteralRenderer._row_types(text, nulls).iloc[0]
+
+    @staticmethod
+    def group_types(values: pd.Series, groups: pd.Series) -> pd.Series:
+        """
+        按组推断一列值的SQL类型（与 infer_type 对每组分别调用的结果相同）
+
+        Args:
+            values: 值列
+            groups: 与values索引相同的分组列（如表名）
+
+        Returns:
+            以组名为索引的类型列，整组均为NULL时为 'null'
+        """
+        nulls = SQLLiteralRenderer.null_mask(values)
+        text = values.astype(str).str.strip()
+        types = (
+            SQLLiteralRenderer._row_types(text, nulls, groups)
+            .groupby(groups, sort=False)
+            .first()
+        )
+        return types.where(~nulls.groupby(groups, sort=False).all(), "null")
+
+    @staticmethod
+    def widen(first: str, second: str) -> str:
+        """
+        合并两组值分别推断出的类型，结果与对两组值一起推断的类型相同，如 integer 和 decimal -> decimal，
+        integer 和 text -> text，date 和 timestamp -> text
+
+        Args:
+            first: 第一组值的类型
+            second: 第二组值的类型
+
+        Returns:
+            合并后的类型
+        """
+        return _WIDENED[(first, second)]
+
+    @staticmethod
+    def render(
+        values: pd.Series,
+        sql_type: Union[str, pd.Series, None] = None,
+        dialect: str = "ansi",
+        groups: Optional[pd.Series] = None,
+    ) -> pd.Series:
+        """
+        将一列值渲染为SQL字面量
+
+        数值不加引号；日期和时间渲染为 DATE '...' / TIMESTAMP '...'（sqlite不支持该语法，
+        渲染为普通字符串）；文本加单引号并将内部的单引号转义为两个单引号；NULL值渲染为NULL。
+
+        Args:
+            values: 值列
+            sql_type: SQL类型，None时自动推断；为与values索引相同的类型列时（如整张工作表推断出的类型），
+                每行取该类型与自动推断类型合并后的类型
+            dialect: 目标数据库方言，ansi、postgresql、mysql或sqlite
+            groups: 与values索引相同的分组列（如表名），自动推断时每组分别推断一次类型
+
+        Returns:
+            与输入索引相同的字面量列
+        """
+        text = values.astype(str).str.strip()
+        nulls = SQLLiteralRenderer.null_mask(values)
+        if sql_type is None:
+            types = SQLLiteralRenderer._row_types(text, nulls, groups)
+        elif isinstance(sql_type, pd.Series):
+            inferred = SQLLiteralRenderer._row_types(text, nulls, groups)
+            known = sql_type.reindex(values.index).fillna("null").astype(object)
+            codes, pairs = pd.factorize(pd.MultiIndex.from_arrays([known, inferred]))
+            types = pd.Series(
+                np.asarray([_WIDENED[pair] for pair in pairs], dtype=object)[codes],
+                index=values.index,
+            )
+        else:
+            types = pd.Series(sql_type, index=values.index, dtype=object)
+
+        rendered = text.astype(object)
+        for kind in ("date", "timestamp"):
+            rows = (types == kind).to_numpy()
+            if rows.any():
+                literal = text[rows]
+                if kind == "timestamp":
+                    literal = literal.str.replace("T", " ", n=1, regex=False)
+                prefix = "'" if dialect == "sqlite" else f"{kind.upper()} '"
+                rendered[rows] = prefix + literal + "'"
+        rows = (types == "text").to_numpy()
+        if rows.any():
+            rendered[rows] = "'" + text[rows].str.replace("'", "''", regex=False) + "'"
+        return rendered.where(~nulls, "NULL")
+
+    @staticmethod
+    def render_frame(
+        frame: pd.DataFrame,
+        dialect: str = "ansi",
+        groups: Optional[pd.Series] = None,
+        types: Optional[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
+        """
+        按列推断类型并渲染整张表的值
+
+        Args:
+            frame: 每列为同一字段取值的DataFrame
+            dialect: 目标数据库方言
+            groups: 分组列，每组的每列分别推断一次类型
+            types: 与frame列名和索引相同的已知类型（见 render 的 sql_type），可选
+
+        Returns:
+            列名和索引不变的字面量DataFrame
+        """
+        return pd.DataFrame(
+            {
+                column: SQLLiteralRenderer.render(
+                    values, None if types is None else types[column], dialect, groups
+                )
+                for column, values in frame.items()
+            },
+            index=frame.index,
+        )
+
+    @staticmethod
+    def _row_types(
+        text: pd.Series, nulls: pd.Series, groups: Optional[pd.Series] = None
+    ) -> pd.Series:
+        """
+        确定每行值采用的类型：对整列每种类型只做一次正则匹配，再按组判断是否全部符合
+
+        Args:
+            text: 去除首尾空白的字符串值列
+            nulls: NULL标记
+            groups: 分组列，None表示整列为一组
+
+        Returns:
+            每行的类型名列，同一组内取值相同
+        """
+        types = pd.Series("text", index=text.index, dtype=object)
+        undecided = pd.Series(True, index=text.index)
+        for sql_type, pattern, date_format in _TYPE_PATTERNS:
+            matched = text.str.fullmatch(pattern).fillna(False).astype(bool)
+            if date_format and matched.any():
+                # 排除格式正确但日期不存在的值，如 2025-02-30
+                parsed = pd.to_datetime(
+                    text[matched], format=date_format, errors="coerce"
+                )
+                matched[matched] = parsed.notna().to_numpy()
+            accepted = matched | nulls
+            if groups is None:
+                accepted = pd.Series(bool(accepted.all()), index=text.index)
+            else:
+                accepted = (
+                    accepted.groupby(groups, sort=False).transform("all").astype(bool)
+                )
+            chosen = undecided & accepted
+            types[chosen] = sql_type
+            undecided &= ~chosen
+            if not undecided.any():
+                break
+        return types
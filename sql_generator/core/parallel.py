@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+并行生成模块 - 在进程池中并行生成工作簿各工作表的SQL语句
+"""
+
+import io
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from sql_generator.config.constants import EXCEL_SHEETS
+from sql_generator.core.bulk_engine import BulkSQLEngine, InsertBatcher
+from sql_generator.utils.diagnostics import GeneratedSQL
+from sql_generator.utils.file_utils import FileHandler
+from sql_generator.utils.workbook_cache import WorkbookCache
+
+try:
+    import pyarrow as pa
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# 合并结果时的工作表顺序（先建表，再查询和数据操作）
+SHEET_ORDER = ["create", "select", "insert", "update", "merge", "delete", "truncate"]
+
+# 行分块并行时各语句类型需要的列数
+ROW_BUILDER_COLUMNS = {"select": 2, "insert": 3}
+
+# 保存原始行索引的列名
+_INDEX_COLUMN = "__row_index__"
+
+
+def _generate_sheet(
+    sheet: str, data: bytes, options: Dict[str, Any]
+) -> Tuple[GeneratedSQL, float, Optional[str]]:
+    """
+    在工作进程中生成单个工作表的SQL语句（只解析该工作表）
+
+    Args:
+        sheet: 工作表类型
+        data: 工作簿文件内容
+        options: 传给对应bulk_*方法的参数
+
+    Returns:
+        (带诊断信息的语句列表, 耗时秒数, 错误信息)
+    """
+    from sql_generator.core.sql_generator import SQLGenerator
+
+    start = time.perf_counter()
+    try:
+        generator = SQLGenerator(use_cache=False)
+        statements = getattr(generator, f"bulk_{sheet}")(io.BytesIO(data), **options)
+        error = None
+    except Exception as e:
+        statements, error = GeneratedSQL(), str(e)
+    return statements, time.perf_counter() - start, error
+
+
+def generate_workbook(
+    workbook: Any,
+    sheets: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    options: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    并行生成工作簿中各工作表的SQL语句
+
+    Args:
+        workbook: 文件路径、文件对象或字节串
+        sheets: 需要生成的工作表类型，默认为工作簿中存在的全部类型（非Excel文件必须指定）
+        max_workers: 最大进程数；为1时在当前进程中顺序生成
+        options: 各工作表生成方法的额外参数
+
+    Returns:
+        按SHEET_ORDER排列的字典：工作表类型 -> {'statements', 'seconds', 'error', 'diagnostics'}
+    """
+    data = WorkbookCache.read_bytes(workbook)
+    options = options or {}
+    if sheets is None:
+        if FileHandler.detect_format(io.BytesIO(data)) != "excel":
+            raise ValueError("CSV/Parquet/Arrow文件只包含一张表，需要指定工作表类型")
+        available = set(FileHandler.get_sheet_names(io.BytesIO(data)))
+        sheets = [sheet for sheet in SHEET_ORDER if EXCEL_SHEETS[sheet] in available]
+    sheets = [sheet for sheet in SHEET_ORDER if sheet in sheets]
+
+    if max_workers is None:
+        max_workers = min(len(sheets), os.cpu_count() or 1)
+
+    outputs = {}
+    if max_workers <= 1 or len(sheets) <= 1:
+        for sheet in sheets:
+            outputs[sheet] = _generate_sheet(sheet, data, options.get(sheet, {}))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                sheet: executor.submit(
+                    _generate_sheet, sheet, data, options.get(sheet, {})
+                )
+                for sheet in sheets
+            }
+            for sheet, future in futures.items():
+                outputs[sheet] = future.result()
+
+    results = OrderedDict()
+    for sheet in sheets:
+        statements, seconds, error = outputs[sheet]
+        results[sheet] = {
+            "statements": list(statements),
+            "seconds": seconds,
+            "error": error,
+            "diagnostics": statements.diagnostics,
+        }
+    return results
+
+
+def _build_rows(
+    kind: str, df: pd.DataFrame, options: Dict[str, Any]
+) -> Tuple[List[str], List[int]]:
+    """
+    为一段连续的行生成语句
+
+    Args:
+        kind: 语句类型，select或insert
+        df: 该段行数据
+        options: insert的 rows_per_statement、max_statement_bytes 参数，以及整张工作表的值类型 types
+
+    Returns:
+        (语句列表, 列名和值数量不匹配的行索引列表)
+    """
+    if kind == "select":
+        return BulkSQLEngine.select_statements(df).tolist(), []
+
+    batcher = InsertBatcher(
+        options.get("rows_per_statement", 1), options.get("max_statement_bytes")
+    )
+    if batcher.rows_per_statement == 1:
+        statements, mismatched = BulkSQLEngine.insert_statements(
+            df, types=options.get("types")
+        )
+        return statements.tolist(), mismatched
+    parts, mismatched = BulkSQLEngine.insert_parts(df, types=options.get("types"))
+    return list(batcher.add(parts)) + list(batcher.flush()), mismatched
+
+
+def _build_rows_from_shared(
+    kind: str, shm_name: str, start: int, length: int, options: Dict[str, Any]
+) -> Tuple[List[str], List[int]]:
+    """
+    在工作进程中从共享内存读取Arrow数据的指定行范围并生成语句（数据不经过pickle）
+
+    Args:
+        kind: 语句类型
+        shm_name: 共享内存块名称
+        start: 起始行
+        length: 行数
+        options: 生成参数
+
+    Returns:
+        (语句列表, 列名和值数量不匹配的行索引列表)
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        return _build_rows(kind, _read_shared_rows(shm, start, length), options)
+    finally:
+        shm.close()
+
+
+def _read_shared_rows(
+    shm: shared_memory.SharedMemory, start: int, length: int
+) -> pd.DataFrame:
+    """从共享内存中的Arrow IPC流读取指定行范围，转换为以原始行号为索引的DataFrame"""
+    table = pa.ipc.open_stream(pa.py_buffer(shm.buf)).read_all().slice(start, length)
+    df = table.to_pandas(types_mapper={pa.string(): pd.StringDtype("python")}.get)
+    df = df.set_index(_INDEX_COLUMN)
+    df.index.name = None
+    return df
+
+
+def _row_ranges(rows: int, parts: int) -> List[Tuple[int, int]]:
+    """将行数平均切分为若干 (起始行, 行数) 区间"""
+    size = -(-rows // parts)
+    return [(start, min(size, rows - start)) for start in range(0, rows, size)]
+
+
+def generate_rows_parallel(
+    kind: str, df: pd.DataFrame, workers: int, options: Optional[Dict[str, Any]] = None
+) -> Tuple[List[str], List[int]]:
+    """
+    将单个工作表按行切分，在多个进程中并行生成语句并按原顺序拼接
+
+    数据以Arrow IPC格式写入一块共享内存，各工作进程按行范围零拷贝读取；
+    未安装pyarrow时退回为向工作进程传递DataFrame分片。
+    insert的值类型在分片前对整张工作表推断一次，各分片的字面量写法与不分片时相同；
+    多行INSERT在各分片内独立合并，分片边界处可能多出一条未满的语句。
+
+    Args:
+        kind: 语句类型，select或insert
+        df: 工作表数据
+        workers: 工作进程数
+        options: insert的 rows_per_statement、max_statement_bytes 参数
+
+    Returns:
+        (语句列表, 列名和值数量不匹配的行索引列表)
+    """
+    options = options or {}
+    data = df.iloc[:, : ROW_BUILDER_COLUMNS[kind]]
+    if workers <= 1 or len(data) < workers:
+        return _build_rows(kind, data, options)
+
+    if kind == "insert":
+        options = dict(options, types=BulkSQLEngine.value_types(data))
+    ranges = _row_ranges(len(data), workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if ARROW_AVAILABLE:
+            table = _to_arrow(data)
+            shm = _write_shared(table)
+            del table
+            try:
+                futures = [
+                    executor.submit(
+                        _build_rows_from_shared, kind, shm.name, start, length, options
+                    )
+                    for start, length in ranges
+                ]
+                outputs = [future.result() for future in futures]
+            finally:
+                shm.close()
+                shm.unlink()
+        else:
+            futures = [
+                executor.submit(
+                    _build_rows, kind, data.iloc[start : start + length], options
+                )
+                for start, length in ranges
+            ]
+            outputs = [future.result() for future in futures]
+
+    statements, mismatched = [], []
+    for chunk_statements, chunk_mismatched in outputs:
+        statements.extend(chunk_statements)
+        mismatched.extend(chunk_mismatched)
+    return statements, mismatched
+
+
+def _to_arrow(data: pd.DataFrame) -> "pa.Table":
+    """将工作表列转换为字符串类型的Arrow表，并保留原始行索引"""
+    arrays = [_column_to_arrow(column) for _, column in data.items()]
+    arrays.append(pa.array(data.index.to_numpy(), type=pa.int64()))
+    names = [str(column) for column in data.columns] + [_INDEX_COLUMN]
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def _column_to_arrow(column: pd.Series) -> "pa.Array":
+    """将一列转换为Arrow字符串数组，已是字符串类型的列直接转换，避免逐个元素转为Python对象"""
+    if isinstance(column.dtype, pd.StringDtype):
+        return pa.array(column, type=pa.string())
+    values = column.astype(str).to_numpy(dtype=object)
+    return pa.array(values, mask=column.isna().to_numpy(), type=pa.string())
+
+
+def _write_shared(table: "pa.Table") -> shared_memory.SharedMemory:
+    """将Arrow表以IPC流格式直接写入新建的共享内存块"""
+    sink = pa.MockOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, sink.size()))
+    with pa.ipc.new_stream(
+        pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf)), table.schema
+    ) as writer:
+        writer.write_table(table)
+    return shm
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+参数化输出模块 - 每个(表名, 列名列表)生成一条带占位符的INSERT语句，数据行写入参数文件，
+供加载程序以 executemany 或服务端预编译语句执行
+"""
+
+import csv
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from sql_generator.core.bulk_engine import BulkSQLEngine, ValueTypes
+from sql_generator.core.literals import SQLLiteralRenderer
+
+# 占位符风格：qmark 为 ?（sqlite3），format 为 %s（psycopg、PyMySQL），
+# dollar 为 $1（PostgreSQL PREPARE、asyncpg）
+PARAM_STYLES = ["qmark", "format", "dollar"]
+
+# 参数文件格式及对应扩展名
+PARAM_FORMATS = {"csv": "csv", "jsonl": "jsonl"}
+
+
+class ParameterizedWriter:
+    """
+    参数化语句和参数文件写入器
+
+    CSV参数文件第一行为列名，空字段表示NULL；JSON Lines参数文件每行为一个值数组，
+    NULL写为null，整列均为整数的值写为数字，其余值（包括小数，避免精度损失）写为字符串。
+    分块写入时由types给出整张工作表的值类型，各块对同一列的写法一致。
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        paramstyle: str = "qmark",
+        param_format: str = "csv",
+        types: Optional[ValueTypes] = None,
+    ):
+        """
+        初始化写入器
+
+        Args:
+            output_dir: 输出目录
+            paramstyle: 占位符风格，qmark、format或dollar
+            param_format: 参数文件格式，csv或jsonl
+            types: 整张工作表的值类型（见 BulkSQLEngine.value_types），可选
+        """
+        if paramstyle not in PARAM_STYLES:
+            raise ValueError(f"不支持的占位符风格: {paramstyle}")
+        if param_format not in PARAM_FORMATS:
+            raise ValueError(f"不支持的参数文件格式: {param_format}")
+
+        self.output_dir = output_dir
+        self.paramstyle = paramstyle
+        self.param_format = param_format
+        self.types = types
+        self.row_count = 0
+        # (表名, 列名列表) -> {'file', 'handle', 'writer', 'rows'}
+        self._targets: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def write_chunk(self, df: pd.DataFrame) -> List[int]:
+        """
+        写入一块insert工作表数据，按(表名, 列名列表)分别追加到各自的参数文件
+
+        Args:
+            df: insert工作表的DataFrame块
+
+        Returns:
+            列名和值数量不匹配的行索引列表
+        """
+        groups, mismatched = self.parameter_rows(df, self.types)
+        for table, columns, rows in groups:
+            target = self._target(table, columns)
+            if self.param_format == "csv":
+                target["writer"].writerows(
+                    [["" if value is None else value for value in row] for row in rows]
+                )
+            else:
+                target["handle"].writelines(
+                    json.dumps(row, ensure_ascii=False) + "\n" for row in rows
+                )
+            target["rows"] += len(rows)
+            self.row_count += len(rows)
+        return mismatched
+
+    @staticmethod
+    def parameter_rows(
+        df: pd.DataFrame, types: Optional[ValueTypes] = None
+    ) -> Tuple[List[Tuple[str, str, List[list]]], List[int]]:
+        """
+        将insert工作表数据按(表名, 列名列表)拆成参数行
+
+        NULL值为None，整列均为整数的值转换为int，其余值保留为字符串。列类型取types中
+        (表名, 列名列表)对应的类型与本块值推断出的类型合并后的类型，没有types时只按本块推断。
+
+        Args:
+            df: insert工作表的DataFrame块
+            types: 整张工作表的值类型，可选
+
+        Returns:
+            ([(表名, 规范化后的列名列表, 参数行列表)], 列名和值数量不匹配的行索引列表)
+        """
+        parts, mismatched = BulkSQLEngine.insert_parts(df)
+        if parts.empty:
+            return [], mismatched
+
+        groups = []
+        values = (
+            df.loc[parts.index].iloc[:, 2].astype(str).str.strip().str.split(r"\s*,\s*")
+        )
+        for (table, columns), group in values.groupby(
+            [parts["table"], parts["columns"]], sort=False
+        ):
+            frame = pd.DataFrame(group.tolist(), index=group.index)
+            nulls = frame.apply(SQLLiteralRenderer.null_mask)
+            known = (types or {}).get((table, columns), [])
+            fields = []
+            for column in frame.columns:
+                sql_type = SQLLiteralRenderer.infer_type(frame[column])
+                if len(known) == frame.shape[1]:
+                    sql_type = SQLLiteralRenderer.widen(known[column], sql_type)
+                convert = int if sql_type == "integer" else str
+                fields.append(
+                    [
+                        None if null else convert(value)
+                        for value, null in zip(
+                            frame[column].tolist(), nulls[column].tolist()
+                        )
+                    ]
+                )
+            groups.append((table, columns, [list(row) for row in zip(*fields)]))
+        return groups, mismatched
+
+    def close(self) -> Tuple[str, str, List[str]]:
+        """
+        关闭所有参数文件，写出语句脚本和清单
+
+        Returns:
+            (语句脚本路径, 清单路径, 参数文件路径列表)
+        """
+        lines = [f"-- 每条语句对应一个参数文件（{self.param_format}），由加载程序以 executemany 执行"]
+        manifest = []
+        parameter_files = []
+        for (table, columns), target in self._targets.items():
+            target["handle"].close()
+            statement = self.statement(table, columns, self.paramstyle)
+            parameter_files.append(os.path.join(self.output_dir, target["file"]))
+            lines.append(f"-- 参数文件: {target['file']}（{target['rows']} 行）\n{statement}")
+            manifest.append(
+                {
+                    "table": table,
+                    "columns": columns.split(", "),
+                    "statement": statement,
+                    "parameters": target["file"],
+                    "rows": target["rows"],
+                }
+            )
+        self._targets = {}
+
+        script_path = os.path.join(self.output_dir, "statements.sql")
+        with open(script_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        manifest_path = os.path.join(self.output_dir, "manifest.json")
+        with open(manifest_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "paramstyle": self.paramstyle,
+                    "format": self.param_format,
+                    "statements": manifest,
+                },
+                file,
+                ensure_ascii=False,
+                indent=2,
+            )
+        return script_path, manifest_path, parameter_files
+
+    @staticmethod
+    def statement(table: str, columns: str, paramstyle: str = "qmark") -> str:
+        """
+        生成带占位符的INSERT语句
+
+        Args:
+            table: 表名
+            columns: 规范化后的列名列表，如 "a, b"
+            paramstyle: 占位符风格
+
+        Returns:
+            参数化INSERT语句
+        """
+        count = len(columns.split(", "))
+        if paramstyle == "dollar":
+            placeholders = ", ".join(f"${number}" for number in range(1, count + 1))
+        else:
+            placeholders = ", ".join(["?" if paramstyle == "qmark" else "%s"] * count)
+        return f"INSERT INTO {table} ({columns}) VALUES ({placeholders});"
+
+    def _target(self, table: str, columns: str) -> Dict[str, Any]:
+        """获取(表名, 列名列表)对应的参数文件，首次使用时创建（CSV同时写入表头）"""
+        key = (table, columns)
+        if key not in self._targets:
+            base_name = re.sub(r"[^0-9A-Za-z_]+", "_", table).strip("_") or "data"
+            file_name = f"{base_name}_{len(self._targets) + 1}.{PARAM_FORMATS[self.param_format]}"
+            handle = open(
+                os.path.join(self.output_dir, file_name),
+                "w",
+                encoding="utf-8",
+                newline="",
+            )
+            writer = None
+            if self.param_format == "csv":
+                writer = csv.writer(handle, lineterminator="\n")
+                writer.writerow(columns.split(", "))
+            self._targets[key] = {
+                "file": file_name,
+                "handle": handle,
+                "writer": writer,
+                "rows": 0,
+            }
+        return self._targets[key]
+
+    @staticmethod
+    def write_all(
+        chunks: Iterable[pd.DataFrame],
+        output_dir: str,
+        paramstyle: str = "qmark",
+        param_format: str = "csv",
+        types: Optional[ValueTypes] = None,
+    ) -> Dict[str, Any]:
+        """
+        将所有数据块写成参数化语句、清单和参数文件
+
+        Args:
+            chunks: insert工作表的DataFrame块
+            output_dir: 输出目录
+            paramstyle: 占位符风格
+            param_format: 参数文件格式
+            types: 整张工作表的值类型，可选
+
+        Returns:
+            结果字典，包含 script、manifest、parameter_files、row_count、mismatched_rows
+        """
+        writer = ParameterizedWriter(output_dir, paramstyle, param_format, types)
+        mismatched = []
+        try:
+            for chunk in chunks:
+                mismatched.extend(writer.write_chunk(chunk))
+        finally:
+            script, manifest, parameter_files = writer.close()
+
+        return {
+            "script": script,
+            "manifest": manifest,
+            "parameter_files": parameter_files,
+            "row_count": writer.row_count,
+            "mismatched_rows": mismatched,
+        }
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+执行计划分析模块 - 在内存SQLite数据库中建立表结构和索引，对SELECT语句执行
+EXPLAIN QUERY PLAN，标记全表扫描、临时B树排序和需要自动索引（缺少索引）的查找
+"""
+
+import re
+import sqlite3
+from typing import Any, Dict, Iterable, List
+
+import pandas as pd
+
+from sql_generator.utils.diagnostics import Diagnostics
+
+# 定义索引的可选工作表（table, column, 可选 index_name、unique）
+INDEX_SHEET = "index"
+
+# 执行计划问题类型 -> 说明
+PLAN_ISSUES = {
+    "table_scan": "全表扫描",
+    "temp_btree": "使用临时B树",
+    "automatic_index": "缺少索引（自动创建临时索引）",
+}
+
+# 执行计划明细的匹配规则：问题类型 -> 正则（SQLite 3.36之前的版本输出 SCAN TABLE t）
+_PLAN_PATTERNS = {
+    "table_scan": re.compile(r"^SCAN (?:TABLE )?(?!CONSTANT ROW)(?!\()(?!SUBQUERY)\S+"),
+    "temp_btree": re.compile(r"USE TEMP B-TREE"),
+    "automatic_index": re.compile(r"AUTOMATIC (?:PARTIAL )?(?:COVERING )?INDEX"),
+}
+
+# 带schema前缀的CREATE TABLE语句
+_QUALIFIED_TABLE = re.compile(
+    r"^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\.\w+", re.IGNORECASE
+)
+
+# CREATE INDEX语句：SQLite要求schema前缀写在索引名上（CREATE INDEX s.idx ON t），而不是表名上
+_CREATE_INDEX = re.compile(
+    r"^\s*CREATE\s+(UNIQUE\s+)?INDEX\s+(IF\s+NOT\s+EXISTS\s+)?(\S+)\s+ON\s+(\S+?)\s*\(",
+    re.IGNORECASE,
+)
+
+# 分析的语句类型
+_QUERY_START = re.compile(r"^\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+
+
+class QueryPlanAnalyzer:
+    """
+    SELECT执行计划分析器
+
+    带schema前缀的表建在附加的同名内存数据库中。表中没有数据和统计信息，
+    计划只反映表结构和索引能否支持查询条件、连接和排序。
+    """
+
+    def __init__(self):
+        """初始化空的内存数据库"""
+        self.connection = sqlite3.connect(":memory:")
+        self._schemas = set()
+
+    def load_schema(
+        self,
+        create_statements: Iterable[str],
+        index_statements: Iterable[str],
+        diagnostics: Diagnostics,
+    ) -> int:
+        """
+        执行CREATE TABLE和CREATE INDEX语句
+
+        Args:
+            create_statements: CREATE TABLE语句
+            index_statements: CREATE INDEX语句（索引名或表名可带schema前缀）
+            diagnostics: 记录执行失败语句的诊断信息
+
+        Returns:
+            成功执行的语句数
+        """
+        executed = 0
+        for statement in create_statements:
+            qualified = _QUALIFIED_TABLE.match(statement)
+            if qualified:
+                self._attach(qualified.group(1))
+            executed += self._execute(statement, diagnostics)
+        for statement in index_statements:
+            executed += self._execute(self.sqlite_index(statement), diagnostics)
+        return executed
+
+    @staticmethod
+    def sqlite_index(statement: str) -> str:
+        """
+        将 CREATE INDEX idx ON s.t (...) 改写为SQLite的 CREATE INDEX s.idx ON t (...)，
+        并去掉SQLite不支持的 USING 子句
+
+        Args:
+            statement: CREATE INDEX语句
+
+        Returns:
+            SQLite可执行的语句
+        """
+        match = _CREATE_INDEX.match(statement)
+        if not match:
+            return statement
+        unique, if_not_exists, index, table = match.groups()
+        schema, _, name = table.rpartition(".")
+        if schema and "." not in index:
+            index = f"{schema}.{index}"
+        rest = re.sub(
+            r"\)\s*USING\s+\w+\s*;?\s*$",
+            ")",
+            statement[match.end() :],
+            flags=re.IGNORECASE,
+        )
+        return (
+            f"CREATE {unique or ''}INDEX {if_not_exists or ''}{index} ON {name} ({rest}"
+        )
+
+    @staticmethod
+    def index_statements(df: pd.DataFrame) -> List[str]:
+        """
+        由index工作表生成CREATE INDEX语句
+
+        工作表列为 table, column（逗号分隔的列名），可选 index_name 和 unique（是/true/1/y 表示唯一索引）。
+
+        Args:
+            df: index工作表数据
+
+        Returns:
+            CREATE INDEX语句列表
+        """
+        df = df.rename(columns=lambda column: str(column).strip().lower())
+        if "table" not in df.columns or "column" not in df.columns:
+            return []
+        df = df.astype(object).where(df.notna(), "")
+        statements = []
+        for _, row in df.iterrows():
+            table = str(row["table"]).strip()
+            index_columns = ", ".join(
+                part.strip() for part in str(row["column"]).split(",") if part.strip()
+            )
+            if not table or not index_columns:
+                continue
+            name = str(row.get("index_name", "")).strip()
+            if not name:
+                name = "idx_" + re.sub(
+                    r"\W+", "_", f"{table.rpartition('.')[2]}_{index_columns}"
+                ).strip("_")
+            unique = str(row.get("unique", "")).strip().lower() in (
+                "是",
+                "true",
+                "1",
+                "y",
+                "yes",
+            )
+            statements.append(
+                f"CREATE {'UNIQUE ' if unique else ''}INDEX {name} ON {table} ({index_columns});"
+            )
+        return statements
+
+    def explain(self, statement: str) -> Dict[str, Any]:
+        """
+        分析一条SELECT语句的执行计划
+
+        Args:
+            statement: SELECT（或WITH开头的）语句
+
+        Returns:
+            {'statement', 'plan': 计划明细列表,
+             'issues': [{'type', 'message', 'detail'}], 'error'}
+        """
+        result = {"statement": statement, "plan": [], "issues": [], "error": None}
+        try:
+            rows = self.connection.execute(
+                "EXPLAIN QUERY PLAN " + statement.strip().rstrip(";")
+            ).fetchall()
+        except sqlite3.Error as e:
+            result["error"] = str(e)
+            return result
+        for row in rows:
+            detail = row[-1]
+            result["plan"].append(detail)
+            for issue, pattern in _PLAN_PATTERNS.items():
+                if pattern.search(detail):
+                    result["issues"].append(
+                        {"type": issue, "message": PLAN_ISSUES[issue], "detail": detail}
+                    )
+        return result
+
+    def explain_all(self, statements: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        批量分析语句的执行计划，非SELECT语句被跳过
+
+        Args:
+            statements: SQL语句
+
+        Returns:
+            每条SELECT语句的分析结果
+        """
+        return [
+            self.explain(statement)
+            for statement in statements
+            if _QUERY_START.match(statement)
+        ]
+
+    def close(self):
+        """关闭数据库连接"""
+        self.connection.close()
+
+    def __enter__(self) -> "QueryPlanAnalyzer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _attach(self, schema: str):
+        """附加schema对应的内存数据库"""
+        if schema not in self._schemas:
+            self.connection.execute(f"ATTACH DATABASE ':memory:' AS {schema}")
+            self._schemas.add(schema)
+
+    def _execute(self, statement: str, diagnostics: Diagnostics) -> int:
+        """执行一条建表或建索引语句，失败时记录错误；返回成功执行的语句数"""
+        try:
+            self.connection.execute(statement)
+            return 1
+        except sqlite3.Error as e:
+            diagnostics.error(f"执行失败: {e}\n{statement}")
+            return 0
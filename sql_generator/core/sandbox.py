@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite试运行模块 - 在临时SQLite数据库中建表并执行生成的语句，测量不同生成方式的执行吞吐量
+"""
+
+import os
+import queue
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sql_generator.config.constants import BULK_CONFIG
+from sql_generator.utils.diagnostics import Diagnostics
+
+# CREATE TABLE语句中带schema前缀的表名，如 CREATE TABLE model_a.a
+_QUALIFIED_CREATE = re.compile(
+    r"^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\.(\w+)", re.IGNORECASE
+)
+_CREATE_TABLE = re.compile(
+    r"^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?([\w.]+)", re.IGNORECASE
+)
+
+# 每次试运行最多记录的执行失败语句数，其余只计数
+MAX_REPORTED_FAILURES = 5
+
+
+class ConnectionPool:
+    """
+    SQLite连接池
+
+    连接在第一次使用时创建，用完归还后被下一次执行复用，最多同时打开size个连接。
+    SQLite把 schema.table 中的前缀解释为附加数据库名，因此每个连接都附加各schema对应的数据库文件。
+    """
+
+    def __init__(self, path: str, size: int = BULK_CONFIG["sandbox_pool_size"]):
+        """
+        初始化连接池
+
+        Args:
+            path: 主数据库文件路径
+            size: 最多打开的连接数
+        """
+        self.path = path
+        self.size = max(1, int(size))
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._attached: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """取出一个连接（池中没有空闲连接且已达上限时等待），使用后归还"""
+        connection = self._acquire()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def attach(self, schema: str, path: str):
+        """
+        附加schema对应的数据库文件，已创建的空闲连接和之后新建的连接都会附加（调用时不应有正在使用的连接）
+
+        Args:
+            schema: schema名
+            path: 数据库文件路径
+        """
+        with self._lock:
+            if schema in self._attached:
+                return
+            self._attached[schema] = path
+            idle = []
+            while not self._idle.empty():
+                idle.append(self._idle.get())
+        for connection in idle:
+            connection.execute("ATTACH DATABASE ? AS " + schema, (path,))
+            self._idle.put(connection)
+
+    def close(self):
+        """关闭所有连接"""
+        with self._lock:
+            for connection in self._all:
+                connection.close()
+            self._all = []
+            self._idle = queue.LifoQueue()
+
+    def _acquire(self) -> sqlite3.Connection:
+        """取出空闲连接，必要时新建"""
+        with self._lock:
+            if self._idle.empty() and len(self._all) < self.size:
+                # 自动提交模式，由调用方显式开始和提交事务
+                connection = sqlite3.connect(
+                    self.path, isolation_level=None, check_same_thread=False
+                )
+                for schema, path in self._attached.items():
+                    connection.execute("ATTACH DATABASE ? AS " + schema, (path,))
+                self._all.append(connection)
+                return connection
+        return self._idle.get()
+
+
+class SQLiteSandbox:
+    """
+    SQLite试运行环境
+
+    在临时目录中建立数据库，执行CREATE语句建表，再以字面量语句（逐条执行）或参数化语句
+    （executemany按批执行）试运行，每次试运行在一个事务中完成并统计语句数、行数和耗时。
+    语句需按sqlite方言生成（日期字面量不带DATE/TIMESTAMP前缀）。
+    """
+
+    def __init__(
+        self,
+        pool_size: int = BULK_CONFIG["sandbox_pool_size"],
+        batch_size: int = BULK_CONFIG["batch_size"],
+    ):
+        """
+        初始化试运行环境
+
+        Args:
+            pool_size: 连接池大小
+            batch_size: executemany每批执行的参数行数
+        """
+        self.batch_size = max(1, int(batch_size))
+        self.directory = tempfile.mkdtemp(prefix="sql_generator_sandbox_")
+        self.pool = ConnectionPool(os.path.join(self.directory, "main.db"), pool_size)
+        # 已创建的表（含schema前缀）
+        self.tables: List[str] = []
+
+    def create_schema(self, statements: Iterable[str], diagnostics: Diagnostics) -> int:
+        """
+        执行CREATE TABLE语句建表，带schema前缀的表建在附加的同名数据库中
+
+        Args:
+            statements: CREATE TABLE语句
+            diagnostics: 记录建表失败的诊断信息
+
+        Returns:
+            成功创建的表数
+        """
+        created = 0
+        for statement in statements:
+            qualified = _QUALIFIED_CREATE.match(statement)
+            if qualified:
+                schema = qualified.group(1)
+                self.pool.attach(schema, os.path.join(self.directory, f"{schema}.db"))
+            try:
+                with self.pool.connection() as connection:
+                    connection.execute(statement)
+            except sqlite3.Error as e:
+                diagnostics.error(f"建表失败: {e}\n{statement}")
+                continue
+            table = _CREATE_TABLE.match(statement)
+            if table:
+                self.tables.append(table.group(1))
+            created += 1
+        return created
+
+    def clear(self):
+        """删除所有表中的数据，使各次试运行从空表开始"""
+        with self.pool.connection() as connection:
+            connection.execute("BEGIN")
+            for table in self.tables:
+                connection.execute(f"DELETE FROM {table}")
+            connection.execute("COMMIT")
+
+    def count_rows(self, table: str) -> int:
+        """返回表中的行数"""
+        with self.pool.connection() as connection:
+            return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def run(
+        self,
+        mode: str,
+        statements: Iterable[str],
+        diagnostics: Diagnostics,
+        rows: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        在一个事务中逐条执行字面量语句
+
+        Args:
+            mode: 试运行名称，如 "insert: 逐行"
+            statements: SQL语句
+            diagnostics: 记录执行失败语句的诊断信息
+            rows: 语句包含的数据行数，用于计算每秒行数；默认与语句数相同
+
+        Returns:
+            试运行结果，见 _result
+        """
+        statements = list(statements)
+        failed = 0
+        with self.pool.connection() as connection:
+            start = time.perf_counter()
+            connection.execute("BEGIN")
+            for number, statement in enumerate(statements, 1):
+                try:
+                    connection.execute(statement)
+                except sqlite3.Error as e:
+                    failed += 1
+                    self._failure(diagnostics, mode, failed, f"第 {number} 条语句执行失败: {e}")
+            connection.execute("COMMIT")
+            seconds = time.perf_counter() - start
+        return self._result(
+            mode,
+            len(statements),
+            len(statements) if rows is None else rows,
+            failed,
+            seconds,
+            diagnostics,
+        )
+
+    def run_many(
+        self,
+        mode: str,
+        groups: Iterable[Tuple[str, List[list]]],
+        diagnostics: Diagnostics,
+    ) -> Dict[str, Any]:
+        """
+        在一个事务中以executemany执行参数化语句，每条语句的参数行按batch_size分批
+
+        Args:
+            mode: 试运行名称
+            groups: (参数化语句, 参数行列表)
+            diagnostics: 记录执行失败批次的诊断信息
+
+        Returns:
+            试运行结果，语句数为不同的参数化语句数
+        """
+        groups = list(groups)
+        statements = rows = failed = 0
+        with self.pool.connection() as connection:
+            start = time.perf_counter()
+            connection.execute("BEGIN")
+            for statement, parameters in groups:
+                statements += 1
+                for offset in range(0, len(parameters), self.batch_size):
+                    batch = parameters[offset : offset + self.batch_size]
+                    try:
+                        connection.executemany(statement, batch)
+                        rows += len(batch)
+                    except sqlite3.Error as e:
+                        failed += 1
+                        self._failure(
+                            diagnostics, mode, failed, f"{statement} 执行失败: {e}"
+                        )
+            connection.execute("COMMIT")
+            seconds = time.perf_counter() - start
+        return self._result(mode, statements, rows, failed, seconds, diagnostics)
+
+    def execute(self, statement: str, diagnostics: Diagnostics) -> bool:
+        """
+        执行一条辅助语句（如创建唯一索引），失败时记录错误
+
+        Returns:
+            是否执行成功
+        """
+        try:
+            with self.pool.connection() as connection:
+                connection.execute(statement)
+            return True
+        except sqlite3.Error as e:
+            diagnostics.error(f"执行失败: {e}\n{statement}")
+            return False
+
+    def close(self):
+        """关闭连接并删除临时数据库"""
+        self.pool.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self) -> "SQLiteSandbox":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _failure(diagnostics: Diagnostics, mode: str, failed: int, message: str):
+        """记录前 MAX_REPORTED_FAILURES 条失败信息"""
+        if failed <= MAX_REPORTED_FAILURES:
+            diagnostics.error(f"{mode} {message}")
+
+    @staticmethod
+    def _result(
+        mode: str,
+        statements: int,
+        rows: int,
+        failed: int,
+        seconds: float,
+        diagnostics: Diagnostics,
+    ) -> Dict[str, Any]:
+        """
+        组装试运行结果
+
+        Returns:
+            {'mode', 'statements', 'rows', 'failed', 'seconds',
+             'statements_per_second', 'rows_per_second'}
+        """
+        if failed > MAX_REPORTED_FAILURES:
+            diagnostics.error(f"{mode} 共 {failed} 条语句（批次）执行失败")
+        return {
+            "mode": mode,
+            "statements": statements,
+            "rows": rows,
+            "failed": failed,
+            "seconds": seconds,
+            "statements_per_second": statements / seconds if seconds else 0.0,
+            "rows_per_second": rows / seconds if seconds else 0.0,
+        }
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+SQL文档模块 - 对一段SQL文本只解析一次，缓存语句、大写文本、行偏移、token流和
+词法扫描结果，供语法检查、复杂度分析和格式化建议共用
+"""
+
+import bisect
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import sqlparse
+from sqlparse.sql import Statement, Token
+
+from sql_generator.core.sql_scanner import SQLScanner
+
+
+class SQLDocument:
+    """
+    解析后的SQL文本
+
+    各属性在第一次访问时计算并缓存；sqlparse只在第一次访问statements或tokens时调用一次。
+    由已解析的语句构造的子文档（见 statement_documents）直接复用该语句，不再重新解析。
+    """
+
+    def __init__(self, sql: str, statements: Optional[Sequence[Statement]] = None):
+        """
+        初始化SQL文档
+
+        Args:
+            sql: SQL文本
+            statements: 已解析的语句（与sql对应），默认在首次使用时解析
+        """
+        self.text = sql or ""
+        if statements is not None:
+            self.__dict__["statements"] = tuple(statements)
+
+    @staticmethod
+    def of(sql: Union[str, "SQLDocument"]) -> "SQLDocument":
+        """
+        将SQL文本包装为文档，已是文档时原样返回
+
+        Args:
+            sql: SQL文本或SQLDocument
+
+        Returns:
+            SQLDocument
+        """
+        return sql if isinstance(sql, SQLDocument) else SQLDocument(sql)
+
+    @cached_property
+    def statements(self) -> Tuple[Statement, ...]:
+        """sqlparse解析出的语句"""
+        return tuple(sqlparse.parse(self.text))
+
+    @cached_property
+    def upper(self) -> str:
+        """大写的SQL文本"""
+        return self.text.upper()
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """按换行符拆分的各行文本"""
+        return self.text.split("\n")
+
+    @cached_property
+    def line_offsets(self) -> List[int]:
+        """每行第一个字符在文本中的偏移"""
+        offsets = [0]
+        find = self.text.find
+        position = find("\n")
+        while position != -1:
+            offsets.append(position + 1)
+            position = find("\n", position + 1)
+        return offsets
+
+    @cached_property
+    def tokens(self) -> Tuple[Token, ...]:
+        """所有语句展开后的叶子token流"""
+        return tuple(
+            token for statement in self.statements for token in statement.flatten()
+        )
+
+    @cached_property
+    def scan(self) -> Dict[str, Any]:
+        """词法扫描结果（见 SQLScanner.scan）：屏蔽字符串和注释后的文本及未闭合引号、括号等问题"""
+        return SQLScanner.scan(self.text)
+
+    @cached_property
+    def statement_documents(self) -> Tuple["SQLDocument", ...]:
+        """每条语句对应的子文档，复用已解析的语句"""
+        return tuple(
+            SQLDocument(str(statement), [statement]) for statement in self.statements
+        )
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """
+        将文本偏移转换为行号和列号
+
+        Args:
+            offset: 字符偏移（从0开始）
+
+        Returns:
+            (行号, 列号)，均从1开始
+        """
+        line = bisect.bisect_right(self.line_offsets, offset) - 1
+        return line + 1, offset - self.line_offsets[line] + 1
+
+    def __str__(self) -> str:
+        return self.text
@@ -1,200 +1,1085 @@
-# -*- coding: utf-8 -*-
-"""
-SQL生成器 - 负责生成各种SQL语句
-"""
-
-import pandas as pd
-import streamlit as st
-import re
-import sqlparse
-from typing import Optional, List, Union, Dict, Any
-from sql_generator.utils.file_utils import FileHandler
-from sql_generator.utils.ui_utils import UIHelper
-from sql_generator.config.constants import EXCEL_SHEETS, MIME_TYPES
-
-
-class SQLGenerator:
-    """SQL语句生成器类"""
-    
-    def __init__(self, path: Optional[str] = None):
-        """
-        初始化SQL生成器
-        
-        Args:
-            path: Excel文件路径，可选
-        """
-        self.path = path
-
-    def bulk_select(self, uploaded_file: Optional[Any] = None, table: Optional[str] = None, 
-                   column: Optional[Union[str, List[str]]] = None) -> Union[str, List[str]]:
-        """
-        生成SELECT语句
-        
-        Args:
-            uploaded_file: 上传的文件
-            table: 表名
-            column: 列名或列名列表
-            
-        Returns:
-            SELECT语句或语句列表
-        """
-        try:
-            if uploaded_file is None and table and column:
-                # 单表模式
-                if isinstance(column, list):
-                    column_str = ', '.join(column)
-                else:
-                    column_str = column
-                select_statement = f"SELECT {column_str} FROM {table};"
-                return select_statement
-            elif uploaded_file is not None:
-                # 批量模式
-                df = FileHandler.read_excel_safely(uploaded_file, EXCEL_SHEETS['select'])
-                if df is None:
-                    return []
-                    
-                se_list = []
-                for index, row in df.iterrows():
-                    target_table = row[0]
-                    fields = row[1]
-                    select_statements = f"SELECT {fields} FROM {target_table};"
-                    se_list.append(select_statements)
-                return se_list
-            else:
-                UIHelper.show_error("请提供表名和列名，或上传包含SELECT配置的文件")
-                return []
-        except Exception as e:
-            UIHelper.show_error(f"生成SELECT语句时发生错误: {str(e)}")
-            return []
-            
-    def bulk_create(self, uploaded_file: Optional[Any] = None) -> Union[str, List[str]]:
-        """
-        生成CREATE TABLE语句
-        
-        Args:
-            uploaded_file: 上传的文件
-            
-        Returns:
-            CREATE语句或语句列表
-        """
-        try:
-            if uploaded_file is not None:
-                # 批量模式
-                df = FileHandler.read_excel_safely(uploaded_file, EXCEL_SHEETS['create'])
-                if df is None:
-                    return []
-                
-                create_list = []
-                # 检查必要的列是否存在
-                if '表名' in df.columns:
-                    table_col = '表名'
-                elif df.columns[0].lower() in ['table', 'table_name', 'tablename']:
-                    table_col = df.columns[0]
-                else:
-                    # 假设第一列为表名
-                    table_col = df.columns[0]
-                    
-                for index, row in df.iterrows():
-                    table_name = row[table_col]
-                    if not pd.notna(table_name) or not table_name:
-                        continue
-                    
-                    columns = []
-                    # 跳过表名列，处理其他列
-                    for col_name in df.columns:
-                        if col_name == table_col:
-                            continue
-                        
-                        col_def = row[col_name]
-                        if pd.notna(col_def) and col_def:
-                            columns.append(f"    {col_name} {col_def}")
-                    
-                    if columns:
-                        create_statement = f"CREATE TABLE {table_name} (\n"
-                        create_statement += ",\n".join(columns)
-                        create_statement += "\n);"
-                        create_list.append(create_statement)
-                
-                return create_list
-            else:
-                UIHelper.show_error("请上传包含CREATE配置的文件")
-                return []
-        except Exception as e:
-            UIHelper.show_error(f"生成CREATE语句时发生错误: {str(e)}")
-            return []
-            
-    def sql_formatted(self, sql_list: List[str]) -> str:
-        """
-        格式化SQL语句列表为一个字符串
-        
-        Args:
-            sql_list: SQL语句列表
-            
-        Returns:
-            格式化后的SQL字符串
-        """
-        if not sql_list:
-            return ""
-            
-        try:
-            # 使用sqlparse格式化每条SQL语句
-            formatted_sqls = []
-            for sql in sql_list:
-                # 格式化SQL语句
-                formatted_sql = sqlparse.format(
-                    sql,
-                    reindent=True,
-                    keyword_case='upper'
-                )
-                formatted_sqls.append(formatted_sql)
-                
-            # 合并所有SQL语句，每条语句间加空行
-            return "\n\n".join(formatted_sqls)
-        except Exception as e:
-            UIHelper.show_error(f"格式化SQL语句时发生错误: {str(e)}")
-            return "\n\n".join(sql_list)  # 如果格式化失败，则返回原始SQL列表
-            
-    def bulk_insert(self, uploaded_file: Optional[Any] = None) -> List[str]:
-        """
-        根据上传的Excel文件生成INSERT语句
-        
-        Args:
-            uploaded_file: 上传的Excel文件
-            
-        Returns:
-            INSERT语句列表
-        """
-        try:
-            if uploaded_file is None:
-                UIHelper.show_error("请上传包含INSERT配置的文件")
-                return []
-                
-            # 读取Excel文件
-            df = FileHandler.read_excel_safely(uploaded_file, EXCEL_SHEETS['insert'])
-            if df is None:
-                return []
-                
-            insert_list = []
-            for index, row in df.iterrows():
-                # 假设Excel中的格式为：表名, 列名(逗号分隔), 值(逗号分隔)
-                if len(row) >= 3 and pd.notna(row[0]) and pd.notna(row[1]) and pd.notna(row[2]):
-                    table_name = row[0]
-                    columns = row[1].split(',')
-                    values = row[2].split(',')
-                    
-                    # 确保列名和值的数量一致
-                    if len(columns) == len(values):
-                        # 格式化列名和值
-                        formatted_columns = ", ".join(col.strip() for col in columns)
-                        formatted_values = ", ".join(f"'{val.strip()}'" for val in values)
-                        
-                        # 生成INSERT语句
-                        insert_statement = f"INSERT INTO {table_name} ({formatted_columns}) VALUES ({formatted_values});"
-                        insert_list.append(insert_statement)
-                    else:
-                        UIHelper.show_error(f"第 {index+1} 行的列名和值数量不匹配")
-                        
-            return insert_list
-        except Exception as e:
-            UIHelper.show_error(f"生成INSERT语句时发生错误: {str(e)}")
-            return []
+# -*- coding: utf-8 -*-
+"""
+SQL生成器 - 负责生成各种SQL语句
+"""
+
+import io
+import os
+import re
+import tempfile
+import time
+import zipfile
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+import sqlparse
+
+from sql_generator.config.constants import (
+    BULK_CONFIG,
+    EXCEL_SHEETS,
+    MIME_TYPES,
+    SHEET_COLUMNS,
+)
+from sql_generator.core.bulk_engine import BulkSQLEngine, InsertBatcher
+from sql_generator.core.bulk_loader import BulkLoadWriter
+from sql_generator.core.dedupe import RowDeduplicator
+from sql_generator.core.parallel import generate_rows_parallel, generate_workbook
+from sql_generator.core.parameterized import ParameterizedWriter
+from sql_generator.core.query_plan import INDEX_SHEET, QueryPlanAnalyzer
+from sql_generator.core.sandbox import SQLiteSandbox
+from sql_generator.utils.diagnostics import Diagnostics, GeneratedSQL
+from sql_generator.utils.file_utils import FileHandler
+from sql_generator.utils.jobs import Job
+from sql_generator.utils.output_buffer import SQLOutputBuffer
+
+
+class SQLGenerator:
+    """
+    SQL语句生成器类
+
+    批量生成方法返回GeneratedSQL（语句列表），错误和警告收集在其 diagnostics 属性中，
+    由UI或命令行负责展示，本模块不依赖Streamlit。
+    """
+
+    def __init__(self, path: Optional[str] = None, use_cache: bool = True):
+        """
+        初始化SQL生成器
+
+        Args:
+            path: Excel文件路径，可选
+            use_cache: 是否通过共享的工作簿缓存读取工作表
+        """
+        self.path = path
+        self.use_cache = use_cache
+
+    def _read_sheet(
+        self,
+        uploaded_file: Any,
+        sheet: str,
+        diagnostics: Diagnostics,
+        dedupe: Optional[str] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        读取上传文件中指定类型的工作表（Excel工作簿中的工作表，或CSV/Parquet/Arrow文件的整张表）
+
+        Args:
+            uploaded_file: 上传的文件或文件路径
+            sheet: EXCEL_SHEETS中的工作表类型
+            diagnostics: 收集读取错误的诊断信息
+            dedupe: 删除同一表完全重复的行，first/last 保留第一行/最后一行，fail 存在重复行时报错；
+                默认不去重
+
+        Returns:
+            工作表数据，读取失败（或fail模式下存在重复行）时返回None
+        """
+        df = FileHandler.read_table(
+            uploaded_file,
+            EXCEL_SHEETS[sheet],
+            SHEET_COLUMNS.get(sheet),
+            self.use_cache,
+            diagnostics,
+        )
+        if df is not None:
+            diagnostics.rows += len(df)
+            if dedupe:
+                df = RowDeduplicator(dedupe, diagnostics).drop(df)
+        return df
+
+    def bulk_select(
+        self,
+        uploaded_file: Optional[Any] = None,
+        table: Optional[str] = None,
+        column: Optional[Union[str, List[str]]] = None,
+        workers: int = BULK_CONFIG["workers"],
+    ) -> Union[str, GeneratedSQL]:
+        """
+        生成SELECT语句
+
+        Args:
+            uploaded_file: 上传的文件
+            table: 表名
+            column: 列名或列名列表
+            workers: 批量模式下按行分块并行生成的进程数
+
+        Returns:
+            单表模式下为SELECT语句；批量模式下为GeneratedSQL语句列表
+        """
+        diagnostics = Diagnostics()
+        try:
+            if uploaded_file is None and table and column:
+                # 单表模式
+                if isinstance(column, list):
+                    column_str = ", ".join(column)
+                else:
+                    column_str = column
+                select_statement = f"SELECT {column_str} FROM {table};"
+                return select_statement
+            elif uploaded_file is not None:
+                # 批量模式
+                df = self._read_sheet(uploaded_file, "select", diagnostics)
+                if df is None:
+                    return GeneratedSQL([], diagnostics)
+
+                if workers > 1:
+                    return GeneratedSQL(
+                        generate_rows_parallel("select", df, workers)[0], diagnostics
+                    )
+                return GeneratedSQL(BulkSQLEngine.select_statements(df), diagnostics)
+            else:
+                diagnostics.error("请提供表名和列名，或上传包含SELECT配置的文件")
+                return GeneratedSQL([], diagnostics)
+        except Exception as e:
+            diagnostics.error(f"生成SELECT语句时发生错误: {str(e)}")
+            return GeneratedSQL([], diagnostics)
+
+    def bulk_create(self, uploaded_file: Optional[Any] = None) -> GeneratedSQL:
+        """
+        生成CREATE TABLE语句
+
+        Args:
+            uploaded_file: 上传的文件
+
+        Returns:
+            CREATE语句或语句列表
+        """
+        diagnostics = Diagnostics()
+        try:
+            if uploaded_file is not None:
+                # 批量模式
+                df = self._read_sheet(uploaded_file, "create", diagnostics)
+                if df is None:
+                    return GeneratedSQL([], diagnostics)
+
+                return GeneratedSQL(BulkSQLEngine.create_statements(df), diagnostics)
+            else:
+                diagnostics.error("请上传包含CREATE配置的文件")
+                return GeneratedSQL([], diagnostics)
+        except Exception as e:
+            diagnostics.error(f"生成CREATE语句时发生错误: {str(e)}")
+            return GeneratedSQL([], diagnostics)
+
+    def bulk_merge(
+        self,
+        uploaded_file: Optional[Any] = None,
+        set_based: bool = False,
+        batch_size: Optional[int] = None,
+        dedupe: Optional[str] = None,
+    ) -> GeneratedSQL:
+        """
+        根据上传的Excel文件生成MERGE语句
+
+        Args:
+            uploaded_file: 上传的Excel文件
+            set_based: merge工作表为数据行格式时，是否每个目标表只生成一条
+                MERGE INTO ... USING (VALUES ...) 语句
+            batch_size: set_based模式下每条语句最多包含的源数据行数
+            dedupe: 重复行的处理方式，first、last 或 fail，默认不去重
+
+        Returns:
+            MERGE语句列表
+        """
+        diagnostics = Diagnostics()
+        try:
+            if uploaded_file is None:
+                diagnostics.error("请上传包含MERGE配置的文件")
+                return GeneratedSQL([], diagnostics)
+
+            df = self._read_sheet(uploaded_file, "merge", diagnostics, dedupe)
+            if df is None:
+                return GeneratedSQL([], diagnostics)
+
+            statements, mismatched = BulkSQLEngine.merge_statements(
+                df, set_based, batch_size
+            )
+            diagnostics.row_errors(mismatched, "列名、值或主键配置不匹配")
+
+            return GeneratedSQL(statements, diagnostics)
+        except Exception as e:
+            diagnostics.error(f"生成MERGE语句时发生错误: {str(e)}")
+            return GeneratedSQL([], diagnostics)
+
+    def bulk_upsert(
+        self,
+        uploaded_file: Optional[Any] = None,
+        dialect: str = "postgresql",
+        keys: Optional[List[str]] = None,
+        sheet: str = "merge",
+        rows_per_statement: int = BULK_CONFIG["batch_size"],
+        max_statement_bytes: Optional[int] = BULK_CONFIG["max_statement_bytes"],
+        dedupe: Optional[str] = None,
+    ) -> GeneratedSQL:
+        """
+        根据上传的文件生成分批的原生UPSERT语句，每批一次往返完成插入或更新
+
+        PostgreSQL/SQLite生成 INSERT ... ON CONFLICT (主键) DO UPDATE，MySQL生成
+        INSERT ... ON DUPLICATE KEY UPDATE；每条语句的行数和字节数限制与多行INSERT相同。
+
+        Args:
+            uploaded_file: 上传的文件
+            dialect: 目标数据库方言，postgresql、sqlite或mysql
+            keys: 主键列，默认取工作表中的uniqueid列
+            sheet: 数据来源工作表，merge（数据行格式）或insert（需给出keys）
+            rows_per_statement: 每条语句最多包含的行数
+            max_statement_bytes: 每条语句的最大字节数
+            dedupe: 重复行的处理方式，first、last 或 fail，默认不去重
+
+        Returns:
+            UPSERT语句列表
+        """
+        diagnostics = Diagnostics()
+        try:
+            if uploaded_file is None:
+                diagnostics.error("请上传包含MERGE或INSERT配置的文件")
+                return GeneratedSQL([], diagnostics)
+
+            df = self._read_sheet(uploaded_file, sheet, diagnostics, dedupe)
+            if df is None:
+                return GeneratedSQL([], diagnostics)
+
+            parts, mismatched = BulkSQLEngine.upsert_parts(df, dialect, keys)
+            diagnostics.row_errors(mismatched, "列名、值或主键配置不匹配")
+            batcher = InsertBatcher(rows_per_statement, max_statement_bytes)
+            statements = list(batcher.add(parts)) + list(batcher.flush())
+
+            return GeneratedSQL(statements, diagnostics)
+        except Exception as e:
+            diagnostics.error(f"生成UPSERT语句时发生错误: {str(e)}")
+            return GeneratedSQL([], diagnostics)
+
+    def bulk_update(
+        self,
+        uploaded_file: Optional[Any] = None,
+        batch_size: Optional[int] = BULK_CONFIG["batch_size"],
+        style: str = "case",
+        dedupe: Optional[str] = None,
+    ) -> GeneratedSQL:
+        """
+        根据上传的Excel文件生成基于集合的UPDATE语句
+
+        update工作表每行为一条带主键的数据（table, column, uniqueid, values），
+        同一表的行按batch_size合并为一条语句。
+
+        Args:
+            uploaded_file: 上传的Excel文件
+            batch_size: 每条UPDATE语句最多更新的行数
+            style: 'case' 生成 SET col = CASE key WHEN ... END，
+                'from_values' 生成 UPDATE ... FROM (VALUES ...)
+            dedupe: 重复行的处理方式，first、last 或 fail，默认不去重
+
+        Returns:
+            UPDATE语句列表
+        """
+        diagnostics = Diagnostics()
+        try:
+            if uploaded_file is None:
+                diagnostics.error("请上传包含UPDATE配置的文件")
+                return GeneratedSQL([], diagnostics)
+
+            df = self._read_sheet(uploaded_file, "update", diagnostics, dedupe)
+            if df is None:
+                return GeneratedSQL([], diagnostics)
+
+            statements, mismatched = BulkSQLEngine.update_statements(
+                df, batch_size, style
+            )
+            diagnostics.row_errors(mismatched, "列名、值或主键配置不匹配")
+
+            return GeneratedSQL(statements, diagnostics)
+        except Exception as e:
+            diagnostics.error(f"生成UPDATE语句时发生错误: {str(e)}")
+            return GeneratedSQL([], diagnostics)
+
+    def bulk_delete(
+        self,
+        uploaded_file: Optional[Any] = None,
+        batch_size: Optional[int] = BULK_CONFIG["batch_size"],
+        reinsert: bool = False,
+        dedupe: Optional[str] = None,
+    ) -> GeneratedSQL:
+        """
+        根据上传的Excel文件生成分批的DELETE语句，可选配对的重新插入语句
+
+        按表收集需删除的主键，每batch_size个主键一条 DELETE ... WHERE key IN (...)，
+        使每个事务保持较短，避免大批量删除时的锁升级。
+
+        Args:
+            uploaded_file: 上传的Excel文件
+            batch_size: 每条DELETE语句最多包含的主键数
+            reinsert: 是否在每批DELETE之后生成对应的批量INSERT（删除并重新插入）
+            dedupe: 重复行的处理方式，first、last 或 fail，默认不去重
+
+        Returns:
+            DELETE（及INSERT）语句列表
+        """
+        diagnostics = Diagnostics()
+        try:
+            if uploaded_file is None:
+                diagnostics.error("请上传包含DELETE配置的文件")
+                return GeneratedSQL([], diagnostics)
+
+            df = self._read_sheet(uploaded_file, "delete", diagnostics, dedupe)
+            if df is None:
+                return GeneratedSQL([], diagnostics)
+
+            statements, mismatched = BulkSQLEngine.delete_statements(
+                df, batch_size, reinsert
+            )
+            diagnostics.row_errors(mismatched, "列名、值或主键配置不匹配")
+
+            return GeneratedSQL(statements, diagnostics)
+        except Exception as e:
+            diagnostics.error(f"生成DELETE语句时发生错误: {str(e)}")
+            return GeneratedSQL([], diagnostics)
+
+    def bulk_truncate(self, uploaded_file: Optional[Any] = None) -> GeneratedSQL:
+        """
+        根据上传的Excel文件生成TRUNCATE语句（支持简单清空和清空后插入）
+
+        Args:
+            uploaded_file: 上传的Excel文件
+
+        Returns:
+            TRUNCATE（及INSERT）语句列表
+        """
+        diagnostics = Diagnostics()
+        try:
+            if uploaded_file is None:
+                diagnostics.error("请上传包含TRUNCATE配置的文件")
+                return GeneratedSQL([], diagnostics)
+
+            df = self._read_sheet(uploaded_file, "truncate", diagnostics)
+            if df is None:
+                return GeneratedSQL([], diagnostics)
+
+            statements, mismatched = BulkSQLEngine.truncate_statements(df)
+            diagnostics.row_errors(mismatched, "目标列和源列数量不匹配")
+
+            return GeneratedSQL(statements, diagnostics)
+        except Exception as e:
+            diagnostics.error(f"生成TRUNCATE语句时发生错误: {str(e)}")
+            return GeneratedSQL([], diagnostics)
+
+    def generate_all(
+        self,
+        workbook: Any,
+        sheets: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        options: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        并行生成工作簿中所有工作表的SQL语句
+
+        每个工作表在独立的工作进程中解析和生成，结果按固定的工作表顺序合并。
+
+        Args:
+            workbook: 上传的Excel文件或文件路径
+            sheets: 需要生成的工作表类型，默认为工作簿中存在的全部类型
+            max_workers: 最大进程数，默认为工作表数量与CPU核数的较小值；为1时在当前进程中顺序生成
+            options: 各工作表生成方法的额外参数，如 {'insert': {'rows_per_statement': 100}}
+
+        Returns:
+            按工作表顺序排列的字典：工作表类型 -> {'statements', 'seconds', 'error', 'diagnostics'}
+        """
+        return generate_workbook(workbook, sheets, max_workers, options)
+
+    def generate_job(
+        self,
+        job: Job,
+        uploaded_file: Any,
+        sheets: List[str],
+        options: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, GeneratedSQL]:
+        """
+        作为后台任务依次生成多个工作表的SQL语句（由JobManager调用）
+
+        INSERT逐块读取和生成，每条语句产出时更新 job.rows 并检查取消请求（去重保留最后一行时
+        需要读取整表，改为整表生成）；其他工作表整表生成，完成后一次性计入已处理行数。
+
+        Args:
+            job: 后台任务
+            uploaded_file: 上传的文件或文件路径
+            sheets: 工作表类型
+            options: 各工作表生成方法的额外参数，如 {'insert': {'rows_per_statement': 100}}
+
+        Returns:
+            与generate_all相同：工作表类型 -> {'statements', 'seconds', 'error', 'diagnostics'}
+        """
+        options = options or {}
+        results = OrderedDict()
+        for sheet in sheets:
+            job.check_cancelled()
+            start = time.perf_counter()
+            completed = job.rows
+            if sheet == "insert" and options.get(sheet, {}).get("dedupe") != "last":
+                diagnostics = Diagnostics()
+                statements = GeneratedSQL([], diagnostics)
+                for statement in self.iter_insert(
+                    uploaded_file, diagnostics=diagnostics, **options.get(sheet, {})
+                ):
+                    job.rows = completed + diagnostics.rows
+                    job.check_cancelled()
+                    statements.append(statement)
+            else:
+                statements = getattr(self, f"bulk_{sheet}")(
+                    uploaded_file, **options.get(sheet, {})
+                )
+            job.rows = completed + statements.diagnostics.rows
+            results[sheet] = {
+                "statements": statements,
+                "seconds": time.perf_counter() - start,
+                "error": None,
+                "diagnostics": statements.diagnostics,
+            }
+        return results
+
+    def generate_formatted_job(
+        self,
+        job: Job,
+        uploaded_file: Any,
+        sheets: List[str],
+        options: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Tuple[Dict[str, GeneratedSQL], SQLOutputBuffer]:
+        """
+        作为后台任务生成SQL，并在任务中把全部语句格式化写入一个输出缓冲区（由JobManager调用）
+
+        格式化在后台线程中完成，页面重跑时直接使用缓冲区而不是重新格式化每条语句。
+
+        Args:
+            job: 后台任务
+            uploaded_file: 上传的文件或文件路径
+            sheets: 工作表类型
+            options: 各工作表生成方法的额外参数
+
+        Returns:
+            (与generate_job相同的结果, 依次写入各工作表格式化语句的缓冲区)
+        """
+        results = self.generate_job(job, uploaded_file, sheets, options)
+        buffer = SQLOutputBuffer()
+        for result in results.values():
+            if not result["statements"]:
+                continue
+            if buffer.size:
+                buffer.write(b"\n\n")
+            self.sql_formatted_buffer(result["statements"], buffer, job)
+        return results, buffer
+
+    def sql_formatted(self, sql_list: List[str]) -> str:
+        """
+        格式化SQL语句列表为一个字符串
+
+        格式化失败时返回未格式化的语句；sql_list为GeneratedSQL时失败原因记入其诊断信息。
+
+        Args:
+            sql_list: SQL语句列表
+
+        Returns:
+            格式化后的SQL字符串
+        """
+        if not sql_list:
+            return ""
+
+        try:
+            # 使用sqlparse格式化每条SQL语句
+            formatted_sqls = []
+            for sql in sql_list:
+                # 格式化SQL语句
+                formatted_sql = sqlparse.format(
+                    sql, reindent=True, keyword_case="upper"
+                )
+                formatted_sqls.append(formatted_sql)
+
+            # 合并所有SQL语句，每条语句间加空行
+            return "\n\n".join(formatted_sqls)
+        except Exception as e:
+            if isinstance(sql_list, GeneratedSQL):
+                sql_list.diagnostics.warning(f"格式化SQL语句时发生错误: {str(e)}")
+            return "\n\n".join(sql_list)  # 如果格式化失败，则返回原始SQL列表
+
+    def sql_formatted_buffer(
+        self,
+        sql_list: Iterable[str],
+        buffer: Optional[SQLOutputBuffer] = None,
+        job: Optional[Job] = None,
+    ) -> SQLOutputBuffer:
+        """
+        逐条格式化SQL语句并写入输出缓冲区，不在内存中拼接完整脚本
+
+        写入的内容与sql_formatted的返回值相同；缓冲区超过阈值后溢出到临时文件。
+        单条语句格式化失败时写入原始语句，sql_list为GeneratedSQL时失败原因记入其诊断信息。
+
+        Args:
+            sql_list: SQL语句列表或迭代器
+            buffer: 写入的缓冲区，默认新建
+            job: 后台任务，格式化每条语句前检查取消请求，可选
+
+        Returns:
+            写入了格式化脚本的缓冲区
+        """
+        buffer = buffer if buffer is not None else SQLOutputBuffer()
+        for index, sql in enumerate(sql_list):
+            if job is not None:
+                job.check_cancelled()
+            try:
+                formatted_sql = sqlparse.format(
+                    sql, reindent=True, keyword_case="upper"
+                )
+            except Exception as e:
+                if isinstance(sql_list, GeneratedSQL):
+                    sql_list.diagnostics.warning(f"格式化SQL语句时发生错误: {str(e)}")
+                formatted_sql = sql
+            if index:
+                buffer.write(b"\n\n")
+            buffer.write(formatted_sql.encode("utf-8"))
+        return buffer
+
+    def bulk_insert(
+        self,
+        uploaded_file: Optional[Any] = None,
+        rows_per_statement: int = BULK_CONFIG["rows_per_statement"],
+        max_statement_bytes: Optional[int] = BULK_CONFIG["max_statement_bytes"],
+        workers: int = BULK_CONFIG["workers"],
+        dedupe: Optional[str] = None,
+    ) -> GeneratedSQL:
+        """
+        根据上传的Excel文件生成INSERT语句
+
+        Args:
+            uploaded_file: 上传的Excel文件
+            rows_per_statement: 每条INSERT语句合并的行数，大于1时生成多行INSERT
+            max_statement_bytes: 多行INSERT每条语句的最大字节数
+            workers: 按行分块并行生成的进程数，大于1时各进程通过共享内存读取数据
+            dedupe: 重复行的处理方式，first、last 或 fail，默认不去重
+
+        Returns:
+            INSERT语句列表
+        """
+        diagnostics = Diagnostics()
+        try:
+            if uploaded_file is None:
+                diagnostics.error("请上传包含INSERT配置的文件")
+                return GeneratedSQL([], diagnostics)
+
+            # 读取Excel文件
+            df = self._read_sheet(uploaded_file, "insert", diagnostics, dedupe)
+            if df is None:
+                return GeneratedSQL([], diagnostics)
+
+            if workers > 1:
+                statements, mismatched = generate_rows_parallel(
+                    "insert",
+                    df,
+                    workers,
+                    {
+                        "rows_per_statement": rows_per_statement,
+                        "max_statement_bytes": max_statement_bytes,
+                    },
+                )
+                diagnostics.row_errors(mismatched, "列名和值数量不匹配")
+                return GeneratedSQL(statements, diagnostics)
+
+            return GeneratedSQL(
+                self._generate_inserts(
+                    [df], rows_per_statement, max_statement_bytes, diagnostics
+                ),
+                diagnostics,
+            )
+        except Exception as e:
+            diagnostics.error(f"生成INSERT语句时发生错误: {str(e)}")
+            return GeneratedSQL([], diagnostics)
+
+    def iter_insert(
+        self,
+        uploaded_file: Any,
+        chunk_size: int = BULK_CONFIG["chunk_size"],
+        rows_per_statement: int = BULK_CONFIG["rows_per_statement"],
+        max_statement_bytes: Optional[int] = BULK_CONFIG["max_statement_bytes"],
+        diagnostics: Optional[Diagnostics] = None,
+        dedupe: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        流式生成INSERT语句
+
+        以只读模式逐块读取insert工作表（或CSV/Parquet/Arrow文件）并按块生成语句，
+        内存占用只与chunk_size相关，与文件大小无关。可配合 FileHandler.write_sql_stream 直接写入文件。
+        生成前先流式读取一遍推断整张工作表的值类型，字面量写法与 bulk_insert 相同，不受分块方式影响。
+
+        Args:
+            uploaded_file: 上传的Excel、CSV、Parquet或Arrow文件，或文件路径
+            chunk_size: 每块读取的行数
+            rows_per_statement: 每条INSERT语句合并的行数，大于1时生成多行INSERT
+            max_statement_bytes: 多行INSERT每条语句的最大字节数
+            diagnostics: 收集不合法行等问题的诊断信息，可选
+            dedupe: 重复行的处理方式，first 或 fail（与之前任一块中相同的行也视为重复；
+                fail模式在遇到重复行时停止生成），流式生成不支持 last，默认不去重
+
+        Returns:
+            INSERT语句迭代器
+        """
+        diagnostics = diagnostics if diagnostics is not None else Diagnostics()
+        types = self._stream_value_types(uploaded_file, chunk_size)
+        chunks = FileHandler.iter_table_chunks(
+            uploaded_file, EXCEL_SHEETS["insert"], chunk_size, SHEET_COLUMNS["insert"]
+        )
+        chunks = self._count_rows(chunks, diagnostics)
+        if dedupe:
+            chunks = RowDeduplicator(dedupe, diagnostics).iter_chunks(chunks)
+        yield from self._generate_inserts(
+            chunks, rows_per_statement, max_statement_bytes, diagnostics, types
+        )
+
+    def export_bulk_load(
+        self,
+        uploaded_file: Any,
+        output_dir: str,
+        dialect: str = "postgresql",
+        delimiter: str = ",",
+        chunk_size: int = BULK_CONFIG["chunk_size"],
+        diagnostics: Optional[Diagnostics] = None,
+    ) -> Dict[str, Any]:
+        """
+        将insert工作表导出为数据文件和批量导入脚本（COPY / LOAD DATA / .import）
+
+        工作表以只读模式逐块读取，数据直接追加写入各(表名, 列名列表)对应的CSV/TSV文件。
+
+        Args:
+            uploaded_file: 上传的Excel文件或文件路径
+            output_dir: 输出目录
+            dialect: 目标数据库方言，postgresql、mysql或sqlite
+            delimiter: 数据文件分隔符，',' 或 '\t'
+            chunk_size: 每块读取的行数
+            diagnostics: 收集不合法行等问题的诊断信息，可选
+
+        Returns:
+            结果字典，包含 script、data_files、row_count、mismatched_rows、diagnostics
+        """
+        diagnostics = diagnostics if diagnostics is not None else Diagnostics()
+        chunks = FileHandler.iter_table_chunks(
+            uploaded_file, EXCEL_SHEETS["insert"], chunk_size, SHEET_COLUMNS["insert"]
+        )
+        result = BulkLoadWriter.write_all(chunks, output_dir, dialect, delimiter)
+        diagnostics.row_errors(result["mismatched_rows"], "列名和值数量不匹配")
+        result["diagnostics"] = diagnostics
+        return result
+
+    def bulk_load_zip(
+        self,
+        uploaded_file: Any,
+        dialect: str = "postgresql",
+        delimiter: str = ",",
+        diagnostics: Optional[Diagnostics] = None,
+    ) -> bytes:
+        """
+        生成包含导入脚本和数据文件的zip压缩包
+
+        Args:
+            uploaded_file: 上传的Excel文件或文件路径
+            dialect: 目标数据库方言
+            delimiter: 数据文件分隔符
+            diagnostics: 收集不合法行等问题的诊断信息，可选
+
+        Returns:
+            zip文件内容
+        """
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = self.export_bulk_load(
+                uploaded_file, output_dir, dialect, delimiter, diagnostics=diagnostics
+            )
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+                for path in [result["script"]] + result["data_files"]:
+                    archive.write(path, os.path.basename(path))
+            return buffer.getvalue()
+
+    def export_parameterized(
+        self,
+        uploaded_file: Any,
+        output_dir: str,
+        paramstyle: str = "qmark",
+        param_format: str = "csv",
+        chunk_size: int = BULK_CONFIG["chunk_size"],
+        diagnostics: Optional[Diagnostics] = None,
+        dedupe: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        将insert工作表导出为参数化INSERT语句和参数文件
+
+        每个(表名, 列名列表)只生成一条带占位符的语句，数据行逐块追加写入对应的CSV或JSON Lines
+        参数文件；manifest.json 记录语句与参数文件的对应关系，供加载程序以 executemany 或
+        服务端预编译语句执行，数据库只需解析每条语句一次。写入前先流式读取一遍推断整张工作表的
+        值类型，同一列在各块中都写为数字或都写为字符串。
+
+        Args:
+            uploaded_file: 上传的Excel文件或文件路径
+            output_dir: 输出目录
+            paramstyle: 占位符风格，qmark（?）、format（%s）或dollar（$1）
+            param_format: 参数文件格式，csv或jsonl
+            chunk_size: 每块读取的行数
+            diagnostics: 收集不合法行等问题的诊断信息，可选
+            dedupe: 重复行的处理方式，first 或 fail（与 iter_insert 相同），默认不去重
+
+        Returns:
+            结果字典，包含 script、manifest、parameter_files、row_count、
+            mismatched_rows、diagnostics
+        """
+        diagnostics = diagnostics if diagnostics is not None else Diagnostics()
+        chunks = FileHandler.iter_table_chunks(
+            uploaded_file, EXCEL_SHEETS["insert"], chunk_size, SHEET_COLUMNS["insert"]
+        )
+        chunks = self._count_rows(chunks, diagnostics)
+        if dedupe:
+            chunks = RowDeduplicator(dedupe, diagnostics).iter_chunks(chunks)
+        types = self._stream_value_types(uploaded_file, chunk_size)
+        result = ParameterizedWriter.write_all(
+            chunks, output_dir, paramstyle, param_format, types
+        )
+        diagnostics.row_errors(result["mismatched_rows"], "列名和值数量不匹配")
+        result["diagnostics"] = diagnostics
+        return result
+
+    def parameterized_zip(
+        self,
+        uploaded_file: Any,
+        paramstyle: str = "qmark",
+        param_format: str = "csv",
+        diagnostics: Optional[Diagnostics] = None,
+    ) -> bytes:
+        """
+        生成包含参数化语句、清单和参数文件的zip压缩包
+
+        Args:
+            uploaded_file: 上传的Excel文件或文件路径
+            paramstyle: 占位符风格
+            param_format: 参数文件格式
+            diagnostics: 收集不合法行等问题的诊断信息，可选
+
+        Returns:
+            zip文件内容
+        """
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = self.export_parameterized(
+                uploaded_file,
+                output_dir,
+                paramstyle,
+                param_format,
+                diagnostics=diagnostics,
+            )
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+                for path in [result["script"], result["manifest"]] + result[
+                    "parameter_files"
+                ]:
+                    archive.write(path, os.path.basename(path))
+            return buffer.getvalue()
+
+    def sandbox_benchmark(
+        self,
+        uploaded_file: Any,
+        rows_per_statement: int = BULK_CONFIG["batch_size"],
+        batch_size: int = BULK_CONFIG["batch_size"],
+        max_statement_bytes: Optional[int] = BULK_CONFIG["max_statement_bytes"],
+    ) -> Dict[str, Any]:
+        """
+        在临时SQLite数据库中试运行工作簿生成的语句，测量执行吞吐量
+
+        先由create工作表建表，再依次执行：insert工作表分别以逐行INSERT、多行INSERT和参数化
+        executemany三种方式试运行（每种方式之前清空数据，最后一种的数据保留给后续语句）；
+        update工作表的批量UPDATE；merge工作表（数据行格式）的原生UPSERT（试运行前按主键建唯一索引）；
+        delete工作表的分批DELETE。语句按sqlite方言生成，只统计执行耗时。
+
+        Args:
+            uploaded_file: 上传的Excel工作簿或文件路径
+            rows_per_statement: 多行INSERT和UPSERT每条语句的行数
+            batch_size: UPDATE/DELETE每条语句的行数，以及executemany每批的参数行数
+            max_statement_bytes: 多行语句的最大字节数
+
+        Returns:
+            {'runs': 各次试运行结果列表（mode、statements、rows、failed、seconds、
+             statements_per_second、rows_per_second）, 'tables': 创建的表数,
+             'diagnostics': 诊断信息}
+        """
+        diagnostics = Diagnostics()
+        runs = []
+        result = {"runs": runs, "tables": 0, "diagnostics": diagnostics}
+        if FileHandler.detect_format(uploaded_file) != "excel":
+            diagnostics.error("试运行需要包含create工作表的Excel工作簿")
+            return result
+        available = set(FileHandler.get_sheet_names(uploaded_file))
+        if EXCEL_SHEETS["create"] not in available:
+            diagnostics.error("工作簿中没有create工作表，无法建立表结构")
+            return result
+
+        with SQLiteSandbox(batch_size=batch_size) as sandbox:
+            df = self._read_sheet(uploaded_file, "create", diagnostics)
+            if df is None:
+                return result
+            result["tables"] = sandbox.create_schema(
+                BulkSQLEngine.create_statements(df), diagnostics
+            )
+
+            for sheet in ["insert", "update", "merge", "delete"]:
+                if EXCEL_SHEETS[sheet] not in available:
+                    continue
+                df = self._read_sheet(uploaded_file, sheet, diagnostics)
+                if df is None:
+                    continue
+                try:
+                    runs.extend(
+                        self._sandbox_sheet(
+                            sandbox,
+                            sheet,
+                            df,
+                            rows_per_statement,
+                            batch_size,
+                            max_statement_bytes,
+                            diagnostics,
+                        )
+                    )
+                except Exception as e:
+                    diagnostics.error(f"试运行{sheet}工作表时发生错误: {str(e)}")
+        return result
+
+    @staticmethod
+    def _sandbox_sheet(
+        sandbox: SQLiteSandbox,
+        sheet: str,
+        df: pd.DataFrame,
+        rows_per_statement: int,
+        batch_size: int,
+        max_statement_bytes: Optional[int],
+        diagnostics: Diagnostics,
+    ) -> List[Dict[str, Any]]:
+        """按sqlite方言生成一个工作表的语句并在试运行环境中执行，返回各次试运行结果"""
+        if sheet == "insert":
+            statements, mismatched = BulkSQLEngine.insert_statements(df, "sqlite")
+            diagnostics.row_errors(mismatched, "列名和值数量不匹配")
+            runs = [sandbox.run("INSERT 逐行", statements, diagnostics)]
+
+            sandbox.clear()
+            parts, _ = BulkSQLEngine.insert_parts(df, "sqlite")
+            batcher = InsertBatcher(rows_per_statement, max_statement_bytes)
+            runs.append(
+                sandbox.run(
+                    "INSERT 多行",
+                    list(batcher.add(parts)) + list(batcher.flush()),
+                    diagnostics,
+                    rows=len(parts),
+                )
+            )
+
+            sandbox.clear()
+            groups, _ = ParameterizedWriter.parameter_rows(df)
+            runs.append(
+                sandbox.run_many(
+                    "INSERT 参数化",
+                    [
+                        (ParameterizedWriter.statement(table, columns), rows)
+                        for table, columns, rows in groups
+                    ],
+                    diagnostics,
+                )
+            )
+            return runs
+
+        if sheet == "update":
+            statements, mismatched = BulkSQLEngine.update_statements(
+                df, batch_size, "case", "sqlite"
+            )
+            diagnostics.row_errors(mismatched, "列名、值或主键配置不匹配")
+            return [
+                sandbox.run(
+                    "UPDATE 批量", statements, diagnostics, rows=len(df) - len(mismatched)
+                )
+            ]
+
+        if sheet == "merge":
+            try:
+                parts, mismatched = BulkSQLEngine.upsert_parts(df, "sqlite")
+            except ValueError as e:
+                diagnostics.warning(
+                    f"SQLite没有MERGE语句，试运行以UPSERT执行数据行格式的merge工作表，已跳过: {e}"
+                )
+                return []
+            diagnostics.row_errors(mismatched, "列名、值或主键配置不匹配")
+            # ON CONFLICT 需要主键列上有唯一约束
+            conflicts = parts[["table"]].assign(
+                keys=parts["suffix"].str.extract(r"ON CONFLICT \(([^)]*)\)")[0]
+            )
+            for number, (table, keys) in enumerate(
+                conflicts.drop_duplicates().itertuples(index=False), 1
+            ):
+                schema, _, name = table.rpartition(".")
+                index = (
+                    f"{schema}.sandbox_unique_{number}"
+                    if schema
+                    else f"sandbox_unique_{number}"
+                )
+                sandbox.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {index} ON {name} ({keys})",
+                    diagnostics,
+                )
+            batcher = InsertBatcher(rows_per_statement, max_statement_bytes)
+            return [
+                sandbox.run(
+                    "MERGE (UPSERT) 多行",
+                    list(batcher.add(parts)) + list(batcher.flush()),
+                    diagnostics,
+                    rows=len(parts),
+                )
+            ]
+
+        statements, mismatched = BulkSQLEngine.delete_statements(
+            df, batch_size, dialect="sqlite"
+        )
+        diagnostics.row_errors(mismatched, "列名、值或主键配置不匹配")
+        return [
+            sandbox.run(
+                "DELETE 批量", statements, diagnostics, rows=len(df) - len(mismatched)
+            )
+        ]
+
+    def explain_select_plans(
+        self,
+        uploaded_file: Any,
+        statements: Optional[str] = None,
+        index_statements: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        在内存SQLite数据库中分析SELECT语句的执行计划
+
+        由create工作表建表，再执行工作簿index工作表（table, column, 可选index_name、unique）定义的索引
+        和额外粘贴的CREATE INDEX语句，然后对每条SELECT语句执行 EXPLAIN QUERY PLAN，
+        标记全表扫描、临时B树和自动索引（缺少索引）。数据库中没有数据，计划只反映表结构和索引。
+
+        Args:
+            uploaded_file: 上传的Excel工作簿或文件路径
+            statements: 要分析的SQL文本（多条语句以分号分隔）；默认分析select工作表生成的语句
+            index_statements: 额外的CREATE INDEX语句（多条语句以分号分隔）
+
+        Returns:
+            {'plans': 每条SELECT语句的分析结果（statement、plan、issues、error）,
+             'tables': 成功执行的建表和建索引语句数, 'diagnostics': 诊断信息}
+        """
+        diagnostics = Diagnostics()
+        result = {"plans": [], "tables": 0, "diagnostics": diagnostics}
+        if FileHandler.detect_format(uploaded_file) != "excel":
+            diagnostics.error("执行计划分析需要包含create工作表的Excel工作簿")
+            return result
+        available = set(FileHandler.get_sheet_names(uploaded_file))
+        if EXCEL_SHEETS["create"] not in available:
+            diagnostics.error("工作簿中没有create工作表，无法建立表结构")
+            return result
+
+        df = self._read_sheet(uploaded_file, "create", diagnostics)
+        if df is None:
+            return result
+        indexes = []
+        if INDEX_SHEET in available:
+            index_df = FileHandler.read_table(
+                uploaded_file, INDEX_SHEET, None, self.use_cache, diagnostics
+            )
+            if index_df is not None:
+                indexes = QueryPlanAnalyzer.index_statements(index_df)
+        if index_statements:
+            indexes += [
+                str(statement).strip()
+                for statement in sqlparse.split(index_statements)
+                if str(statement).strip()
+            ]
+
+        if statements is None:
+            if EXCEL_SHEETS["select"] not in available:
+                diagnostics.warning("工作簿中没有select工作表，也没有提供要分析的语句")
+                return result
+            select_df = self._read_sheet(uploaded_file, "select", diagnostics)
+            queries = (
+                []
+                if select_df is None
+                else BulkSQLEngine.select_statements(select_df).tolist()
+            )
+        else:
+            queries = [
+                str(statement).strip()
+                for statement in sqlparse.split(statements)
+                if str(statement).strip()
+            ]
+
+        with QueryPlanAnalyzer() as analyzer:
+            result["tables"] = analyzer.load_schema(
+                BulkSQLEngine.create_statements(df), indexes, diagnostics
+            )
+            result["plans"] = analyzer.explain_all(queries)
+
+        skipped = len(queries) - len(result["plans"])
+        if skipped:
+            diagnostics.info(f"跳过了 {skipped} 条非SELECT语句")
+        for plan in result["plans"]:
+            if plan["error"]:
+                diagnostics.error(f"无法分析执行计划: {plan['error']}\n{plan['statement']}")
+        return result
+
+    @staticmethod
+    def _count_rows(
+        chunks: Iterable[pd.DataFrame], diagnostics: Diagnostics
+    ) -> Iterator[pd.DataFrame]:
+        """逐块传递数据，同时把行数累加到诊断信息中"""
+        for chunk in chunks:
+            diagnostics.rows += len(chunk)
+            yield chunk
+
+    @staticmethod
+    def _stream_value_types(
+        uploaded_file: Any, chunk_size: int
+    ) -> Dict[Any, List[str]]:
+        """
+        流式读取一遍insert工作表，逐块推断并合并整张工作表的值类型（见 BulkSQLEngine.value_types）
+
+        Args:
+            uploaded_file: 上传的文件或文件路径
+            chunk_size: 每块读取的行数
+
+        Returns:
+            (表名, 列名列表) -> 各列类型
+        """
+        types = {}
+        for chunk in FileHandler.iter_table_chunks(
+            uploaded_file, EXCEL_SHEETS["insert"], chunk_size, SHEET_COLUMNS["insert"]
+        ):
+            types = BulkSQLEngine.widen_types(types, BulkSQLEngine.value_types(chunk))
+        return types
+
+    def _generate_inserts(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        rows_per_statement: int,
+        max_statement_bytes: Optional[int],
+        diagnostics: Diagnostics,
+        types: Optional[Dict[Any, List[str]]] = None,
+    ) -> Iterator[str]:
+        """
+        由insert工作表数据块生成INSERT语句
+
+        每条语句只含一行时直接按列拼接；否则交给InsertBatcher合并连续的同表同列行。
+
+        Args:
+            chunks: insert工作表的DataFrame块
+            rows_per_statement: 每条INSERT语句合并的行数
+            max_statement_bytes: 每条语句的最大字节数
+            diagnostics: 收集列名和值数量不匹配的行
+            types: 整张工作表的值类型，多块时保证各块字面量写法一致，可选
+
+        Returns:
+            INSERT语句迭代器
+        """
+        batcher = InsertBatcher(rows_per_statement, max_statement_bytes)
+        for chunk in chunks:
+            if batcher.rows_per_statement == 1:
+                statements, mismatched = BulkSQLEngine.insert_statements(
+                    chunk, types=types
+                )
+            else:
+                parts, mismatched = BulkSQLEngine.insert_parts(chunk, types=types)
+                statements = batcher.add(parts)
+            diagnostics.row_errors(mismatched, "列名和值数量不匹配")
+            yield from statements
+        yield from batcher.flush()
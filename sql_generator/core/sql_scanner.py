@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+SQL词法扫描模块 - 单遍扫描SQL文本，跟踪字符串、引号标识符、注释和括号状态，
+定位未闭合的引号、注释和不匹配的括号，并生成屏蔽了字符串和注释内容的文本
+"""
+
+import re
+from typing import Any, Dict, List
+
+# 扫描时关心的位置：注释开始、各类引号、美元引号（$$ 或 $tag$）和括号，其余字符整段跳过
+_SPECIAL = re.compile(r"--|/\*|(?<![\w$])[Ee]'|['\"`]|\$(?:[A-Za-z_]\w*)?\$|[()\[\]]")
+
+# 从开始引号匹配到结束引号，成对的引号（'' "" ``）表示转义
+_QUOTED = {
+    "'": re.compile(r"'[^']*(?:''[^']*)*'"),
+    '"': re.compile(r'"[^"]*(?:""[^"]*)*"'),
+    "`": re.compile(r"`[^`]*(?:``[^`]*)*`"),
+}
+
+# PostgreSQL E'...' 字符串中反斜杠也可转义引号
+_ESCAPE_STRING = re.compile(r"[Ee]'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'", re.DOTALL)
+
+# 引号类型 -> 未闭合时的错误信息
+_UNCLOSED = {
+    "'": "单引号不匹配: 字符串没有闭合",
+    '"': "双引号不匹配: 引号标识符没有闭合",
+    "`": "反引号不匹配: 引号标识符没有闭合",
+    "$": "美元引号不匹配: {tag} 字符串没有闭合",
+    "/*": "注释未闭合: /* 注释没有对应的 */",
+}
+
+# 括号：开括号 -> 闭括号，闭括号 -> 开括号
+_OPENING = {"(": ")", "[": "]"}
+_CLOSING = {")": "(", "]": "["}
+
+# 屏蔽时保留换行，使屏蔽后文本的行列位置与原文一致
+_VISIBLE = re.compile(r"[^\n]")
+
+
+class SQLScanner:
+    """
+    SQL词法扫描器
+
+    用一个正则跳到下一个需要处理的字符，字符串、引号标识符和注释的结束位置用正则匹配或
+    str.find 一次找到，因此扫描时间与文本长度成线性关系，适用于多兆字节的迁移脚本。
+    """
+
+    @staticmethod
+    def scan(sql: str) -> Dict[str, Any]:
+        """
+        扫描SQL文本
+
+        Args:
+            sql: SQL文本
+
+        Returns:
+            {'masked': 字符串和引号标识符的内容、注释整体替换为空格后的文本（长度和换行位置不变）,
+             'problems': [{'message', 'offset'}] 按位置排序的词法问题，offset为问题字符在原文中的偏移}
+        """
+        segments: List[str] = []
+        problems: List[Dict[str, Any]] = []
+        brackets: List[tuple] = []
+        length = len(sql)
+        copied = position = 0
+
+        while True:
+            match = _SPECIAL.search(sql, position)
+            if match is None:
+                break
+            token, start = match.group(), match.start()
+
+            if token in _OPENING or token in _CLOSING:
+                if token in _OPENING:
+                    brackets.append((token, start))
+                elif brackets and brackets[-1][0] == _CLOSING[token]:
+                    brackets.pop()
+                elif brackets:
+                    problems.append(
+                        {
+                            "message": f"括号不匹配: '{token}' 与 '{brackets.pop()[0]}' 不对应",
+                            "offset": start,
+                        }
+                    )
+                else:
+                    problems.append(
+                        {
+                            "message": f"括号不匹配: '{token}' 没有对应的 '{_CLOSING[token]}'",
+                            "offset": start,
+                        }
+                    )
+                position = match.end()
+                continue
+
+            # 字符串、引号标识符和注释：找到结束位置，opening/closing 为屏蔽时保留的起止定界符长度
+            opening = closing = 0
+            if token == "--":
+                end = sql.find("\n", start)
+                end = length if end == -1 else end
+            elif token == "/*":
+                end = sql.find("*/", start + 2)
+                if end == -1:
+                    problems.append({"message": _UNCLOSED["/*"], "offset": start})
+                    end = length
+                else:
+                    end += 2
+            elif token[0] == "$":
+                end = sql.find(token, match.end())
+                if end == -1:
+                    problems.append(
+                        {"message": _UNCLOSED["$"].format(tag=token), "offset": start}
+                    )
+                    end = length
+                else:
+                    end += len(token)
+                    opening = closing = len(token)
+            else:
+                quoted = (_ESCAPE_STRING if len(token) == 2 else _QUOTED[token]).match(
+                    sql, start
+                )
+                if quoted is None:
+                    problems.append({"message": _UNCLOSED[token[-1]], "offset": start})
+                    end = length
+                else:
+                    end = quoted.end()
+                    opening, closing = len(token), 1
+
+            segments.append(sql[copied:start])
+            segments.append(
+                sql[start : start + opening]
+                + _VISIBLE.sub(" ", sql[start + opening : end - closing])
+                + sql[end - closing : end]
+            )
+            copied = position = end
+
+        segments.append(sql[copied:])
+        for bracket, opened_at in brackets:
+            problems.append(
+                {
+                    "message": f"括号不匹配: '{bracket}' 没有对应的 '{_OPENING[bracket]}'",
+                    "offset": opened_at,
+                }
+            )
+        problems.sort(key=lambda problem: problem["offset"])
+        return {"masked": "".join(segments), "problems": problems}
@@ -1,6 +1,12 @@
-# -*- coding: utf-8 -*-
-"""
-UI package initialization
-"""
-
-from sql_generator.ui.main_app import run_app
+# -*- coding: utf-8 -*-
+"""
+UI package initialization
+"""
+
+
+def __getattr__(name):
+    """按需导入run_app，导入本包时不加载Streamlit和UI模块"""
+    if name == 'run_app':
+        from sql_generator.ui.main_app import run_app
+        return run_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
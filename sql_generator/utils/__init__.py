@@ -1,4 +1,4 @@
-# -*- coding: utf-8 -*-
-"""
-Utils package initialization
-"""
+# -*- coding: utf-8 -*-
+"""
+Utils package initialization
+"""
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+诊断信息模块 - 收集生成过程中的错误和警告，由调用方（UI、命令行）决定如何展示
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+class Diagnostics:
+    """生成过程中收集的错误、警告和提示信息"""
+
+    ERROR = "error"
+    WARNING = "warning"
+    INFO = "info"
+
+    def __init__(self):
+        """初始化空的诊断信息"""
+        self.entries: List[Dict[str, Any]] = []
+        # 生成过程中读取的数据行数
+        self.rows = 0
+
+    def add(self, level: str, message: str, row: Optional[int] = None):
+        """
+        添加一条诊断信息
+
+        Args:
+            level: 级别，error、warning或info
+            message: 信息内容
+            row: 相关的数据行索引（从0开始），可选
+        """
+        self.entries.append({"level": level, "message": message, "row": row})
+
+    def error(self, message: str, row: Optional[int] = None):
+        """添加一条错误"""
+        self.add(self.ERROR, message, row)
+
+    def warning(self, message: str, row: Optional[int] = None):
+        """添加一条警告"""
+        self.add(self.WARNING, message, row)
+
+    def info(self, message: str, row: Optional[int] = None):
+        """添加一条提示"""
+        self.add(self.INFO, message, row)
+
+    def row_errors(self, rows: Iterable[int], problem: str):
+        """
+        为每个不合法的数据行添加一条错误，如 "第 3 行的列名和值数量不匹配"
+
+        Args:
+            rows: 数据行索引（从0开始）
+            problem: 问题描述
+        """
+        for index in rows:
+            self.error(f"第 {index+1} 行的{problem}", index)
+
+    def extend(self, other: "Diagnostics"):
+        """合并另一组诊断信息"""
+        self.entries.extend(other.entries)
+        self.rows += other.rows
+
+    @property
+    def errors(self) -> List[str]:
+        """全部错误信息"""
+        return [
+            entry["message"] for entry in self.entries if entry["level"] == self.ERROR
+        ]
+
+    @property
+    def warnings(self) -> List[str]:
+        """全部警告信息"""
+        return [
+            entry["message"] for entry in self.entries if entry["level"] == self.WARNING
+        ]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class GeneratedSQL(list):
+    """
+    生成的SQL语句列表，通过 diagnostics 属性附带生成过程中的错误和警告
+
+    可以像普通列表一样使用，也可以在进程之间传递。
+    """
+
+    def __init__(
+        self, statements: Iterable[str] = (), diagnostics: Optional[Diagnostics] = None
+    ):
+        """
+        初始化语句列表
+
+        Args:
+            statements: SQL语句
+            diagnostics: 诊断信息，默认为空
+        """
+        super().__init__(statements)
+        self.diagnostics = diagnostics if diagnostics is not None else Diagnostics()
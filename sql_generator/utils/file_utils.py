@@ -1,78 +1,525 @@
-# -*- coding: utf-8 -*-
-"""
-文件处理工具模块
-"""
-
-import streamlit as st
-import pandas as pd
-import os
-from typing import Optional, List, Dict, Any
-from sql_generator.config.constants import MIME_TYPES, SUPPORTED_FILE_TYPES
-from sql_generator.utils.security import SecurityManager
-
-
-class FileHandler:
-    """文件处理类"""
-    
-    @staticmethod
-    def validate_file_type(file, allowed_types: List[str] = None) -> bool:
-        """验证文件类型（包含安全验证）"""
-        if file is None:
-            return False
-        
-        # 基本类型验证
-        if allowed_types is None:
-            allowed_types = SUPPORTED_FILE_TYPES
-            
-        file_extension = file.name.split('.')[-1].lower()
-        basic_validation = file_extension in allowed_types
-        
-        if not basic_validation:
-            return False
-        
-        # 安全验证
-        return SecurityManager.validate_upload_file(file)
-    
-    @staticmethod
-    def read_excel_safely(file_path: str, sheet_name: str) -> Optional[pd.DataFrame]:
-        """安全读取Excel文件"""
-        try:
-            return pd.read_excel(file_path, sheet_name=sheet_name)
-        except FileNotFoundError:
-            st.error(f"文件未找到: {file_path}")
-            return None
-        except ValueError as e:
-            st.error(f"工作表 '{sheet_name}' 不存在: {e}")
-            return None
-        except Exception as e:
-            st.error(f"读取文件时发生错误: {e}")
-            return None
-    
-    @staticmethod
-    def create_download_button(button_name: str, file_path: str, file_type: str) -> bool:
-        """创建下载按钮"""
-        if not os.path.exists(file_path):
-            st.error(f"文件不存在: {file_path}")
-            return False
-        
-        try:
-            with open(file_path, "rb") as file:
-                file_bytes = file.read()
-            
-            mime_type = MIME_TYPES.get(file_type, "text/plain")
-            
-            if mime_type == "text/plain":
-                st.warning(f"不支持的文件类型: {file_type}")
-                return False
-            
-            st.download_button(
-                label=button_name,
-                data=file_bytes,
-                file_name=os.path.basename(file_path),
-                mime=mime_type
-            )
-            return True
-            
-        except Exception as e:
-            st.error(f"创建下载按钮时发生错误: {e}")
-            return False
+# -*- coding: utf-8 -*-
+"""
+文件处理工具模块
+"""
+
+import csv
+import io
+import os
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+from sql_generator.config.constants import BULK_CONFIG, MIME_TYPES, SUPPORTED_FILE_TYPES
+from sql_generator.utils.diagnostics import Diagnostics
+from sql_generator.utils.security import SecurityManager
+from sql_generator.utils.workbook_cache import WorkbookCache, workbook_cache
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# 文件扩展名对应的数据格式
+FILE_FORMATS = {
+    "xlsx": "excel",
+    "xlsm": "excel",
+    "xls": "excel",
+    "csv": "csv",
+    "parquet": "parquet",
+    "pq": "parquet",
+    "arrow": "arrow",
+    "feather": "arrow",
+    "ipc": "arrow",
+}
+
+# 无扩展名时按文件头识别格式
+_MAGIC_FORMATS = [
+    (b"PK\x03\x04", "excel"),
+    (b"\xd0\xcf\x11\xe0", "excel"),
+    (b"PAR1", "parquet"),
+    (b"ARROW1", "arrow"),
+]
+
+
+class FileHandler:
+    """文件处理类"""
+
+    @staticmethod
+    def validate_file_type(file, allowed_types: List[str] = None) -> bool:
+        """验证文件类型（包含安全验证）"""
+        if file is None:
+            return False
+
+        # 基本类型验证
+        if allowed_types is None:
+            allowed_types = SUPPORTED_FILE_TYPES
+
+        file_extension = file.name.split(".")[-1].lower()
+        basic_validation = file_extension in allowed_types
+
+        if not basic_validation:
+            return False
+
+        # 安全验证
+        return SecurityManager.validate_upload_file(file)
+
+    @staticmethod
+    def read_excel_safely(
+        file_path: str,
+        sheet_name: str,
+        use_cache: bool = True,
+        columns: Optional[List[List[str]]] = None,
+        diagnostics: Optional[Diagnostics] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        安全读取Excel文件
+
+        默认通过工作簿缓存读取（工作簿只打开一次，每个工作表只解析一次，并按内容哈希缓存）；
+        use_cache为False时只解析指定的工作表，适用于各工作表由不同进程分别生成的场景。
+        已安装python-calamine时使用calamine引擎；所有值按字符串读取，columns给出时只读取需要的列。
+        读取失败时返回None，原因记入diagnostics。
+        """
+        diagnostics = diagnostics if diagnostics is not None else Diagnostics()
+        try:
+            if use_cache:
+                df = workbook_cache.get_sheet(file_path, sheet_name, columns)
+            else:
+                df = WorkbookCache.parse_sheet(file_path, sheet_name, columns)
+            if df is None:
+                diagnostics.error(f"工作表 '{sheet_name}' 不存在")
+            return df
+        except FileNotFoundError:
+            diagnostics.error(f"文件未找到: {file_path}")
+            return None
+        except ValueError as e:
+            diagnostics.error(f"工作表 '{sheet_name}' 读取失败: {e}")
+            return None
+        except Exception as e:
+            diagnostics.error(f"读取文件时发生错误: {e}")
+            return None
+
+    @staticmethod
+    def detect_format(file_path: Any) -> str:
+        """
+        判断数据文件格式：优先按扩展名，无法判断时按文件头识别
+
+        Args:
+            file_path: 文件路径或文件对象
+
+        Returns:
+            'excel'、'csv'、'parquet' 或 'arrow'
+        """
+        name = (
+            file_path
+            if isinstance(file_path, str)
+            else getattr(file_path, "name", None)
+        )
+        if isinstance(name, str) and "." in name:
+            file_format = FILE_FORMATS.get(name.rsplit(".", 1)[-1].lower())
+            if file_format:
+                return file_format
+
+        if hasattr(file_path, "read"):
+            file_path.seek(0)
+            head = file_path.read(8)
+            file_path.seek(0)
+        else:
+            with open(file_path, "rb") as file:
+                head = file.read(8)
+        for magic, file_format in _MAGIC_FORMATS:
+            if head.startswith(magic):
+                return file_format
+        return "csv"
+
+    @staticmethod
+    def read_table(
+        file_path: Any,
+        sheet_name: str,
+        columns: Optional[List[List[str]]] = None,
+        use_cache: bool = True,
+        diagnostics: Optional[Diagnostics] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        读取生成器的输入数据，支持Excel、CSV、Parquet和Arrow文件
+
+        Excel文件读取指定工作表；CSV/Parquet/Arrow文件只包含一张表，直接作为该工作表的数据。
+        CSV的所有值按字符串读取（安装pyarrow时使用pyarrow引擎），Parquet/Arrow只读取需要的列。
+
+        Args:
+            file_path: 文件路径或文件对象
+            sheet_name: 工作表名称（仅Excel文件使用）
+            columns: 候选的列名组合（见SHEET_COLUMNS），第一组全部存在的列将被单独读取
+            use_cache: Excel文件是否通过工作簿缓存读取
+            diagnostics: 收集读取错误的诊断信息
+
+        Returns:
+            数据DataFrame，读取失败时返回None
+        """
+        diagnostics = diagnostics if diagnostics is not None else Diagnostics()
+        try:
+            file_format = FileHandler.detect_format(file_path)
+            if file_format == "excel":
+                return FileHandler.read_excel_safely(
+                    file_path, sheet_name, use_cache, columns, diagnostics
+                )
+            if file_format == "csv":
+                names = FileHandler._project(
+                    FileHandler._csv_header(file_path), columns
+                )
+                return pd.read_csv(
+                    FileHandler._rewind(file_path),
+                    dtype=str,
+                    usecols=names,
+                    keep_default_na=False,
+                    na_values=[""],
+                    engine="pyarrow" if ARROW_AVAILABLE else "c",
+                )
+
+            FileHandler._require_arrow(file_format)
+            if file_format == "parquet":
+                parquet_file = pq.ParquetFile(FileHandler._rewind(file_path))
+                names = FileHandler._project(parquet_file.schema_arrow.names, columns)
+                return parquet_file.read(columns=names).to_pandas()
+            reader = pa.ipc.open_file(FileHandler._rewind(file_path))
+            names = FileHandler._project(reader.schema.names, columns)
+            table = reader.read_all()
+            return (table.select(names) if names else table).to_pandas()
+        except FileNotFoundError:
+            diagnostics.error(f"文件未找到: {file_path}")
+            return None
+        except Exception as e:
+            diagnostics.error(f"读取文件时发生错误: {e}")
+            return None
+
+    @staticmethod
+    def iter_table_chunks(
+        file_path: Any,
+        sheet_name: str,
+        chunk_size: int = BULK_CONFIG["chunk_size"],
+        columns: Optional[List[List[str]]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        按块流式读取生成器的输入数据，支持Excel、CSV、Parquet和Arrow文件
+
+        每块最多包含chunk_size行，行索引为从0开始的数据行号。CSV在安装pyarrow时以
+        pyarrow流式读取器按块解析，否则使用pandas的分块读取。
+
+        Args:
+            file_path: 文件路径或文件对象
+            sheet_name: 工作表名称（仅Excel文件使用）
+            chunk_size: 每块行数
+            columns: 候选的列名组合，第一组全部存在的列将被单独读取
+
+        Returns:
+            DataFrame块迭代器
+        """
+        file_format = FileHandler.detect_format(file_path)
+        if file_format == "excel":
+            yield from FileHandler.iter_excel_chunks(
+                file_path, sheet_name, chunk_size, columns
+            )
+            return
+
+        if file_format == "csv":
+            header = FileHandler._csv_header(file_path)
+            names = FileHandler._project(header, columns)
+            if not ARROW_AVAILABLE:
+                yield from pd.read_csv(
+                    FileHandler._rewind(file_path),
+                    dtype=str,
+                    usecols=names,
+                    keep_default_na=False,
+                    na_values=[""],
+                    chunksize=chunk_size,
+                )
+                return
+            batches = pa_csv.open_csv(
+                FileHandler._rewind(file_path),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    include_columns=names,
+                    strings_can_be_null=True,
+                    null_values=[""],
+                ),
+            )
+        else:
+            FileHandler._require_arrow(file_format)
+            if file_format == "parquet":
+                parquet_file = pq.ParquetFile(FileHandler._rewind(file_path))
+                names = FileHandler._project(parquet_file.schema_arrow.names, columns)
+                batches = parquet_file.iter_batches(
+                    batch_size=chunk_size, columns=names
+                )
+            else:
+                reader = pa.ipc.open_file(FileHandler._rewind(file_path))
+                names = FileHandler._project(reader.schema.names, columns)
+                batches = (
+                    reader.get_batch(i) for i in range(reader.num_record_batches)
+                )
+                if names:
+                    batches = (batch.select(names) for batch in batches)
+        yield from FileHandler._rebatch(batches, chunk_size)
+
+    @staticmethod
+    def _rebatch(batches: Iterable[Any], chunk_size: int) -> Iterator[pd.DataFrame]:
+        """将任意大小的Arrow记录批重新切分为chunk_size行的DataFrame块，行索引连续"""
+        pending, rows, start = [], 0, 0
+        for batch in batches:
+            pending.append(batch)
+            rows += batch.num_rows
+            while rows >= chunk_size:
+                table = pa.Table.from_batches(pending)
+                yield FileHandler._arrow_chunk(table.slice(0, chunk_size), start)
+                start += chunk_size
+                rest = table.slice(chunk_size)
+                pending, rows = rest.to_batches(), rest.num_rows
+        if rows:
+            yield FileHandler._arrow_chunk(pa.Table.from_batches(pending), start)
+
+    @staticmethod
+    def _arrow_chunk(table: "pa.Table", start: int) -> pd.DataFrame:
+        """将Arrow表转换为从start开始编号的DataFrame块"""
+        df = table.to_pandas()
+        df.index = range(start, start + len(df))
+        return df
+
+    @staticmethod
+    def _project(
+        available: List[str], columns: Optional[List[List[str]]]
+    ) -> Optional[List[str]]:
+        """返回第一组全部存在于文件中的候选列，没有时返回None（读取全部列）"""
+        for names in columns or []:
+            if all(name in available for name in names):
+                return list(names)
+        return None
+
+    @staticmethod
+    def _csv_header(file_path: Any) -> List[str]:
+        """只读取CSV文件的表头行"""
+        if hasattr(file_path, "read"):
+            file_path.seek(0)
+            line = file_path.readline()
+            file_path.seek(0)
+            if isinstance(line, bytes):
+                line = line.decode("utf-8-sig")
+        else:
+            with open(file_path, "r", encoding="utf-8-sig", newline="") as file:
+                line = file.readline()
+        return next(csv.reader(io.StringIO(line)), [])
+
+    @staticmethod
+    def _rewind(file_path: Any) -> Any:
+        """将文件对象的读取位置重置到开头"""
+        if hasattr(file_path, "seek"):
+            file_path.seek(0)
+        return file_path
+
+    @staticmethod
+    def _require_arrow(file_format: str):
+        """检查读取Parquet/Arrow文件所需的pyarrow是否已安装"""
+        if not ARROW_AVAILABLE:
+            raise ImportError(f"读取{file_format}文件需要安装pyarrow")
+
+    @staticmethod
+    def count_rows(file_path: Any, sheet_name: str) -> Optional[int]:
+        """
+        不解析单元格数据，估计工作表或数据文件的数据行数（用于显示进度）
+
+        Excel取工作表记录的尺寸，CSV按换行符计数（字段中含换行时偏大），
+        Parquet和Arrow取文件元数据中的行数。
+
+        Args:
+            file_path: 文件路径或文件对象
+            sheet_name: 工作表名称（仅Excel文件使用）
+
+        Returns:
+            数据行数（不含表头），无法估计时返回None
+        """
+        try:
+            file_format = FileHandler.detect_format(file_path)
+            if file_format == "excel":
+                from openpyxl import load_workbook
+
+                workbook = load_workbook(FileHandler._rewind(file_path), read_only=True)
+                try:
+                    if sheet_name not in workbook.sheetnames:
+                        return None
+                    max_row = workbook[sheet_name].max_row
+                    return max(max_row - 1, 0) if max_row else None
+                finally:
+                    workbook.close()
+            if file_format == "csv":
+                data = WorkbookCache.read_bytes(file_path)
+                lines = data.count(b"\n") + (0 if data.endswith(b"\n") else 1)
+                return max(lines - 1, 0)
+            FileHandler._require_arrow(file_format)
+            if file_format == "parquet":
+                return pq.ParquetFile(FileHandler._rewind(file_path)).metadata.num_rows
+            reader = pa.ipc.open_file(FileHandler._rewind(file_path))
+            return sum(
+                reader.get_batch(i).num_rows for i in range(reader.num_record_batches)
+            )
+        except Exception:
+            return None
+        finally:
+            FileHandler._rewind(file_path)
+
+    @staticmethod
+    def get_sheet_names(file_path: Any) -> List[str]:
+        """
+        只读取工作簿的工作表名称，不解析单元格数据
+
+        Args:
+            file_path: 文件路径或文件对象
+
+        Returns:
+            工作表名称列表
+        """
+        from openpyxl import load_workbook
+
+        if hasattr(file_path, "seek"):
+            file_path.seek(0)
+        workbook = load_workbook(file_path, read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def iter_excel_chunks(
+        file_path: Any,
+        sheet_name: str,
+        chunk_size: int = BULK_CONFIG["chunk_size"],
+        columns: Optional[List[List[str]]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        以只读模式流式读取Excel工作表，按块产出DataFrame
+
+        第一行作为表头，每块最多包含chunk_size行，行索引与read_excel_safely一致（从0开始的数据行号）。
+        流式读取始终使用openpyxl的只读模式，内存占用只与chunk_size相关。单元格值与 read_excel(dtype=str)
+        一样转换为字符串（整数值的数字不带小数点，日期为 2024-01-02 00:00:00，NULL等缺失值标记为NaN），
+        生成的语句与整表读取时相同，不受分块方式影响。
+
+        Args:
+            file_path: 文件路径或文件对象
+            sheet_name: 工作表名称
+            chunk_size: 每块行数
+            columns: 候选的列名组合，第一组全部存在的列将被单独保留
+
+        Returns:
+            DataFrame块迭代器
+        """
+        from openpyxl import load_workbook
+
+        if hasattr(file_path, "seek"):
+            file_path.seek(0)
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            names = [
+                str(name) if name is not None else f"Unnamed: {i}"
+                for i, name in enumerate(header)
+            ]
+            projected = FileHandler._project(names, columns) or names
+            positions = [names.index(name) for name in projected]
+
+            start = 0
+            buffer = []
+            for row in rows:
+                buffer.append(
+                    [
+                        FileHandler._excel_cell(row[i]) if i < len(row) else ""
+                        for i in positions
+                    ]
+                )
+                if len(buffer) >= chunk_size:
+                    yield FileHandler._excel_chunk(buffer, projected, start)
+                    start += len(buffer)
+                    buffer = []
+            if buffer:
+                yield FileHandler._excel_chunk(buffer, projected, start)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _excel_cell(value: Any) -> Any:
+        """与pandas的openpyxl读取器相同地转换单元格值：空单元格为空字符串，值为整数的数字转换为int"""
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    @staticmethod
+    def _excel_chunk(rows: List[list], names: List[str], start: int) -> pd.DataFrame:
+        """按 read_excel(dtype=str) 的规则把一块单元格值解析为字符串列的DataFrame，行索引从start开始"""
+        df = TextParser(rows, names=names, header=None, dtype=str).read()
+        df.index = range(start, start + len(df))
+        return df
+
+    @staticmethod
+    def write_sql_stream(
+        statements: Iterable[str], target: Union[str, BinaryIO], separator: str = "\n"
+    ) -> int:
+        """
+        将SQL语句逐条写入文件或字节缓冲区，不在内存中拼接完整脚本
+
+        Args:
+            statements: SQL语句迭代器
+            target: 输出文件路径或可写的二进制缓冲区
+            separator: 语句之间的分隔符
+
+        Returns:
+            写入的语句数量
+        """
+        if isinstance(target, str):
+            with open(target, "wb") as file:
+                return FileHandler.write_sql_stream(statements, file, separator)
+
+        count = 0
+        for statement in statements:
+            target.write((statement + separator).encode("utf-8"))
+            count += 1
+        return count
+
+    @staticmethod
+    def create_download_button(
+        button_name: str, file_path: str, file_type: str
+    ) -> bool:
+        """创建下载按钮"""
+        import streamlit as st
+
+        if not os.path.exists(file_path):
+            st.error(f"文件不存在: {file_path}")
+            return False
+
+        try:
+            with open(file_path, "rb") as file:
+                file_bytes = file.read()
+
+            mime_type = MIME_TYPES.get(file_type, "text/plain")
+
+            if mime_type == "text/plain":
+                st.warning(f"不支持的文件类型: {file_type}")
+                return False
+
+            st.download_button(
+                label=button_name,
+                data=file_bytes,
+                file_name=os.path.basename(file_path),
+                mime=mime_type,
+            )
+            return True
+
+        except Exception as e:
+            st.error(f"创建下载按钮时发生错误: {e}")
+            return False
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+后台任务模块 - 在共享的线程池中运行耗时的生成任务，支持进度查询和取消
+
+Streamlit每次重跑脚本时按任务键找回正在运行的任务，而不是重新开始生成。
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from sql_generator.config.constants import BULK_CONFIG
+
+
+class JobCancelled(Exception):
+    """任务已被取消"""
+
+
+class Job:
+    """
+    后台生成任务
+
+    任务函数通过 rows 报告已处理的数据行数，并在处理每块数据之前调用
+    check_cancelled，收到取消请求时抛出JobCancelled结束任务。
+    """
+
+    RUNNING = "running"
+    DONE = "done"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+    def __init__(self, key: str, total: Optional[int] = None):
+        """
+        初始化任务
+
+        Args:
+            key: 任务键（相同输入和参数的任务键相同）
+            total: 预计处理的数据行数，未知时为None
+        """
+        self.key = key
+        self.total = total
+        self.rows = 0
+        self.started = time.time()
+        self.future: Optional[Future] = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def progress(self) -> Optional[float]:
+        """已处理行数占预计行数的比例（0到1），预计行数未知时为None"""
+        if not self.total:
+            return None
+        return min(self.rows / self.total, 1.0)
+
+    @property
+    def status(self) -> str:
+        """任务状态：running、done、cancelled 或 failed"""
+        if self.future is None or not self.future.done():
+            return self.RUNNING
+        if self.future.cancelled() or isinstance(self.future.exception(), JobCancelled):
+            return self.CANCELLED
+        return self.FAILED if self.future.exception() is not None else self.DONE
+
+    @property
+    def error(self) -> Optional[str]:
+        """任务失败时的错误信息"""
+        return str(self.future.exception()) if self.status == self.FAILED else None
+
+    def result(self) -> Any:
+        """返回任务结果（任务未完成时等待）"""
+        return self.future.result()
+
+    def cancel(self):
+        """请求取消任务：尚未开始的任务直接取消，运行中的任务在处理下一块数据前结束"""
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancel_requested(self) -> bool:
+        """是否已请求取消"""
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        """已请求取消时抛出JobCancelled"""
+        if self._cancel_event.is_set():
+            raise JobCancelled(f"任务 {self.key} 已取消")
+
+
+class JobManager:
+    """
+    后台任务管理器
+
+    所有页面和会话共享同一个线程池；相同任务键在运行或已完成时直接返回已有任务，
+    已取消或失败的任务再次提交时重新开始。
+    """
+
+    def __init__(self, max_workers: int = BULK_CONFIG["job_workers"]):
+        """
+        初始化任务管理器
+
+        Args:
+            max_workers: 同时运行的任务数
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, int(max_workers)), thread_name_prefix="sql-generator-job"
+        )
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        key: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        total: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Job:
+        """
+        提交任务，任务函数以 fn(job, *args, **kwargs) 的形式调用
+
+        Args:
+            key: 任务键
+            fn: 任务函数，第一个参数为Job
+            total: 预计处理的数据行数
+            *args, **kwargs: 传给任务函数的其他参数
+
+        Returns:
+            新提交或已存在的任务
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.status in (Job.RUNNING, Job.DONE):
+                return job
+            job = Job(key, total)
+            self._jobs[key] = job
+            job.future = self._executor.submit(fn, job, *args, **kwargs)
+            return job
+
+    def get(self, key: str) -> Optional[Job]:
+        """按任务键查找任务"""
+        with self._lock:
+            return self._jobs.get(key)
+
+    def discard(self, key: str) -> Optional[Job]:
+        """
+        移除任务（结果已被取走时释放内存），运行中的任务同时被取消
+
+        Args:
+            key: 任务键
+
+        Returns:
+            被移除的任务
+        """
+        with self._lock:
+            job = self._jobs.pop(key, None)
+        if job is not None and job.status == Job.RUNNING:
+            job.cancel()
+        return job
+
+
+# 全局共享的任务管理器
+job_manager = JobManager()
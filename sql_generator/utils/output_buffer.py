@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+输出缓冲区模块 - 生成的SQL脚本在阈值以内保存在内存中，超过阈值后溢出到临时文件
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import weakref
+from typing import BinaryIO, Iterator, Optional
+
+from sql_generator.config.constants import BULK_CONFIG
+
+
+class SQLOutputBuffer:
+    """
+    可溢出到磁盘的只追加字节缓冲区
+
+    写入的内容不超过max_memory_bytes时保存在内存中；超过后整体转存到临时文件，之后的写入
+    直接追加到文件，内存占用不随脚本大小增长。可作为 FileHandler.write_sql_stream 的写入目标，
+    下载、保存和预览都从缓冲区（或临时文件）按需读取。临时文件在 close 或缓冲区被回收时删除，
+    关闭后再写入或读取会引发 ValueError。
+    """
+
+    def __init__(self, max_memory_bytes: int = BULK_CONFIG["spill_threshold_bytes"]):
+        """
+        初始化缓冲区
+
+        Args:
+            max_memory_bytes: 保存在内存中的最大字节数，超过后溢出到临时文件
+        """
+        self.max_memory_bytes = max(0, int(max_memory_bytes))
+        self.size = 0
+        self.path: Optional[str] = None
+        self._memory: Optional[io.BytesIO] = io.BytesIO()
+        self._file: Optional[BinaryIO] = None
+        self._finalizer = None
+        self.closed = False
+
+    @property
+    def spilled(self) -> bool:
+        """内容是否已溢出到临时文件"""
+        return self.path is not None
+
+    def write(self, data: bytes) -> int:
+        """
+        追加写入字节
+
+        Args:
+            data: 写入的内容
+
+        Returns:
+            写入的字节数
+        """
+        self._check_open()
+        if self._memory is not None and self.size + len(data) > self.max_memory_bytes:
+            self._spill()
+        (self._file if self._file is not None else self._memory).write(data)
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        """将已写入的内容刷新到临时文件"""
+        if self._file is not None:
+            self._file.flush()
+
+    def open(self) -> BinaryIO:
+        """
+        打开一个独立的只读流，从头读取已写入的全部内容
+
+        Returns:
+            二进制只读流（溢出后为临时文件的新句柄，调用方负责关闭）
+        """
+        self._check_open()
+        if self._memory is not None:
+            return io.BytesIO(self._memory.getvalue())
+        self.flush()
+        return open(self.path, "rb")
+
+    def iter_bytes(self, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """按块读取全部内容"""
+        with self.open() as stream:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def getvalue(self) -> bytes:
+        """返回全部内容（会把整个脚本读入内存，仅适用于较小的输出）"""
+        with self.open() as stream:
+            return stream.read()
+
+    def save(self, path: str) -> int:
+        """
+        按块复制全部内容到文件，不把整个脚本读入内存
+
+        Args:
+            path: 目标文件路径
+
+        Returns:
+            写入的字节数
+        """
+        with self.open() as stream, open(path, "wb") as file:
+            shutil.copyfileobj(stream, file)
+        return self.size
+
+    def preview(self, max_bytes: int = BULK_CONFIG["preview_bytes"]) -> str:
+        """
+        读取开头的一部分内容用于页面预览
+
+        Args:
+            max_bytes: 最多读取的字节数
+
+        Returns:
+            解码后的文本（截断处不完整的字符被丢弃）
+        """
+        with self.open() as stream:
+            return stream.read(max_bytes).decode("utf-8", errors="ignore")
+
+    def close(self):
+        """关闭并删除临时文件，释放内存"""
+        if self._finalizer is not None:
+            self._finalizer()
+        self._memory = None
+        self._file = None
+        self.closed = True
+
+    def __enter__(self) -> "SQLOutputBuffer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _check_open(self):
+        """缓冲区已关闭时引发 ValueError"""
+        if self.closed:
+            raise ValueError("buffer is closed")
+
+    def _spill(self):
+        """将内存中的内容转存到临时文件，之后的写入追加到文件"""
+        fd, self.path = tempfile.mkstemp(prefix="sql_generator_", suffix=".sql")
+        self._file = os.fdopen(fd, "w+b")
+        self._memory.seek(0)
+        shutil.copyfileobj(self._memory, self._file)
+        self._memory = None
+        self._finalizer = weakref.finalize(
+            self, SQLOutputBuffer._remove, self._file, self.path
+        )
+
+    @staticmethod
+    def _remove(file: BinaryIO, path: str):
+        """关闭并删除临时文件"""
+        file.close()
+        try:
+            os.remove(path)
+        except OSError:
+            pass
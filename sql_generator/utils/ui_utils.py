@@ -1,101 +1,155 @@
-# -*- coding: utf-8 -*-
-"""
-UI工具模块
-"""
-
-import streamlit as st
-from typing import Optional, Any
-from sql_generator.config.constants import MIME_TYPES
-
-
-class SessionStateManager:
-    """Session State管理类"""
-    
-    @staticmethod
-    def init_session_state():
-        """初始化session state"""
-        if 'uploaded_file' not in st.session_state:
-            st.session_state.uploaded_file = None
-        if 'current_page' not in st.session_state:
-            st.session_state.current_page = None
-        if 'current_sub_page' not in st.session_state:
-            st.session_state.current_sub_page = None
-    
-    @staticmethod
-    def get_uploaded_file():
-        """获取上传的文件"""
-        return st.session_state.get('uploaded_file', None)
-    
-    @staticmethod
-    def set_uploaded_file(file):
-        """设置上传的文件"""
-        st.session_state.uploaded_file = file
-
-
-class InputValidator:
-    """输入验证类"""
-    
-    @staticmethod
-    def validate_table_name(table_name: str) -> bool:
-        """验证表名（包含安全验证）"""
-        if not table_name or not table_name.strip():
-            return False
-        
-        # 使用安全验证器
-        from sql_generator.utils.security import SecurityManager
-        return SecurityManager.validate_sql_inputs(table_name=table_name.strip())
-    
-    @staticmethod
-    def validate_column_list(column_list: str) -> bool:
-        """验证列名列表（包含安全验证）"""
-        if not column_list or not column_list.strip():
-            return False
-        
-        # 使用安全验证器
-        from sql_generator.utils.security import SecurityManager
-        return SecurityManager.validate_sql_inputs(columns=column_list.strip())
-
-
-class UIHelper:
-    """UI辅助类"""
-    
-    @staticmethod
-    def show_error(message: str):
-        """显示错误消息"""
-        st.error(f"❌ {message}")
-    
-    @staticmethod
-    def show_success(message: str):
-        """显示成功消息"""
-        st.success(f"✅ {message}")
-    
-    @staticmethod
-    def show_warning(message: str):
-        """显示警告消息"""
-        st.warning(f"⚠️ {message}")
-    
-    @staticmethod
-    def show_info(message: str):
-        """显示信息消息"""
-        st.info(f"ℹ️ {message}")
-    
-    @staticmethod
-    def create_section_header(title: str, description: str = None):
-        """创建节标题"""
-        st.header(title)
-        if description:
-            st.markdown(f"*{description}*")
-        st.markdown("---")  # 使用markdown横线替代st.divider()
-    
-    @staticmethod
-    def display_sql_with_download(sql_content: str, filename: str, title: str = "生成的SQL语句"):
-        """显示SQL内容并提供下载按钮"""
-        st.subheader(title)
-        st.code(sql_content, language='sql')
-        
-        st.download_button(
-            label="📥 下载SQL文件",
-            data=sql_content,
-            file_name=filename,
-            mime=MIME_TYPES['sql']
-        )
+# -*- coding: utf-8 -*-
+"""
+UI工具模块
+"""
+
+import os
+import streamlit as st
+from typing import Optional, Any, Union
+from sql_generator.config.constants import MIME_TYPES
+from sql_generator.utils.output_buffer import SQLOutputBuffer
+
+# 较新的Streamlit支持以函数作为下载内容，点击下载时才读取
+try:
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    DEFERRED_DOWNLOAD = hasattr(MediaFileManager, 'add_deferred')
+except ImportError:
+    DEFERRED_DOWNLOAD = False
+
+
+class SessionStateManager:
+    """Session State管理类"""
+    
+    @staticmethod
+    def init_session_state():
+        """初始化session state"""
+        if 'uploaded_file' not in st.session_state:
+            st.session_state.uploaded_file = None
+        if 'current_page' not in st.session_state:
+            st.session_state.current_page = None
+        if 'current_sub_page' not in st.session_state:
+            st.session_state.current_sub_page = None
+    
+    @staticmethod
+    def get_uploaded_file():
+        """获取上传的文件"""
+        return st.session_state.get('uploaded_file', None)
+    
+    @staticmethod
+    def set_uploaded_file(file):
+        """设置上传的文件"""
+        st.session_state.uploaded_file = file
+
+
+class InputValidator:
+    """输入验证类"""
+    
+    @staticmethod
+    def validate_table_name(table_name: str) -> bool:
+        """验证表名（包含安全验证）"""
+        if not table_name or not table_name.strip():
+            return False
+        
+        # 使用安全验证器
+        from sql_generator.utils.security import SecurityManager
+        return SecurityManager.validate_sql_inputs(table_name=table_name.strip())
+    
+    @staticmethod
+    def validate_column_list(column_list: str) -> bool:
+        """验证列名列表（包含安全验证）"""
+        if not column_list or not column_list.strip():
+            return False
+        
+        # 使用安全验证器
+        from sql_generator.utils.security import SecurityManager
+        return SecurityManager.validate_sql_inputs(columns=column_list.strip())
+
+
+class UIHelper:
+    """UI辅助类"""
+    
+    @staticmethod
+    def show_error(message: str):
+        """显示错误消息"""
+        st.error(f"❌ {message}")
+    
+    @staticmethod
+    def show_success(message: str):
+        """显示成功消息"""
+        st.success(f"✅ {message}")
+    
+    @staticmethod
+    def show_warning(message: str):
+        """显示警告消息"""
+        st.warning(f"⚠️ {message}")
+    
+    @staticmethod
+    def show_info(message: str):
+        """显示信息消息"""
+        st.info(f"ℹ️ {message}")
+    
+    @staticmethod
+    def show_diagnostics(diagnostics: Any):
+        """显示生成过程中收集的错误、警告和提示"""
+        handlers = {'error': UIHelper.show_error, 'warning': UIHelper.show_warning, 'info': UIHelper.show_info}
+        for entry in diagnostics or []:
+            handlers.get(entry['level'], UIHelper.show_info)(entry['message'])
+    
+    @staticmethod
+    def create_section_header(title: str, description: str = None):
+        """创建节标题"""
+        st.header(title)
+        if description:
+            st.markdown(f"*{description}*")
+        st.markdown("---")  # 使用markdown横线替代st.divider()
+    
+    @staticmethod
+    def display_sql_with_download(sql_content: Union[str, SQLOutputBuffer], filename: str,
+                                  title: str = "生成的SQL语句"):
+        """
+        显示SQL内容并提供下载按钮
+
+        sql_content为SQLOutputBuffer时页面只预览开头部分。Streamlit的下载按钮需要完整的字节内容，
+        因此已溢出到临时文件的脚本不提供下载按钮，改为按块保存到指定的本地文件；保存在内存中的
+        脚本在支持延迟下载的版本中点击下载时才读取，其他版本在页面渲染时读取。
+        """
+        st.subheader(title)
+        if isinstance(sql_content, SQLOutputBuffer):
+            buffer = sql_content
+            preview = buffer.preview()
+            if buffer.size > len(preview.encode("utf-8")):
+                st.caption(f"脚本共 {buffer.size / 1024 / 1024:.1f} MB，下方仅预览开头部分，请下载查看完整内容")
+            st.code(preview, language='sql')
+            if buffer.spilled:
+                UIHelper._save_button(buffer, filename)
+            elif DEFERRED_DOWNLOAD:
+                # 点击下载时才读取缓冲区
+                UIHelper._download_button(buffer.getvalue, filename)
+            else:
+                UIHelper._download_button(buffer.getvalue(), filename)
+        else:
+            st.code(sql_content, language='sql')
+            UIHelper._download_button(sql_content, filename)
+    
+    @staticmethod
+    def _download_button(data: Any, filename: str):
+        """创建SQL文件下载按钮"""
+        st.download_button(
+            label="📥 下载SQL文件",
+            data=data,
+            file_name=filename,
+            mime=MIME_TYPES['sql']
+        )
+
+    @staticmethod
+    def _save_button(buffer: SQLOutputBuffer, filename: str):
+        """创建把溢出的脚本按块保存到本地文件的输入框和按钮"""
+        st.caption("脚本较大，为避免整体读入内存，请保存到本地文件")
+        path = st.text_input("保存路径", value=os.path.abspath(filename), key=f"save_path_{filename}")
+        if st.button("💾 保存SQL文件", key=f"save_button_{filename}"):
+            try:
+                size = buffer.save(path)
+            except OSError as e:
+                UIHelper.show_error(f"保存失败: {str(e)}")
+            else:
+                UIHelper.show_success(f"已保存到 {path}（{size / 1024 / 1024:.1f} MB）")
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+工作簿缓存模块 - 按内容哈希缓存已打开的工作簿及解析过的工作表，在各生成器和页面之间共享
+"""
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from sql_generator.config.constants import BULK_CONFIG
+
+# 已安装python-calamine时使用基于Rust的calamine引擎解析Excel，否则使用openpyxl
+try:
+    import python_calamine  # noqa: F401
+
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+
+class WorkbookCache:
+    """
+    按内容哈希缓存已打开的工作簿
+
+    同一份文件（无论是重新上传还是Streamlit重跑脚本）只打开一次，每个工作表（及列投影）
+    在首次使用时解析一次，超过容量时淘汰最久未使用的工作簿。
+    缓存的DataFrame被所有调用方共享，调用方不应原地修改。
+    """
+
+    def __init__(self, max_entries: int = BULK_CONFIG["workbook_cache_size"]):
+        """
+        初始化缓存
+
+        Args:
+            max_entries: 最多缓存的工作簿数量
+        """
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def read_bytes(file: Any) -> bytes:
+        """
+        读取文件路径或文件对象的全部内容，文件对象的读取位置会被重置
+
+        Args:
+            file: 文件路径、文件对象或字节串
+
+        Returns:
+            文件内容
+        """
+        if isinstance(file, (bytes, bytearray)):
+            return bytes(file)
+        if hasattr(file, "read"):
+            file.seek(0)
+            data = file.read()
+            file.seek(0)
+            return data
+        with open(file, "rb") as handle:
+            return handle.read()
+
+    @staticmethod
+    def content_hash(data: bytes) -> str:
+        """
+        计算文件内容哈希
+
+        Args:
+            data: 文件内容
+
+        Returns:
+            十六进制哈希字符串
+        """
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def parse_sheet(
+        workbook: Any, sheet_name: str, columns: Optional[List[List[str]]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        解析单个工作表，所有值按字符串读取（跳过类型推断，缺失值仍为NaN）
+
+        给出columns时只保留候选列组合中的列；工作表中没有任何一组完整的候选列时
+        （如表头不同），重新读取全部列，由调用方按位置解析。
+
+        Args:
+            workbook: pd.ExcelFile，或pd.read_excel可接受的文件路径、文件对象
+            sheet_name: 工作表名称
+            columns: 候选的列名组合（见SHEET_COLUMNS）
+
+        Returns:
+            工作表DataFrame，工作表不存在时返回None
+        """
+        if not isinstance(workbook, pd.ExcelFile):
+            if hasattr(workbook, "seek"):
+                workbook.seek(0)
+            with pd.ExcelFile(workbook, engine=EXCEL_ENGINE) as excel_file:
+                return WorkbookCache.parse_sheet(excel_file, sheet_name, columns)
+
+        if sheet_name not in workbook.sheet_names:
+            return None
+        if columns:
+            wanted = {name for names in columns for name in names}
+            df = workbook.parse(
+                sheet_name, usecols=lambda name: name in wanted, dtype=str
+            )
+            if any(all(name in df.columns for name in names) for names in columns):
+                return df
+        return workbook.parse(sheet_name, dtype=str)
+
+    def get_workbook(self, file: Any) -> Dict[str, pd.DataFrame]:
+        """
+        获取工作簿的全部工作表（全部列）
+
+        Args:
+            file: 文件路径、文件对象或字节串
+
+        Returns:
+            工作表名到DataFrame的字典
+        """
+        entry = self._entry(file)
+        return {
+            name: self._sheet(entry, name, None) for name in entry["file"].sheet_names
+        }
+
+    def get_sheet(
+        self, file: Any, sheet_name: str, columns: Optional[List[List[str]]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        获取工作簿中的单个工作表，首次使用时解析
+
+        Args:
+            file: 文件路径、文件对象或字节串
+            sheet_name: 工作表名称
+            columns: 候选的列名组合，只读取需要的列
+
+        Returns:
+            工作表DataFrame，不存在时返回None
+        """
+        return self._sheet(self._entry(file), sheet_name, columns)
+
+    def _entry(self, file: Any) -> Dict[str, Any]:
+        """获取文件内容对应的缓存项，未命中时打开工作簿（不解析工作表）"""
+        data = self.read_bytes(file)
+        key = self.content_hash(data)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        entry = {
+            "file": pd.ExcelFile(io.BytesIO(data), engine=EXCEL_ENGINE),
+            "sheets": {},
+            "lock": threading.Lock(),
+        }
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _sheet(
+        entry: Dict[str, Any], sheet_name: str, columns: Optional[List[List[str]]]
+    ) -> Optional[pd.DataFrame]:
+        """从缓存项中获取(工作表, 列投影)对应的DataFrame，未解析过时解析并保存"""
+        key: Tuple[str, Any] = (
+            sheet_name,
+            tuple(map(tuple, columns)) if columns else None,
+        )
+        with entry["lock"]:
+            if key not in entry["sheets"]:
+                entry["sheets"][key] = WorkbookCache.parse_sheet(
+                    entry["file"], sheet_name, columns
+                )
+            return entry["sheets"][key]
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 进程内共享的工作簿缓存（Streamlit各会话和重跑之间共享）
+workbook_cache = WorkbookCache()
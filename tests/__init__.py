@@ -1,5 +1,5 @@
-#!/usr/bin/env python
-# -*- coding: utf-8 -*-
-"""
-测试初始化
-"""
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+测试初始化
+"""
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+测试文件读取与工作簿缓存
+"""
+
+import io
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from sql_generator.config.constants import SHEET_COLUMNS
+from sql_generator.utils.file_utils import FileHandler
+from sql_generator.utils.output_buffer import SQLOutputBuffer
+from sql_generator.utils.workbook_cache import WorkbookCache
+
+
+def make_workbook(sheets):
+    """构造内存中的Excel工作簿"""
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        for sheet_name, df in sheets.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    buffer.seek(0)
+    return buffer
+
+
+class TestWorkbookCache(unittest.TestCase):
+    """工作簿缓存测试类"""
+
+    def test_parses_workbook_once(self):
+        """测试同一内容的工作簿只解析一次"""
+        cache = WorkbookCache(max_entries=2)
+        workbook = make_workbook(
+            {
+                "select": pd.DataFrame({"table": ["t"]}),
+                "insert": pd.DataFrame({"table": ["u"]}),
+            }
+        )
+
+        self.assertEqual(cache.get_sheet(workbook, "select")["table"].tolist(), ["t"])
+        self.assertEqual(
+            cache.get_sheet(io.BytesIO(workbook.getvalue()), "insert")[
+                "table"
+            ].tolist(),
+            ["u"],
+        )
+        self.assertIsNone(cache.get_sheet(workbook, "missing"))
+        self.assertEqual((cache.misses, cache.hits), (1, 2))
+
+    def test_projection_and_string_values(self):
+        """测试只读取所需列、值按字符串读取，表头不同时读取全部列"""
+        cache = WorkbookCache()
+        workbook = make_workbook(
+            {
+                "insert": pd.DataFrame(
+                    {"note": ["n"], "table": ["t"], "column": ["a"], "values": [7]}
+                ),
+                "select": pd.DataFrame({"tbl": ["t"], "cols": ["a"]}),
+            }
+        )
+
+        df = cache.get_sheet(workbook, "insert", SHEET_COLUMNS["insert"])
+        self.assertEqual(list(df.columns), ["table", "column", "values"])
+        self.assertEqual(df["values"].tolist(), ["7"])
+        self.assertEqual(
+            list(cache.get_sheet(workbook, "select", SHEET_COLUMNS["select"]).columns),
+            ["tbl", "cols"],
+        )
+        self.assertEqual(cache.get_sheet(workbook, "insert").shape[1], 4)
+
+    def test_lru_eviction(self):
+        """测试超过容量时淘汰最久未使用的工作簿"""
+        cache = WorkbookCache(max_entries=2)
+        books = [make_workbook({"s": pd.DataFrame({"v": [i]})}) for i in range(3)]
+
+        cache.get_workbook(books[0])
+        cache.get_workbook(books[1])
+        cache.get_workbook(books[0])
+        cache.get_workbook(books[2])
+
+        self.assertEqual(len(cache), 2)
+        cache.get_workbook(books[0])
+        self.assertEqual(cache.misses, 3)
+        cache.get_workbook(books[1])
+        self.assertEqual(cache.misses, 4)
+
+
+class TestTableInputs(unittest.TestCase):
+    """CSV/Parquet/Arrow输入测试类"""
+
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "note": ["x", "y", "z"],
+                "table": ["t", "t", "u"],
+                "column": ["id,code", "id,code", "id,code"],
+                "values": ["1,007", "2,", "3,010"],
+            }
+        )
+
+    def test_csv_reads_strings(self):
+        """测试CSV按字符串读取、投影所需列，分块读取的行号连续"""
+        data = self.df.to_csv(index=False).encode("utf-8")
+
+        df = FileHandler.read_table(io.BytesIO(data), "insert", SHEET_COLUMNS["insert"])
+        self.assertEqual(list(df.columns), ["table", "column", "values"])
+        self.assertEqual(df["values"].tolist(), ["1,007", "2,", "3,010"])
+
+        chunks = list(
+            FileHandler.iter_table_chunks(
+                io.BytesIO(data), "insert", 2, SHEET_COLUMNS["insert"]
+            )
+        )
+        self.assertEqual([list(chunk.index) for chunk in chunks], [[0, 1], [2]])
+        self.assertEqual(list(chunks[0].columns), ["table", "column", "values"])
+
+    def test_parquet_and_arrow(self):
+        """测试按文件头识别Parquet/Arrow文件，并只读取所需列"""
+        parquet, arrow = io.BytesIO(), io.BytesIO()
+        self.df.to_parquet(parquet, index=False)
+        self.df.to_feather(arrow)
+
+        for buffer, file_format in [(parquet, "parquet"), (arrow, "arrow")]:
+            self.assertEqual(FileHandler.detect_format(buffer), file_format)
+            df = FileHandler.read_table(buffer, "insert", SHEET_COLUMNS["insert"])
+            self.assertEqual(list(df.columns), ["table", "column", "values"])
+            chunks = list(
+                FileHandler.iter_table_chunks(
+                    buffer, "insert", 2, SHEET_COLUMNS["insert"]
+                )
+            )
+            self.assertEqual(pd.concat(chunks)["table"].tolist(), ["t", "t", "u"])
+            self.assertEqual(chunks[1].index.tolist(), [2])
+
+
+class TestSQLOutputBuffer(unittest.TestCase):
+    """输出缓冲区测试类"""
+
+    def test_spills_to_temp_file(self):
+        """测试超过阈值后溢出到临时文件，内容完整，关闭后删除临时文件"""
+        statements = [f"INSERT INTO t (id) VALUES ({i});" for i in range(100)]
+        buffer = SQLOutputBuffer(max_memory_bytes=256)
+        self.assertEqual(FileHandler.write_sql_stream(statements[:5], buffer), 5)
+        self.assertFalse(buffer.spilled)
+
+        FileHandler.write_sql_stream(statements[5:], buffer)
+        self.assertTrue(buffer.spilled and os.path.exists(buffer.path))
+        expected = "".join(statement + "\n" for statement in statements).encode("utf-8")
+        self.assertEqual(buffer.getvalue(), expected)
+        self.assertEqual(b"".join(buffer.iter_bytes(100)), expected)
+        self.assertEqual(
+            (len(buffer), buffer.preview(10)), (len(expected), "INSERT INT")
+        )
+
+        buffer.close()
+        self.assertFalse(os.path.exists(buffer.path))
+
+    def test_save_to_file(self):
+        """测试保存到文件的内容与缓冲区相同（无论是否溢出）"""
+        for max_memory_bytes in (0, 1024):
+            buffer = SQLOutputBuffer(max_memory_bytes=max_memory_bytes)
+            buffer.write(b"SELECT 1;\n" * 10)
+            with tempfile.TemporaryDirectory() as temp_dir:
+                path = os.path.join(temp_dir, "out.sql")
+                self.assertEqual(buffer.save(path), 100)
+                with open(path, "rb") as file:
+                    self.assertEqual(file.read(), buffer.getvalue())
+
+    def test_closed_buffer(self):
+        """测试关闭后（无论是否溢出）读取和写入都引发ValueError"""
+        for max_memory_bytes in (0, 1024):
+            buffer = SQLOutputBuffer(max_memory_bytes=max_memory_bytes)
+            buffer.write(b"SELECT 1;")
+            buffer.close()
+            self.assertTrue(buffer.closed)
+            for operation in (
+                buffer.open,
+                buffer.preview,
+                buffer.getvalue,
+                lambda: buffer.write(b"x"),
+            ):
+                with self.assertRaisesRegex(ValueError, "buffer is closed"):
+                    operation()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,54 +1,96 @@
-#!/usr/bin/env python
-# -*- coding: utf-8 -*-
-"""
-测试SQL格式化功能
-"""
-
-import unittest
-from sql_generator.core.sql_formatter import SQLFormatter
-
-
-class TestSQLFormatter(unittest.TestCase):
-    """SQL格式化测试类"""
-    
-    def test_validate_sql_syntax_valid(self):
-        """测试有效SQL的语法验证"""
-        sql = "SELECT id, name FROM users WHERE age > 18;"
-        result = SQLFormatter.validate_sql_syntax(sql)
-        
-        self.assertTrue(result['is_valid'])
-        self.assertEqual(result['statement_count'], 1)
-        self.assertEqual(len(result['errors']), 0)
-        
-    def test_validate_sql_syntax_invalid(self):
-        """测试无效SQL的语法验证"""
-        sql = "SELECT FROM users WHERE;"
-        result = SQLFormatter.validate_sql_syntax(sql)
-        
-        self.assertFalse(result['is_valid'])
-        self.assertTrue(len(result['errors']) > 0)
-    
-    def test_format_sql(self):
-        """测试SQL格式化"""
-        sql = "select id,name from users where age>18"
-        formatted = SQLFormatter.format_sql(sql)
-        
-        # 检查关键字是否已大写
-        self.assertIn("SELECT", formatted)
-        self.assertIn("FROM", formatted)
-        self.assertIn("WHERE", formatted)
-        
-        # 检查是否包含换行
-        self.assertGreater(formatted.count('\n'), 0)
-    
-    def test_get_formatting_suggestions(self):
-        """测试SQL格式化建议"""
-        sql = "select * from users"
-        suggestions = SQLFormatter.get_formatting_suggestions(sql)
-        
-        # 至少应该有一个建议（关键字大写）
-        self.assertGreater(len(suggestions), 0)
-
-
-if __name__ == "__main__":
-    unittest.main()
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+测试SQL格式化功能
+"""
+
+import unittest
+from unittest import mock
+import sqlparse
+from sql_generator.core.sql_document import SQLDocument
+from sql_generator.core.sql_formatter import SQLFormatter
+
+
+class TestSQLFormatter(unittest.TestCase):
+    """SQL格式化测试类"""
+    
+    def test_validate_sql_syntax_valid(self):
+        """测试有效SQL的语法验证"""
+        sql = "SELECT id, name FROM users WHERE age > 18;"
+        result = SQLFormatter.validate_sql_syntax(sql)
+        
+        self.assertTrue(result['is_valid'])
+        self.assertEqual(result['statement_count'], 1)
+        self.assertEqual(len(result['errors']), 0)
+        
+    def test_validate_sql_syntax_invalid(self):
+        """测试无效SQL的语法验证"""
+        sql = "SELECT FROM users WHERE;"
+        result = SQLFormatter.validate_sql_syntax(sql)
+        
+        self.assertFalse(result['is_valid'])
+        self.assertTrue(len(result['errors']) > 0)
+    
+    def test_format_sql(self):
+        """测试SQL格式化"""
+        sql = "select id,name from users where age>18"
+        formatted = SQLFormatter.format_sql(sql)
+        
+        # 检查关键字是否已大写
+        self.assertIn("SELECT", formatted)
+        self.assertIn("FROM", formatted)
+        self.assertIn("WHERE", formatted)
+        
+        # 检查是否包含换行
+        self.assertGreater(formatted.count('\n'), 0)
+    
+    def test_get_formatting_suggestions(self):
+        """测试SQL格式化建议"""
+        sql = "select * from users"
+        suggestions = SQLFormatter.get_formatting_suggestions(sql)
+        
+        # 至少应该有一个建议（关键字大写）
+        self.assertGreater(len(suggestions), 0)
+
+    def test_sql_document_parsed_once(self):
+        """测试同一SQLDocument在语法验证、复杂度分析和格式化建议之间只解析一次"""
+        sql = "SELECT id FROM users WHERE age > 18;\nDELETE FROM logs;"
+        document = SQLDocument(sql)
+        with mock.patch("sql_generator.core.sql_document.sqlparse.parse", wraps=sqlparse.parse) as parse:
+            result = SQLFormatter.validate_sql_syntax(document)
+            for statement in result['statements']:
+                SQLFormatter.analyze_sql_complexity(statement['document'])
+                SQLFormatter.get_formatting_suggestions(statement['document'])
+        self.assertEqual(parse.call_count, 1)
+
+        self.assertEqual(result['statement_count'], 2)
+        self.assertEqual([statement['type'] for statement in result['statements']], ["SELECT", "DELETE"])
+        self.assertIn("DELETE语句缺少WHERE条件，将删除整个表", result['warnings'])
+        self.assertEqual(SQLFormatter.validate_sql_syntax(sql)['warnings'], result['warnings'])
+        self.assertEqual(document.position(sql.index("DELETE")), (2, 1))
+        self.assertEqual(document.position(sql.index("age")), (1, 28))
+
+    def test_syntax_check_ignores_strings_and_comments(self):
+        """测试字符串、引号标识符和注释中的括号、引号和关键字不会被误报"""
+        sql = ("-- it's a (draft)\n"
+               "SELECT ')', \"col(\" FROM t JOIN u x ON x.id = t.id /* WHERE ORDER */\n"
+               "WHERE note = 'SELECT FROM' AND body = $$ ( $$;")
+        self.assertEqual(SQLFormatter._check_syntax_errors(sql), [])
+        self.assertTrue(SQLFormatter.validate_sql_syntax(sql)['is_valid'])
+
+    def test_syntax_check_positions(self):
+        """测试词法错误和语法模式错误报告行号和列号"""
+        errors = SQLFormatter._check_syntax_errors("SELECT (a,\n  b FROM t WHERE;;\nSELECT 'abc")
+        self.assertEqual(errors, [
+            "括号不匹配: '(' 没有对应的 ')'（第 1 行第 8 列）",
+            "SQL语句中间有多余的分号（第 2 行第 18 列）",
+            "单引号不匹配: 字符串没有闭合（第 3 行第 8 列）",
+        ])
+        self.assertEqual(SQLFormatter._check_syntax_errors("SELECT a FROM t JOIN u WHERE a = 1 )"), [
+            "JOIN语句后缺少ON或USING子句（第 1 行第 17 列）",
+            "括号不匹配: ')' 没有对应的 '('（第 1 行第 36 列）",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,1322 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+测试SQL生成器批量生成功能
+"""
+
+import csv
+import io
+import json
+import os
+import pickle
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+import zipfile
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+
+from sql_generator.config.constants import BULK_CONFIG
+from sql_generator.core.bulk_engine import BulkSQLEngine, InsertBatcher
+from sql_generator.core.incremental import IncrementalGenerator
+from sql_generator.core.literals import SQLLiteralRenderer
+from sql_generator.core.parallel import generate_rows_parallel
+from sql_generator.core.parameterized import ParameterizedWriter
+from sql_generator.core.sql_generator import SQLGenerator
+from sql_generator.utils.file_utils import FileHandler
+from sql_generator.utils.jobs import Job, JobCancelled, JobManager
+from sql_generator.utils.output_buffer import SQLOutputBuffer
+
+
+def make_workbook(sheets):
+    """构造内存中的Excel工作簿"""
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        for sheet_name, df in sheets.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    buffer.seek(0)
+    return buffer
+
+
+class TestBulkSQLEngine(unittest.TestCase):
+    """向量化构建引擎测试类"""
+
+    def test_select_statements(self):
+        """测试按列生成SELECT语句"""
+        df = pd.DataFrame({"table": ["t1", "t2", None], "column": ["a, b", "c", "d"]})
+        statements = BulkSQLEngine.select_statements(df).tolist()
+
+        self.assertEqual(statements, ["SELECT a, b FROM t1;", "SELECT c FROM t2;"])
+
+    def test_insert_statements(self):
+        """测试按列生成INSERT语句并校验列值数量"""
+        df = pd.DataFrame(
+            {
+                "table": ["t", "t", "t"],
+                "column": ["a,b", "a , b", "a,b"],
+                "values": ["1,x", " 2 , y ", "3"],
+            }
+        )
+        statements, mismatched = BulkSQLEngine.insert_statements(df)
+
+        self.assertEqual(
+            statements.tolist(),
+            [
+                "INSERT INTO t (a, b) VALUES (1, 'x');",
+                "INSERT INTO t (a, b) VALUES (2, 'y');",
+            ],
+        )
+        self.assertEqual(mismatched, [2])
+
+    def test_typed_literals(self):
+        """测试按列推断类型渲染字面量：数值、日期、NULL及引号转义"""
+        df = pd.DataFrame(
+            {
+                "table": ["t", "t", "t"],
+                "column": ["id,amount,code,day,at,name"] * 3,
+                "values": [
+                    "1,1.5,007,2025-01-31,2025-01-31T08:30:00,O'Brien",
+                    "-2,NULL,010,nan,2025-02-01 09:00,",
+                    "3,2e3,020,2025-03-01,2025-03-01 10:00:00,x",
+                ],
+            }
+        )
+        statements, _ = BulkSQLEngine.insert_statements(df)
+
+        self.assertEqual(
+            statements.iloc[0],
+            "INSERT INTO t (id, amount, code, day, at, name) VALUES (1, 1.5, '007', "
+            "DATE '2025-01-31', TIMESTAMP '2025-01-31 08:30:00', 'O''Brien');",
+        )
+        self.assertEqual(
+            statements.iloc[1],
+            "INSERT INTO t (id, amount, code, day, at, name) VALUES (-2, NULL, '010', "
+            "NULL, TIMESTAMP '2025-02-01 09:00', NULL);",
+        )
+        self.assertIn(
+            "'2025-03-01'",
+            BulkSQLEngine.insert_statements(df, dialect="sqlite")[0].iloc[2],
+        )
+        self.assertEqual(SQLLiteralRenderer.infer_type(pd.Series(["1", "a"])), "text")
+
+    def test_insert_batcher_limits(self):
+        """测试多行INSERT按行数、字节数和表名分组合并"""
+        df = pd.DataFrame(
+            {
+                "table": ["t", "t", "t", "u"],
+                "column": ["a", "a", "a", "a"],
+                "values": ["1", "2", "3", "4"],
+            }
+        )
+        parts, _ = BulkSQLEngine.insert_parts(df)
+
+        batcher = InsertBatcher(rows_per_statement=2)
+        statements = list(batcher.add(parts)) + list(batcher.flush())
+        self.assertEqual(
+            statements,
+            [
+                "INSERT INTO t (a) VALUES (1), (2);",
+                "INSERT INTO t (a) VALUES (3);",
+                "INSERT INTO u (a) VALUES (4);",
+            ],
+        )
+
+        limit = len("INSERT INTO t (a) VALUES (1), (2);".encode("utf-8"))
+        batcher = InsertBatcher(rows_per_statement=100, max_statement_bytes=limit)
+        statements = list(batcher.add(parts)) + list(batcher.flush())
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(all(len(stmt.encode("utf-8")) <= limit for stmt in statements))
+
+    def test_merge_from_tables(self):
+        """测试表对表格式的MERGE语句"""
+        df = pd.DataFrame(
+            {
+                "target_table": ["a"],
+                "target_column": ["year,month"],
+                "uniqueid": ["id"],
+                "source_table": ["b"],
+                "source_column": ["quarter, month"],
+            }
+        )
+        statements, mismatched = BulkSQLEngine.merge_statements(df)
+
+        self.assertEqual(mismatched, [])
+        self.assertEqual(
+            statements.tolist(),
+            [
+                "MERGE INTO a AS t\nUSING b AS s\nON (t.id = s.id)\n"
+                "WHEN MATCHED THEN UPDATE SET year = s.quarter, month = s.month\n"
+                "WHEN NOT MATCHED THEN INSERT (id, year, month) VALUES (s.id, s.quarter, s.month);"
+            ],
+        )
+
+    def test_merge_set_based(self):
+        """测试数据行格式按目标表合并为一条MERGE语句"""
+        df = pd.DataFrame(
+            {
+                "target_table": ["t", "t", "u", "t"],
+                "target_column": ["id,name", "id,name", "id,v", "id,name"],
+                "uniqueid": ["id", "id", "id", "missing"],
+                "values": ["1,a", "2,b", "3,c", "4,d"],
+            }
+        )
+        per_row, mismatched = BulkSQLEngine.merge_statements(df)
+        set_based, _ = BulkSQLEngine.merge_statements(df, set_based=True)
+        batched, _ = BulkSQLEngine.merge_statements(df, set_based=True, batch_size=1)
+
+        self.assertEqual(mismatched, [3])
+        self.assertEqual((len(per_row), len(set_based), len(batched)), (3, 2, 3))
+        self.assertIn(
+            "USING (VALUES (1, 'a'),\n       (2, 'b')) AS s (id, name)",
+            set_based.iloc[0],
+        )
+        self.assertIn("WHEN MATCHED THEN UPDATE SET name = s.name", set_based.iloc[0])
+
+    def test_upsert_batches(self):
+        """测试原生UPSERT按方言生成冲突子句，并按多行INSERT的行数和字节数限制分批"""
+        df = pd.DataFrame(
+            {
+                "target_table": ["t", "t", "t", "u"],
+                "target_column": ["id,name", "id,name", "id,name", "k"],
+                "uniqueid": ["id", "id", "id", "k"],
+                "values": ["1,a", "2,b", "3,c", "5"],
+            }
+        )
+        parts, _ = BulkSQLEngine.upsert_parts(df, "postgresql")
+        batcher = InsertBatcher(rows_per_statement=2)
+        self.assertEqual(
+            list(batcher.add(parts)) + list(batcher.flush()),
+            [
+                "INSERT INTO t (id, name) VALUES (1, 'a'), (2, 'b') ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name;",
+                "INSERT INTO t (id, name) VALUES (3, 'c') ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name;",
+                "INSERT INTO u (k) VALUES (5) ON CONFLICT (k) DO NOTHING;",
+            ],
+        )
+
+        parts, _ = BulkSQLEngine.upsert_parts(df, "mysql")
+        self.assertEqual(
+            parts["suffix"].tolist()[2:],
+            [
+                " ON DUPLICATE KEY UPDATE name = VALUES(name)",
+                " ON DUPLICATE KEY UPDATE k = k",
+            ],
+        )
+
+        # 字节数限制包含冲突子句
+        limit = len(
+            "INSERT INTO t (id, name) VALUES (1, 'a'), (2, 'b') ON DUPLICATE KEY UPDATE name = VALUES(name);"
+        )
+        batcher = InsertBatcher(rows_per_statement=100, max_statement_bytes=limit - 1)
+        statements = list(batcher.add(parts)) + list(batcher.flush())
+        self.assertEqual(len(statements), 4)
+        self.assertTrue(all(len(stmt.encode("utf-8")) < limit for stmt in statements))
+
+    def test_update_statements(self):
+        """测试按表合并的UPDATE语句"""
+        df = pd.DataFrame(
+            {
+                "table": ["t", "t", "t"],
+                "column": ["id,name", "id,name", "id"],
+                "uniqueid": ["id", "id", "id"],
+                "values": ["1,a", "2,b", "3"],
+            }
+        )
+        case_statements, mismatched = BulkSQLEngine.update_statements(df)
+        values_statements, _ = BulkSQLEngine.update_statements(df, style="from_values")
+        batched, _ = BulkSQLEngine.update_statements(df, batch_size=1)
+
+        self.assertEqual(mismatched, [2])
+        self.assertEqual(
+            case_statements.tolist(),
+            [
+                "UPDATE t\nSET name = CASE id WHEN 1 THEN 'a' WHEN 2 THEN 'b' END\n"
+                "WHERE id IN (1, 2);"
+            ],
+        )
+        self.assertEqual(
+            values_statements.tolist(),
+            [
+                "UPDATE t AS t\nSET name = s.name\n"
+                "FROM (VALUES (1, 'a'),\n       (2, 'b')) AS s (id, name)\nWHERE t.id = s.id;"
+            ],
+        )
+        self.assertEqual(len(batched), 2)
+
+    def test_delete_statements_chunked(self):
+        """测试按主键分批DELETE并配对重新插入"""
+        df = pd.DataFrame(
+            {
+                "table": ["t", "t", "t"],
+                "column": ["id,name", "id,name", "id,name"],
+                "del_column": ["id", "id", "id"],
+                "values": ["1,x", "2,y", "3,z"],
+            }
+        )
+        statements, mismatched = BulkSQLEngine.delete_statements(
+            df, batch_size=2, reinsert=True
+        )
+
+        self.assertEqual(mismatched, [])
+        self.assertEqual(
+            statements.tolist(),
+            [
+                "DELETE FROM t WHERE id IN (1, 2);",
+                "INSERT INTO t (id, name) VALUES (1, 'x'), (2, 'y');",
+                "DELETE FROM t WHERE id IN (3);",
+                "INSERT INTO t (id, name) VALUES (3, 'z');",
+            ],
+        )
+
+    def test_delete_from_staging(self):
+        """测试暂存表格式的删除并重新插入"""
+        df = pd.DataFrame(
+            {
+                "table": ["a"],
+                "column": ["x,y"],
+                "del_column": ["id"],
+                "tmp_table": ["tmp_a"],
+            }
+        )
+        statements, _ = BulkSQLEngine.delete_statements(df, reinsert=True)
+
+        self.assertEqual(
+            statements.tolist(),
+            [
+                "DELETE FROM a WHERE id IN (SELECT id FROM tmp_a);",
+                "INSERT INTO a (x, y) SELECT x, y FROM tmp_a;",
+            ],
+        )
+
+    def test_create_long_layout(self):
+        """测试长表格式（每行一个字段）按表合并为CREATE语句，domain作为schema前缀"""
+        df = pd.DataFrame(
+            {
+                "domain": ["s", "s", None],
+                "table": ["t", "t", "u"],
+                "column": ["id", "name", "k"],
+                "data_type": ["int", "varchar(10)", "int"],
+            }
+        )
+        statements = BulkSQLEngine.create_statements(df)
+
+        self.assertEqual(statements.index.tolist(), [0, 2])
+        self.assertEqual(
+            statements.tolist(),
+            [
+                "CREATE TABLE s.t (\n    id int,\n    name varchar(10)\n);",
+                "CREATE TABLE u (\n    k int\n);",
+            ],
+        )
+        wide = BulkSQLEngine.create_statements(
+            pd.DataFrame({"table": ["t"], "id": ["int"]})
+        )
+        self.assertEqual(wide.tolist(), ["CREATE TABLE t (\n    id int\n);"])
+
+
+class TestSQLGenerator(unittest.TestCase):
+    """SQL生成器测试类"""
+
+    def setUp(self):
+        self.generator = SQLGenerator()
+        self.workbook = make_workbook(
+            {
+                "select": pd.DataFrame({"table": ["t1"], "column": ["a,b"]}),
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["model_a.a", "model_a.a"],
+                        "column": ["year,month", "year,month"],
+                        "values": ["2025,1", "2025,2"],
+                    }
+                ),
+                "truncate": pd.DataFrame(
+                    {
+                        "target_table": ["a", "b"],
+                        "target_column": [None, "x"],
+                        "source_table": [None, "c"],
+                        "source_column": [None, "y"],
+                    }
+                ),
+            }
+        )
+
+    def test_bulk_select(self):
+        """测试从工作簿批量生成SELECT语句"""
+        self.assertEqual(
+            self.generator.bulk_select(self.workbook), ["SELECT a,b FROM t1;"]
+        )
+
+    def test_bulk_insert(self):
+        """测试从工作簿批量生成INSERT语句"""
+        statements = self.generator.bulk_insert(self.workbook)
+
+        self.assertEqual(len(statements), 2)
+        self.assertEqual(
+            statements[0], "INSERT INTO model_a.a (year, month) VALUES (2025, 1);"
+        )
+
+    def test_bulk_upsert_from_insert_sheet(self):
+        """测试由insert工作表和指定的主键生成UPSERT，未指定主键时报告错误"""
+        statements = self.generator.bulk_upsert(
+            self.workbook, dialect="sqlite", keys=["year", "month"], sheet="insert"
+        )
+        self.assertEqual(
+            statements,
+            [
+                "INSERT INTO model_a.a (year, month) VALUES (2025, 1), (2025, 2) "
+                "ON CONFLICT (year, month) DO NOTHING;"
+            ],
+        )
+        self.assertEqual(
+            self.generator.bulk_upsert(
+                self.workbook, sheet="insert"
+            ).diagnostics.errors,
+            ["生成UPSERT语句时发生错误: UPSERT需要主键列：请在工作表中填写uniqueid列或指定主键"],
+        )
+
+    def test_bulk_truncate(self):
+        """测试清空及清空后插入语句"""
+        self.assertEqual(
+            self.generator.bulk_truncate(self.workbook),
+            [
+                "TRUNCATE TABLE a;",
+                "TRUNCATE TABLE b;",
+                "INSERT INTO b (x) SELECT y FROM c;",
+            ],
+        )
+
+    def test_bulk_insert_from_csv(self):
+        """测试生成器直接读取CSV文件，结果与Excel一致"""
+        csv_file = io.BytesIO(
+            b'table,column,values\nmodel_a.a,"year,month","2025,1"\n'
+            b'model_a.a,"year,month","2025,2"\n'
+        )
+        csv_file.name = "insert.csv"
+
+        self.assertEqual(
+            self.generator.bulk_insert(csv_file),
+            self.generator.bulk_insert(self.workbook),
+        )
+        self.assertEqual(
+            list(self.generator.iter_insert(csv_file, chunk_size=1)),
+            self.generator.bulk_insert(self.workbook),
+        )
+
+    def test_diagnostics_collected(self):
+        """测试不合法的行和读取错误记入诊断信息，而不是直接输出到页面"""
+        workbook = make_workbook(
+            {
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["t", "t"],
+                        "column": ["a,b", "a"],
+                        "values": ["1,2", "1,2"],
+                    }
+                )
+            }
+        )
+        statements = self.generator.bulk_insert(workbook)
+
+        self.assertEqual(statements, ["INSERT INTO t (a, b) VALUES (1, 2);"])
+        self.assertEqual(statements.diagnostics.errors, ["第 2 行的列名和值数量不匹配"])
+        self.assertEqual(
+            pickle.loads(pickle.dumps(statements)).diagnostics.errors,
+            statements.diagnostics.errors,
+        )
+        self.assertEqual(
+            self.generator.bulk_update(self.workbook).diagnostics.errors,
+            ["工作表 'update' 不存在"],
+        )
+
+    def test_core_import_without_streamlit(self):
+        """测试导入生成器核心模块不会加载Streamlit"""
+        code = (
+            "import sys, sql_generator.core.sql_generator; "
+            "print('streamlit' in sys.modules or 'PIL' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(output.stdout.strip(), "False")
+
+    def test_generate_all(self):
+        """测试并行生成全部工作表，结果按固定顺序合并"""
+        results = self.generator.generate_all(self.workbook, max_workers=2)
+
+        self.assertEqual(list(results), ["select", "insert", "truncate"])
+        self.assertEqual(
+            results["insert"]["statements"], self.generator.bulk_insert(self.workbook)
+        )
+        self.assertTrue(
+            all(
+                result["seconds"] >= 0 and result["error"] is None
+                for result in results.values()
+            )
+        )
+
+    def test_row_chunk_parallel(self):
+        """测试按行分块并行生成与单进程结果一致，c列决定类型的值位于第二个分片中"""
+        df = pd.DataFrame(
+            {
+                "table": ["t"] * 6,
+                "column": ["a,b,c"] * 6,
+                "values": ["1,x,1", "2,y,2", "3", "4,z,4", "5,w,A5", "6,v,6"],
+            }
+        )
+        expected, expected_mismatched = BulkSQLEngine.insert_statements(df)
+        statements, mismatched = generate_rows_parallel("insert", df, workers=2)
+
+        self.assertEqual(statements, expected.tolist())
+        self.assertEqual(mismatched, expected_mismatched)
+        self.assertEqual(statements[0], "INSERT INTO t (a, b, c) VALUES (1, 'x', '1');")
+        # 第一个分片的两行有效数据恰好组成一条语句，分片边界不会多出未满的语句
+        batcher = InsertBatcher(2)
+        self.assertEqual(
+            generate_rows_parallel(
+                "insert", df, workers=2, options={"rows_per_statement": 2}
+            )[0],
+            list(batcher.add(BulkSQLEngine.insert_parts(df)[0]))
+            + list(batcher.flush()),
+        )
+        self.assertEqual(
+            generate_rows_parallel("select", df, workers=3)[0],
+            BulkSQLEngine.select_statements(df).tolist(),
+        )
+
+    def test_bulk_insert_batched(self):
+        """测试多行INSERT生成，流式与非流式结果一致"""
+        statements = self.generator.bulk_insert(self.workbook, rows_per_statement=10)
+
+        self.assertEqual(
+            statements,
+            ["INSERT INTO model_a.a (year, month) VALUES (2025, 1), (2025, 2);"],
+        )
+        self.assertEqual(
+            list(
+                self.generator.iter_insert(
+                    self.workbook, chunk_size=1, rows_per_statement=10
+                )
+            ),
+            statements,
+        )
+
+    def test_bulk_load_zip(self):
+        """测试批量导入模式生成数据文件和COPY命令"""
+        archive = zipfile.ZipFile(
+            io.BytesIO(self.generator.bulk_load_zip(self.workbook, "postgresql"))
+        )
+
+        self.assertEqual(sorted(archive.namelist()), ["load.sql", "model_a_a_1.csv"])
+        self.assertEqual(
+            archive.read("model_a_a_1.csv").decode("utf-8"),
+            "year,month\n2025,1\n2025,2\n",
+        )
+        self.assertIn(
+            "COPY model_a.a (year, month) FROM 'model_a_a_1.csv'",
+            archive.read("load.sql").decode("utf-8"),
+        )
+
+    def test_bulk_load_nulls(self):
+        """测试数据文件中NULL值写为空字段（MySQL为\\N），值两侧的空白被去除"""
+        workbook = make_workbook(
+            {
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["t", "t"],
+                        "column": ["a, b, c", "a, b, c"],
+                        "values": ["1, null, x", " 2 ,NONE,  y\\z "],
+                    }
+                )
+            }
+        )
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = self.generator.export_bulk_load(workbook, output_dir, "sqlite")
+            with open(result["data_files"][0], encoding="utf-8") as file:
+                self.assertEqual(file.read(), "a,b,c\n1,,x\n2,,y\\z\n")
+            result = self.generator.export_bulk_load(
+                workbook, output_dir, "mysql", "\t"
+            )
+            with open(result["data_files"][0], encoding="utf-8") as file:
+                self.assertEqual(file.read(), "a\tb\tc\n1\t\\N\tx\n2\t\\N\ty\\\\z\n")
+            with open(result["script"], encoding="utf-8") as file:
+                self.assertIn("IGNORE 1 LINES (a, b, c);", file.read())
+
+        archive = zipfile.ZipFile(
+            io.BytesIO(self.generator.bulk_load_zip(workbook, "postgresql"))
+        )
+        self.assertIn("FORCE_NULL (a, b, c)", archive.read("load.sql").decode("utf-8"))
+
+    def test_bulk_load_numeric_cells(self):
+        """测试数值单元格写入数据文件时与整表读取一致，整数不写成1.0，导入后仍为整数"""
+        workbook = make_workbook(
+            {
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["t"] * 4,
+                        "column": ["amount"] * 4,
+                        "values": [1, 2.5, 123456789012345, 40],
+                    }
+                )
+            }
+        )
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE t (amount NUMERIC)")
+        with tempfile.TemporaryDirectory() as output_dir:
+            for chunk_size in (1, 2, 100):
+                result = self.generator.export_bulk_load(
+                    workbook, output_dir, "sqlite", chunk_size=chunk_size
+                )
+                with open(result["data_files"][0], encoding="utf-8") as file:
+                    self.assertEqual(
+                        file.read(), "amount\n1\n2.5\n123456789012345\n40\n"
+                    )
+            with open(result["data_files"][0], encoding="utf-8", newline="") as file:
+                connection.executemany(
+                    "INSERT INTO t VALUES (?)", list(csv.reader(file))[1:]
+                )
+
+        self.assertEqual(
+            connection.execute("SELECT amount, typeof(amount) FROM t").fetchall(),
+            [
+                (1, "integer"),
+                (2.5, "real"),
+                (123456789012345, "integer"),
+                (40, "integer"),
+            ],
+        )
+
+    def test_parameterized_zip(self):
+        """测试参数化输出：每个表和列集合一条带占位符的语句，参数文件可直接用于executemany"""
+        workbook = make_workbook(
+            {
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["t", "t", "u"],
+                        "column": ["id,name", "id,name", "code"],
+                        "values": ["1,a", "NULL,b", "007"],
+                    }
+                )
+            }
+        )
+        archive = zipfile.ZipFile(
+            io.BytesIO(self.generator.parameterized_zip(workbook, "qmark", "jsonl"))
+        )
+        manifest = json.loads(archive.read("manifest.json"))
+
+        self.assertEqual(
+            [entry["statement"] for entry in manifest["statements"]],
+            [
+                "INSERT INTO t (id, name) VALUES (?, ?);",
+                "INSERT INTO u (code) VALUES (?);",
+            ],
+        )
+        self.assertEqual(
+            archive.read("t_1.jsonl").decode("utf-8"), '[1, "a"]\n[null, "b"]\n'
+        )
+
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE t (id INTEGER, name TEXT)")
+        connection.execute("CREATE TABLE u (code TEXT)")
+        for entry in manifest["statements"]:
+            rows = [
+                json.loads(line)
+                for line in archive.read(entry["parameters"])
+                .decode("utf-8")
+                .splitlines()
+            ]
+            connection.executemany(entry["statement"], rows)
+        self.assertEqual(
+            connection.execute("SELECT * FROM t").fetchall(), [(1, "a"), (None, "b")]
+        )
+        self.assertEqual(connection.execute("SELECT * FROM u").fetchall(), [("007",)])
+
+        archive = zipfile.ZipFile(
+            io.BytesIO(self.generator.parameterized_zip(workbook, "dollar", "csv"))
+        )
+        self.assertIn(
+            "VALUES ($1, $2);", archive.read("statements.sql").decode("utf-8")
+        )
+        self.assertEqual(archive.read("t_1.csv").decode("utf-8"), "id,name\n1,a\n,b\n")
+
+    def test_parameterized_chunk_types(self):
+        """测试分块写入参数文件时按整张工作表决定整数或字符串，后面块中的非整数值使前面块的值也写为字符串"""
+        workbook = make_workbook(
+            {
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["t"] * 4,
+                        "column": ["a, b"] * 4,
+                        "values": ["1, 1", "2, 2", "3, 3", "A7, 4"],
+                    }
+                )
+            }
+        )
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = self.generator.export_parameterized(
+                workbook, output_dir, param_format="jsonl", chunk_size=2
+            )
+            with open(result["parameter_files"][0], encoding="utf-8") as file:
+                rows = [json.loads(line) for line in file]
+
+        self.assertEqual(rows, [["1", 1], ["2", 2], ["3", 3], ["A7", 4]])
+        df = pd.read_excel(workbook, sheet_name="insert")
+        self.assertEqual(ParameterizedWriter.parameter_rows(df)[0][0][2], rows)
+        self.assertEqual(
+            ParameterizedWriter.parameter_rows(
+                df.iloc[:2], BulkSQLEngine.value_types(df)
+            )[0][0][2],
+            rows[:2],
+        )
+
+    def test_parameterized_excel_cell_types(self):
+        """测试分块写入参数文件时数值和日期单元格与整表读取生成的参数一致，结果不随分块大小变化"""
+        workbook = make_workbook(
+            {
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["t"] * 3 + ["v"] * 2,
+                        "column": ["a"] * 5,
+                        "values": [
+                            1,
+                            2.5,
+                            40,
+                            datetime(2024, 1, 2),
+                            datetime(2024, 1, 3, 10, 30),
+                        ],
+                    }
+                )
+            }
+        )
+        df = pd.read_excel(workbook, sheet_name="insert", dtype=str)
+        expected = [group[2] for group in ParameterizedWriter.parameter_rows(df)[0]]
+
+        self.assertEqual(
+            expected[1], [["2024-01-02 00:00:00"], ["2024-01-03 10:30:00"]]
+        )
+        with tempfile.TemporaryDirectory() as output_dir:
+            for chunk_size in (1, 2, 100):
+                result = self.generator.export_parameterized(
+                    workbook, output_dir, param_format="jsonl", chunk_size=chunk_size
+                )
+                rows = []
+                for path in result["parameter_files"]:
+                    with open(path, encoding="utf-8") as file:
+                        rows.append([json.loads(line) for line in file])
+                self.assertEqual(rows, expected)
+
+    def test_iter_insert_streams_chunks(self):
+        """测试流式生成INSERT语句并写入缓冲区"""
+        statements = self.generator.iter_insert(self.workbook, chunk_size=1)
+        self.assertEqual(list(statements), self.generator.bulk_insert(self.workbook))
+
+        buffer = io.BytesIO()
+        count = FileHandler.write_sql_stream(
+            self.generator.iter_insert(self.workbook), buffer
+        )
+        self.assertEqual(count, 2)
+        self.assertEqual(buffer.getvalue().decode("utf-8").count("INSERT INTO"), 2)
+
+    def test_chunked_insert_types(self):
+        """测试分块、分片生成时按整张工作表推断值类型，决定类型的值位于后面的块中时结果与整表生成一致"""
+        workbook = make_workbook(
+            {
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["t", "t", "t", "t", "u"],
+                        "column": ["a, b"] * 5,
+                        "values": [
+                            "1, 2025-01-01",
+                            "2, 2025-01-02",
+                            "3, 2025-01-03",
+                            "A7, 2025-01-04 10:00",
+                            "5, x",
+                        ],
+                    }
+                )
+            }
+        )
+        expected = self.generator.bulk_insert(workbook)
+
+        self.assertEqual(
+            expected[0], "INSERT INTO t (a, b) VALUES ('1', '2025-01-01');"
+        )
+        self.assertEqual(expected[4], "INSERT INTO u (a, b) VALUES (5, 'x');")
+        self.assertEqual(self.generator.bulk_insert(workbook, workers=2), expected)
+        self.assertEqual(
+            list(self.generator.iter_insert(workbook, chunk_size=2)), expected
+        )
+        self.assertEqual(
+            list(
+                self.generator.iter_insert(workbook, chunk_size=3, rows_per_statement=2)
+            ),
+            self.generator.bulk_insert(workbook, rows_per_statement=2),
+        )
+
+        df = pd.read_excel(workbook, sheet_name="insert")
+        first, second = BulkSQLEngine.value_types(
+            df.iloc[:2]
+        ), BulkSQLEngine.value_types(df.iloc[2:])
+        self.assertEqual(
+            BulkSQLEngine.widen_types(first, second), BulkSQLEngine.value_types(df)
+        )
+        self.assertEqual(BulkSQLEngine.value_types(df)[("t", "a, b")], ["text", "text"])
+        self.assertEqual(SQLLiteralRenderer.widen("integer", "decimal"), "decimal")
+        self.assertEqual(SQLLiteralRenderer.widen("null", "date"), "date")
+
+    def test_streamed_excel_cell_types(self):
+        """测试流式读取Excel时整数、小数和日期单元格与整表读取得到相同的字符串，结果不随分块大小变化"""
+        workbook = make_workbook(
+            {
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["t", "t", "t", "u", "u", "v", "v", "w"],
+                        "column": ["a"] * 8,
+                        "values": [
+                            1,
+                            2,
+                            123456789012345,
+                            2.5,
+                            3,
+                            datetime(2024, 1, 2),
+                            datetime(2024, 1, 3),
+                            datetime(2024, 1, 3, 10, 30),
+                        ],
+                    }
+                )
+            }
+        )
+        expected = self.generator.bulk_insert(workbook)
+
+        self.assertEqual(expected[2], "INSERT INTO t (a) VALUES (123456789012345);")
+        self.assertEqual(expected[4], "INSERT INTO u (a) VALUES (3);")
+        for chunk_size in (1, 2, 3, 100):
+            self.assertEqual(
+                list(self.generator.iter_insert(workbook, chunk_size=chunk_size)),
+                expected,
+            )
+        chunks = list(FileHandler.iter_excel_chunks(workbook, "insert", chunk_size=3))
+        self.assertEqual(
+            list(pd.concat(chunks)["values"]),
+            list(pd.read_excel(workbook, sheet_name="insert", dtype=str)["values"]),
+        )
+
+    def test_dedupe_modes(self):
+        """测试按表删除完全重复的行：保留第一行或最后一行并报告删除行数，fail模式报错且不生成语句"""
+        workbook = make_workbook(
+            {
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["a", "b", "a", "a", "b"],
+                        "column": ["x", "x", "x", "x", "x"],
+                        "values": ["1", "1", "2", "1", "1"],
+                    }
+                )
+            }
+        )
+
+        statements = self.generator.bulk_insert(workbook, dedupe="first")
+        self.assertEqual(
+            statements,
+            [
+                "INSERT INTO a (x) VALUES (1);",
+                "INSERT INTO b (x) VALUES (1);",
+                "INSERT INTO a (x) VALUES (2);",
+            ],
+        )
+        self.assertEqual(
+            [entry["message"] for entry in statements.diagnostics],
+            ["表 a 删除了 1 行重复数据", "表 b 删除了 1 行重复数据"],
+        )
+        self.assertEqual(
+            self.generator.bulk_insert(workbook, dedupe="last"),
+            [
+                "INSERT INTO a (x) VALUES (2);",
+                "INSERT INTO a (x) VALUES (1);",
+                "INSERT INTO b (x) VALUES (1);",
+            ],
+        )
+
+        failed = self.generator.bulk_insert(workbook, dedupe="fail")
+        self.assertEqual(failed, [])
+        self.assertIn("表 a 有 1 行完全重复的数据，已停止生成", failed.diagnostics.errors)
+        self.assertIn("第 4 行的数据与前面的行完全重复", failed.diagnostics.errors)
+        self.assertEqual(len(self.generator.bulk_insert(workbook)), 5)
+
+    def test_dedupe_streaming_across_chunks(self):
+        """测试流式生成时与之前数据块相同的行也被删除，结果与整表去重一致"""
+        workbook = make_workbook(
+            {
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["a", "a", "a", "a"],
+                        "column": ["x", "x", "x", "x"],
+                        "values": ["1", "2", "1", "2"],
+                    }
+                )
+            }
+        )
+
+        self.assertEqual(
+            list(self.generator.iter_insert(workbook, chunk_size=1, dedupe="first")),
+            self.generator.bulk_insert(workbook, dedupe="first"),
+        )
+        with self.assertRaises(ValueError):
+            list(self.generator.iter_insert(workbook, dedupe="last"))
+
+    def test_sandbox_benchmark(self):
+        """
+        测试SQLite试运行：按create工作表建表（schema前缀附加为数据库），
+        比较INSERT的三种方式并执行UPDATE/UPSERT/DELETE
+        """
+        workbook = make_workbook(
+            {
+                "create": pd.DataFrame(
+                    {
+                        "domain": ["s", "s"],
+                        "table": ["t", "t"],
+                        "column": ["id", "name"],
+                        "data_type": ["integer", "text"],
+                    }
+                ),
+                "insert": pd.DataFrame(
+                    {
+                        "table": ["s.t"] * 3,
+                        "column": ["id,name"] * 3,
+                        "values": ["1,a", "2,b", "3,c"],
+                    }
+                ),
+                "update": pd.DataFrame(
+                    {
+                        "table": ["s.t"],
+                        "column": ["id,name"],
+                        "uniqueid": ["id"],
+                        "values": ["1,x"],
+                    }
+                ),
+                "merge": pd.DataFrame(
+                    {
+                        "target_table": ["s.t"],
+                        "target_column": ["id,name"],
+                        "uniqueid": ["id"],
+                        "values": ["4,d"],
+                    }
+                ),
+                "delete": pd.DataFrame(
+                    {
+                        "table": ["s.t"],
+                        "column": ["id"],
+                        "del_column": ["id"],
+                        "values": ["2"],
+                    }
+                ),
+            }
+        )
+        result = self.generator.sandbox_benchmark(workbook, rows_per_statement=2)
+
+        self.assertEqual(result["diagnostics"].errors, [])
+        self.assertEqual(result["tables"], 1)
+        self.assertEqual(
+            [
+                (run["mode"], run["statements"], run["rows"], run["failed"])
+                for run in result["runs"]
+            ],
+            [
+                ("INSERT 逐行", 3, 3, 0),
+                ("INSERT 多行", 2, 3, 0),
+                ("INSERT 参数化", 1, 3, 0),
+                ("UPDATE 批量", 1, 1, 0),
+                ("MERGE (UPSERT) 多行", 1, 1, 0),
+                ("DELETE 批量", 1, 1, 0),
+            ],
+        )
+        self.assertTrue(all(run["rows_per_second"] > 0 for run in result["runs"]))
+
+    def test_explain_select_plans(self):
+        """测试执行计划分析：index工作表和粘贴的索引生效，标记全表扫描、临时B树和自动索引"""
+        workbook = make_workbook(
+            {
+                "create": pd.DataFrame(
+                    {
+                        "domain": ["s", "s", None, None],
+                        "table": ["users", "users", "orders", "orders"],
+                        "column": ["id", "name", "id", "user_id"],
+                        "data_type": ["integer", "text", "integer", "integer"],
+                    }
+                ),
+                "select": pd.DataFrame({"table": ["s.users"], "column": ["id, name"]}),
+                "index": pd.DataFrame(
+                    {"table": ["s.users"], "column": ["name"], "unique": ["是"]}
+                ),
+            }
+        )
+        result = self.generator.explain_select_plans(workbook)
+        self.assertEqual(result["tables"], 3)
+        self.assertEqual(
+            [[issue["type"] for issue in plan["issues"]] for plan in result["plans"]],
+            [["table_scan"]],
+        )
+
+        queries = (
+            "SELECT id FROM s.users WHERE name = 'a';"
+            "SELECT * FROM orders o JOIN s.users u ON u.id = o.id;"
+            "SELECT * FROM orders ORDER BY id;"
+            "SELECT * FROM orders WHERE user_id = 1;"
+            "DELETE FROM orders;"
+        )
+        result = self.generator.explain_select_plans(
+            workbook, queries, "CREATE INDEX ix_orders ON orders (user_id)"
+        )
+        self.assertEqual(result["diagnostics"].errors, [])
+        issues = [
+            sorted({issue["type"] for issue in plan["issues"]})
+            for plan in result["plans"]
+        ]
+        self.assertEqual(
+            issues,
+            [[], ["automatic_index", "table_scan"], ["table_scan", "temp_btree"], []],
+        )
+        self.assertIn("USING INDEX idx_users_name", result["plans"][0]["plan"][0])
+
+    def test_sql_formatted_buffer(self):
+        """测试格式化脚本逐条写入缓冲区，内容与sql_formatted一致"""
+        statements = self.generator.bulk_insert(
+            self.workbook
+        ) + self.generator.bulk_truncate(self.workbook)
+        buffer = self.generator.sql_formatted_buffer(
+            statements, SQLOutputBuffer(max_memory_bytes=64)
+        )
+
+        self.assertTrue(buffer.spilled)
+        self.assertEqual(
+            buffer.getvalue().decode("utf-8"), self.generator.sql_formatted(statements)
+        )
+        buffer.close()
+
+    def test_cli_generate(self):
+        """测试命令行批量生成：写入文件、统计信息输出到标准错误，且不加载Streamlit和界面模块"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, "input.xlsx")
+            output_path = os.path.join(temp_dir, "out.sql")
+            with open(input_path, "wb") as f:
+                f.write(self.workbook.getvalue())
+
+            # openpyxl读取xlsx时会自行加载PIL，因此只在导入命令行模块后检查PIL
+            code = (
+                "import sys; from sql_generator.cli import main; assert 'PIL' not in sys.modules; "
+                "code = main(sys.argv[1:]); "
+                "assert not any(m.startswith(('streamlit', 'sql_generator.ui')) for m in sys.modules); "
+                "sys.exit(code)"
+            )
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    code,
+                    "generate",
+                    "--sheet",
+                    "insert",
+                    "--mode",
+                    "batched",
+                    input_path,
+                    "-o",
+                    output_path,
+                ],
+                capture_output=True,
+                text=True,
+            )
+            with open(output_path, encoding="utf-8") as f:
+                output = f.read()
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(
+            output.strip(),
+            "INSERT INTO model_a.a (year, month) VALUES (2025, 1), (2025, 2);",
+        )
+        self.assertIn("insert: 读取 2 行，生成 1 条语句", result.stderr)
+
+
+class TestIncrementalGenerator(unittest.TestCase):
+    """增量生成测试类"""
+
+    def setUp(self):
+        self.insert = pd.DataFrame(
+            {
+                "table": ["t", "t", "t", "t"],
+                "column": ["id,name", "id,name", "id", "id,name"],
+                "values": ["1,a", "2,b", "3,c", "4,d"],
+            }
+        )
+
+    def test_regenerates_changed_rows_only(self):
+        """测试重新上传后只重新生成变更和新增的行，全部语句与完整生成一致"""
+        incremental = IncrementalGenerator()
+        first = incremental.generate(make_workbook({"insert": self.insert}), "insert")
+        self.assertEqual(first["changed_rows"], 4)
+        self.assertEqual(first["statements"].diagnostics.errors, ["第 3 行的配置不合法，未生成语句"])
+
+        changed = self.insert.drop(index=0)
+        changed.loc[1, "values"] = "2,x"
+        changed.loc[9] = ["t", "id,name", "9,z"]
+        workbook = make_workbook({"insert": changed})
+        second = incremental.generate(workbook, "insert")
+
+        self.assertEqual(
+            (second["changed_rows"], second["reused_rows"], second["removed_rows"]),
+            (2, 2, 2),
+        )
+        self.assertEqual(
+            second["delta"],
+            [
+                "INSERT INTO t (id, name) VALUES (2, 'x');",
+                "INSERT INTO t (id, name) VALUES (9, 'z');",
+            ],
+        )
+        self.assertEqual(second["statements"], SQLGenerator().bulk_insert(workbook))
+        # 未变更的不合法行仍然报告错误
+        self.assertEqual(second["statements"].diagnostics.errors, ["第 2 行的配置不合法，未生成语句"])
+
+    def test_matches_bulk_after_edit(self):
+        """测试编辑改变列类型或改变合并多行语句的一组行后，全部语句仍与bulk_*方法的结果一致"""
+        update = pd.DataFrame(
+            {
+                "table": ["t"] * 3,
+                "column": ["id, v"] * 3,
+                "uniqueid": ["id"] * 3,
+                "values": ["1, 1", "2, 2", "3, 3"],
+            }
+        )
+        delete = pd.DataFrame(
+            {
+                "table": ["t", "t", "u"],
+                "column": ["id"] * 3,
+                "del_column": ["id"] * 3,
+                "values": ["1", "2", "3"],
+            }
+        )
+        incremental = IncrementalGenerator()
+        incremental.generate_workbook(
+            make_workbook({"insert": self.insert, "update": update, "delete": delete})
+        )
+
+        insert = self.insert.copy()
+        insert.loc[3, "values"] = "A4,d"
+        update.loc[1, "values"] = "2, 2.5"
+        workbook = make_workbook(
+            {"insert": insert, "update": update, "delete": delete.drop(index=1)}
+        )
+        results = incremental.generate_workbook(workbook)
+
+        generator = SQLGenerator()
+        self.assertEqual(
+            results["insert"]["statements"], generator.bulk_insert(workbook)
+        )
+        self.assertEqual(
+            results["insert"]["delta"][0], "INSERT INTO t (id, name) VALUES ('1', 'a');"
+        )
+        self.assertEqual(
+            (results["insert"]["changed_rows"], results["insert"]["reused_rows"]),
+            (3, 1),
+        )
+        self.assertEqual(
+            results["update"]["statements"], generator.bulk_update(workbook)
+        )
+        self.assertEqual(len(results["update"]["statements"]), 1)
+        self.assertEqual(
+            results["delete"]["statements"], generator.bulk_delete(workbook)
+        )
+        self.assertEqual(results["delete"]["delta"], ["DELETE FROM t WHERE id IN (1);"])
+        self.assertEqual(
+            (results["delete"]["changed_rows"], results["delete"]["reused_rows"]),
+            (1, 1),
+        )
+
+    def test_duplicate_rows(self):
+        """测试内容完全相同的行每行生成一次语句，与bulk_*方法的结果一致"""
+        insert = pd.DataFrame(
+            {"table": ["t"] * 3, "column": ["id"] * 3, "values": ["1", "1", "2"]}
+        )
+        merge = pd.DataFrame(
+            {
+                "target_table": ["t"] * 3,
+                "target_column": ["id, v"] * 3,
+                "uniqueid": ["id"] * 3,
+                "values": ["1, a", "1, a", "2, b"],
+            }
+        )
+        workbook = make_workbook({"insert": insert, "merge": merge})
+        generator = SQLGenerator()
+        incremental = IncrementalGenerator()
+        for _ in range(2):
+            results = incremental.generate_workbook(workbook)
+            self.assertEqual(
+                results["insert"]["statements"], generator.bulk_insert(workbook)
+            )
+            self.assertEqual(
+                results["merge"]["statements"], generator.bulk_merge(workbook)
+            )
+        self.assertEqual(len(results["insert"]["statements"]), 3)
+
+    def test_formatted_cache_bounded(self):
+        """测试格式化结果与逐条格式化一致，缓存的格式化语句总大小不超过配置的上限"""
+        incremental = IncrementalGenerator()
+        statements = incremental.generate(
+            make_workbook({"insert": self.insert}), "insert"
+        )["statements"]
+        expected = SQLGenerator().sql_formatted(statements)
+
+        with patch.dict(BULK_CONFIG, {"format_cache_bytes": 60}):
+            for _ in range(2):
+                self.assertEqual(
+                    incremental.formatted(statements).getvalue().decode("utf-8"),
+                    expected,
+                )
+                self.assertEqual(len(incremental._formatted), 1)
+
+    def test_state_round_trip(self):
+        """测试保存状态后恢复，未修改的工作簿不重新生成任何行"""
+        update = pd.DataFrame(
+            {
+                "table": ["t"] * 2,
+                "column": ["id, v"] * 2,
+                "uniqueid": ["id"] * 2,
+                "values": ["1, 1", "2, 2"],
+            }
+        )
+        workbook = make_workbook(
+            {
+                "insert": self.insert,
+                "update": update,
+                "select": pd.DataFrame({"table": ["t1"], "column": ["a"]}),
+            }
+        )
+        incremental = IncrementalGenerator()
+        incremental.generate_workbook(workbook)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "run.state")
+            incremental.save(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(json.load(file)["version"], 1)
+            results = IncrementalGenerator.load(path).generate_workbook(workbook)
+
+        self.assertEqual(list(results), ["select", "insert", "update"])
+        self.assertEqual(
+            [result["changed_rows"] for result in results.values()], [0, 0, 0]
+        )
+        self.assertEqual(results["select"]["statements"], ["SELECT a FROM t1;"])
+        self.assertEqual(results["insert"]["delta"], [])
+        self.assertEqual(
+            results["insert"]["statements"].diagnostics.errors, ["第 3 行的配置不合法，未生成语句"]
+        )
+        self.assertEqual(
+            results["update"]["statements"], SQLGenerator().bulk_update(workbook)
+        )
+
+    def test_state_rejects_invalid_file(self):
+        """测试恢复状态时拒绝pickle文件、其他版本和内容不合法的状态文件"""
+        incremental = IncrementalGenerator()
+        incremental.generate(make_workbook({"insert": self.insert}), "insert")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "run.state")
+            incremental.save(path)
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+            invalid = [
+                pickle.dumps({"states": {}}),
+                b"[]",
+                json.dumps(dict(data, version=2)).encode("utf-8"),
+                json.dumps(
+                    dict(
+                        data,
+                        states={"insert": dict(data["states"]["insert"], hashes=[-1])},
+                    )
+                ).encode("utf-8"),
+                json.dumps(
+                    dict(
+                        data,
+                        states={"insert": dict(data["states"]["insert"], units=[])},
+                    )
+                ).encode("utf-8"),
+            ]
+            for content in invalid:
+                with open(path, "wb") as file:
+                    file.write(content)
+                with self.assertRaises(ValueError):
+                    IncrementalGenerator.load(path)
+
+
+class TestBackgroundJobs(unittest.TestCase):
+    """后台生成任务测试类"""
+
+    def setUp(self):
+        self.csv_file = io.BytesIO(b"table,column,values\n" + b"t,id,1\n" * 5)
+        self.csv_file.name = "insert.csv"
+
+    def test_generate_job_reports_rows(self):
+        """测试后台生成按块更新已处理行数，结果与generate_all格式相同"""
+        job = Job("insert", total=FileHandler.count_rows(self.csv_file, "insert"))
+        results = SQLGenerator().generate_job(
+            job,
+            self.csv_file,
+            ["insert"],
+            {"insert": {"chunk_size": 2, "rows_per_statement": 2}},
+        )
+
+        self.assertEqual(job.total, 5)
+        self.assertEqual((job.rows, job.progress), (5, 1.0))
+        self.assertEqual(len(results["insert"]["statements"]), 3)
+        self.assertIsNone(results["insert"]["error"])
+
+    def test_generate_formatted_job(self):
+        """测试后台任务中格式化全部语句，缓冲区内容与逐条格式化的结果相同"""
+        generator = SQLGenerator()
+        results, buffer = generator.generate_formatted_job(
+            Job("insert"),
+            self.csv_file,
+            ["insert"],
+            {"insert": {"rows_per_statement": 2}},
+        )
+        statements = results["insert"]["statements"]
+
+        self.assertEqual(len(statements), 3)
+        self.assertEqual(
+            buffer.getvalue().decode("utf-8"), generator.sql_formatted(statements)
+        )
+
+    def test_cancelled_job_stops(self):
+        """测试取消请求使任务在处理下一块数据前结束"""
+        job = Job("insert")
+        job.cancel()
+        with self.assertRaises(JobCancelled):
+            SQLGenerator().generate_job(job, self.csv_file, ["insert"])
+
+    def test_manager_reuses_running_job(self):
+        """测试相同任务键返回运行中的任务，取消后状态为cancelled"""
+        manager = JobManager(max_workers=1)
+        started = threading.Event()
+
+        def wait_for_cancel(job):
+            started.set()
+            while True:
+                job.check_cancelled()
+                threading.Event().wait(0.01)
+
+        job = manager.submit("key", wait_for_cancel)
+        started.wait(5)
+        self.assertIs(manager.submit("key", wait_for_cancel), job)
+        self.assertEqual(job.status, Job.RUNNING)
+
+        job.cancel()
+        with self.assertRaises(JobCancelled):
+            job.result()
+        self.assertEqual(job.status, Job.CANCELLED)
+        self.assertIsNot(manager.submit("key", lambda job: 1), job)
+
+
+if __name__ == "__main__":
+    unittest.main()